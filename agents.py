@@ -1,5 +1,5 @@
 # agents.py
-from ollama_client import stream_ollama
+from godbot.core.llm import stream_chat
 import asyncio
 
 class BaseAgent:
@@ -9,10 +9,13 @@ class BaseAgent:
         self.model = model
 
     async def run(self, bot, prompt):
-        full_prompt = f"{self.system_prompt}\n\nUser: {prompt}\nAgent:"
+        messages = [
+            {"role": "system", "content": self.system_prompt},
+            {"role": "user", "content": prompt},
+        ]
         text = ""
         model = self.model or bot.current_model
-        async for chunk in stream_ollama(full_prompt, model):
+        async for chunk in stream_chat(messages, model):
             resp = chunk.get("response", "")
             if resp:
                 text += resp
@@ -39,6 +42,10 @@ class AgentManager:
             })
         return out
 
+    def models(self):
+        """Models explicitly assigned to agents."""
+        return {agent.model for agent in self.agents.values() if agent.model}
+
     def kill(self, name):
         if name in self.agents:
             del self.agents[name]
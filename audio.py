@@ -16,7 +16,10 @@ try:
 except ImportError:
     NUMPY_AVAILABLE = False
 
-from ollama_client import stream_ollama
+from godbot.core.llm import stream_response
+from godbot.core.metrics import histogram
+
+VOICE_STAGE = histogram("godbot_voice_stage_seconds", "Voice pipeline stage timings", labels=("stage",))
 
 try:
     from discord.sinks import Sink
@@ -84,9 +87,10 @@ class VoiceAgent:
             path = f.name
         
         try:
-            text = subprocess.check_output([
-                "whisper", path, "--model", "tiny", "--language", "en", "--fp16", "False", "--output_format", "txt"
-            ]).decode()
+            with VOICE_STAGE.labels("transcribe").time():
+                text = subprocess.check_output([
+                    "whisper", path, "--model", "tiny", "--language", "en", "--fp16", "False", "--output_format", "txt"
+                ]).decode()
             return text.strip()
         except:
             return ""
@@ -97,9 +101,10 @@ class VoiceAgent:
         
         try:
             t = tempfile.NamedTemporaryFile(delete=False, suffix=".wav")
-            subprocess.check_output([
-                "tts", "--text", text, "--out_path", t.name
-            ])
+            with VOICE_STAGE.labels("tts").time():
+                subprocess.check_output([
+                    "tts", "--text", text, "--out_path", t.name
+                ])
             source = discord.FFmpegPCMAudio(t.name)
             self.voice_client.play(source)
         except:
@@ -168,9 +173,10 @@ if SINKS_AVAILABLE:
             prompt = f"{user.name} said: {text}"
             
             reply = ""
-            async for d in stream_ollama(prompt, self.agent.bot.current_model):
-                if "response" in d:
-                    reply += d["response"]
+            with VOICE_STAGE.labels("llm").time():
+                async for d in stream_response(prompt, self.agent.bot.current_model):
+                    if "response" in d:
+                        reply += d["response"]
             
             await self.agent.speak(reply)
 else:
@@ -0,0 +1,2 @@
+# Makes benchmarks a package so pytest can import benchmarks.corpus
+__all__ = []
@@ -0,0 +1,171 @@
+# benchmarks/bench_deterministic.py
+"""
+Micro-benchmarks for the deterministic layer (pytest-benchmark).
+
+    make bench            # compare against this machine's baseline, fail on a slowdown
+    make bench-baseline   # record a new baseline
+
+Baselines live in benchmarks/baselines/ (one directory per machine/Python,
+not committed); the first `make bench` on a machine records one.
+"""
+import asyncio
+
+import pytest
+
+pytest.importorskip("pytest_benchmark")
+
+import deterministic.finance_tools as finance_tools  # noqa: E402
+import deterministic.fitness_tools as fitness_tools  # noqa: E402
+import deterministic.math_tools as math_tools  # noqa: E402
+import deterministic.nutrition_tools as nutrition_tools  # noqa: E402
+import deterministic.wildrift_matchup as wildrift_matchup  # noqa: E402
+import deterministic.wildrift_tools as wildrift_tools  # noqa: E402
+from benchmarks.corpus import CORPUS, HITS, MISSES  # noqa: E402
+from deterministic import registry  # noqa: E402
+from godbot.deterministic import finance_tools as g_finance  # noqa: E402
+from godbot.deterministic import fitness_tools as g_fitness  # noqa: E402
+from godbot.deterministic import nutrition_tools as g_nutrition  # noqa: E402
+from godbot.deterministic import wildrift_tools as g_wildrift  # noqa: E402
+
+HANDLER_MODULES = [math_tools, finance_tools, fitness_tools, nutrition_tools, wildrift_tools]
+
+
+def _run_all(fn, inputs):
+    for item in inputs:
+        fn(item)
+
+
+# -----------------------------
+# REGISTRY DISPATCH
+# -----------------------------
+
+def test_dispatch_corpus(benchmark):
+    """The whole corpus through try_deterministic_tools (what on_message does)."""
+    benchmark(_run_all, registry.try_deterministic_tools, CORPUS)
+
+
+def test_dispatch_corpus_async(benchmark):
+    """The same through try_deterministic_tools_async (typed results, no worker pool)."""
+    async def run():
+        for text in CORPUS:
+            await registry.try_deterministic_tools_async(text)
+
+    loop = asyncio.new_event_loop()
+    try:
+        benchmark(lambda: loop.run_until_complete(run()))
+    finally:
+        loop.close()
+
+
+def test_dispatch_misses(benchmark):
+    """Worst case: no handler matches, so every one of them runs."""
+    benchmark(_run_all, registry.try_deterministic_tools, MISSES)
+
+
+# -----------------------------
+# HANDLER MODULES (deterministic/)
+# -----------------------------
+
+@pytest.mark.parametrize("module", HANDLER_MODULES, ids=lambda m: m.__name__.rsplit(".", 1)[-1])
+def test_module_handlers(benchmark, module):
+    """Every registered handler of one module against the corpus."""
+    handlers = [fn for _, fn in registry._handlers if fn.__module__ == module.__name__]
+    assert handlers, f"no handlers registered by {module.__name__}"
+
+    def run():
+        for text in CORPUS:
+            for fn in handlers:
+                fn(text)
+
+    benchmark(run)
+
+
+@pytest.mark.parametrize("module", sorted(HITS))
+def test_module_hits(benchmark, module):
+    """Messages each module should answer, through the full dispatch."""
+    benchmark(_run_all, registry.try_deterministic_tools, HITS[module])
+
+
+MATH_EXPRS = ["2+2", "12 * (3 + 4)", "2^10 - 24", "(1.5 + 2.25) / 3 - -4", "sqrt(16) + 2pi", "-(3 - 8)(2^3)"]
+
+
+def test_eval_math_expression(benchmark):
+    """Evaluation of already compiled (LRU cached) expressions."""
+    benchmark(_run_all, math_tools.eval_math_expression, MATH_EXPRS)
+
+
+def test_compile_math_expression(benchmark):
+    """Cold path: tokenize, parse and compile without the cache."""
+    benchmark(_run_all, math_tools.compile_expression.__wrapped__, MATH_EXPRS)
+
+
+def test_eval_math_rejects_bombs(benchmark):
+    def run():
+        for expr in ["9^9^9", "10^101", "exp(1000)"]:
+            try:
+                math_tools.eval_math_expression(expr)
+            except math_tools.MathLimitError:
+                pass
+
+    benchmark(run)
+
+
+def test_find_champ(benchmark):
+    # Exact hits, then fuzzy (difflib) matches and misses
+    names = ["garen", "jinx", "Vi", "garren", "jnx", "shyvanna", "leon", "zzzz"]
+    benchmark(_run_all, wildrift_tools.find_champ, names)
+
+
+def test_finance_loops(benchmark):
+    def run():
+        finance_tools.years_to_target(50_000, 1_000, 0.07, 1_000_000)
+        finance_tools.years_to_target(0, 100, 0.02, 10_000_000)  # hits the 120 year cap
+        finance_tools.summarize_fi_scenarios(30, 55, 100_000, 2_000, 40_000, lean_annual_spend=30_000)
+
+    benchmark(run)
+
+
+def test_matchup_report(benchmark):
+    benchmark(wildrift_matchup.full_matchup_report, "Garen", ["Morgana", "Veigar", "Vi", "Draven", "Gnar"])
+
+
+# -----------------------------
+# godbot/deterministic/
+# -----------------------------
+
+def test_godbot_finance(benchmark):
+    def run():
+        g_finance.coast_fi(30, 55, 100_000, 40_000)
+        g_finance.retirement_drawdown(1_500_000, 40, 60_000, 0.05, 0.03)
+        g_finance.millionaire_timeline(50_000, 1_000, 0.07, 0.03)
+        g_finance.fi_age_projection(30, 100_000, 2_000, 0.07, 1_000_000)
+
+    benchmark(run)
+
+
+def test_godbot_fitness(benchmark):
+    def run():
+        g_fitness.strength_percentile("bench", 225, 180)
+        g_fitness.generate_training_block("ppl", "intermediate")
+        g_fitness.recommended_volume("chest", "advanced")
+
+    benchmark(run)
+
+
+def test_godbot_nutrition(benchmark):
+    def run():
+        macros = g_nutrition.calculate_macros(2500, "cut")
+        g_nutrition.grocery_list_from_plan(g_nutrition.meal_plan_7_day(macros))
+
+    benchmark(run)
+
+
+def test_godbot_wildrift(benchmark):
+    team = ["Morgana", "Veigar", "Vi", "Draven", "Gnar"]
+
+    def run():
+        g_wildrift.analyze_team_comp(team)
+        g_wildrift.counterbuild("Garen", team)
+        g_wildrift.matchup_advice("Garen", "Darius")
+
+    benchmark(run)
@@ -0,0 +1,64 @@
+# benchmarks/corpus.py
+"""
+Representative chat messages for the micro-benchmarks.
+
+Most real traffic is small talk and open questions that no deterministic
+handler answers, so every handler is tried against it before the LLM;
+MISSES is weighted accordingly. HITS has a few messages per handler module.
+"""
+
+MISSES = [
+    "hey",
+    "yo what's up",
+    "lol that was a crazy game last night",
+    "can you explain how black holes form?",
+    "what do you think about pineapple on pizza",
+    "any tips for staying focused while studying?",
+    "I had such a long day at work, need to vent",
+    "who would win in a fight, a bear or a gorilla",
+    "recommend me a good sci-fi book",
+    "how do I get better at drawing hands",
+    "tell me a joke about programmers",
+    "what should I name my new cat",
+    "is it worth learning rust in 2024",
+    "my code keeps throwing a null pointer exception, any ideas",
+    "good morning everyone!",
+    "what's the best way to learn a new language quickly",
+]
+
+HITS = {
+    "math_tools": [
+        "calculate 12 * (3 + 4)",
+        "calculate 2^10 - 24",
+        "convert 180 lbs to kg",
+        "20% of 85",
+        "18% tip on 64.50",
+    ],
+    "finance_tools": [
+        "how long until I'm a millionaire with 50k saved and 1000 a month at 7%",
+        "fire number for 40k spending",
+        "coast fi at 30 with 100k retiring at 55 spending 40k",
+        "safe spend 1200000 4",
+        "invest 90000 3000 7 30",
+        "drawdown 1500000 5 4",
+    ],
+    "fitness_tools": [
+        "bench 225 for 5 reps what is my 1rm",
+        "1rm 315 for 3",
+        "warmup for 405 squat",
+    ],
+    "nutrition_tools": [
+        "bmi 180 lbs 5'10",
+        "tdee 30 male 180 lbs 5'10 moderate",
+        "macros 180 2500",
+        "protein 180 lbs",
+        "cutting macros at 180 lbs",
+    ],
+    "wildrift_tools": [
+        "garen build",
+        "wild rift jinx build",
+        "vi vs garen",
+    ],
+}
+
+CORPUS = MISSES * 3 + [msg for msgs in HITS.values() for msg in msgs]
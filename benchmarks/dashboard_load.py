@@ -0,0 +1,71 @@
+#!/usr/bin/env python3
+"""
+Dashboard endpoint load test.
+
+Hammers a running dashboard with concurrent GET requests and reports
+throughput and latency per endpoint:
+
+    python benchmarks/dashboard_load.py --url http://localhost:5000 --concurrency 50 --duration 10
+"""
+import argparse
+import asyncio
+import statistics
+import time
+
+import aiohttp
+
+DEFAULT_PATHS = ["/status", "/agents", "/plugins", "/memory", "/voice/status"]
+
+
+async def _worker(session, url, deadline, latencies, errors):
+    while time.perf_counter() < deadline:
+        start = time.perf_counter()
+        try:
+            async with session.get(url) as resp:
+                await resp.read()
+                if resp.status != 200:
+                    errors.append(resp.status)
+                    continue
+        except aiohttp.ClientError as e:
+            errors.append(type(e).__name__)
+            continue
+        latencies.append(time.perf_counter() - start)
+
+
+async def load(base_url, path, concurrency, duration):
+    latencies, errors = [], []
+    connector = aiohttp.TCPConnector(limit=concurrency)
+    async with aiohttp.ClientSession(connector=connector) as session:
+        deadline = time.perf_counter() + duration
+        await asyncio.gather(*(
+            _worker(session, base_url + path, deadline, latencies, errors) for _ in range(concurrency)
+        ))
+    latencies.sort()
+    return {
+        "path": path,
+        "requests": len(latencies),
+        "errors": len(errors),
+        "rps": len(latencies) / duration,
+        "p50_ms": statistics.median(latencies) * 1000 if latencies else None,
+        "p99_ms": latencies[int(len(latencies) * 0.99) - 1] * 1000 if latencies else None,
+    }
+
+
+def main():
+    parser = argparse.ArgumentParser(description="Dashboard endpoint load test")
+    parser.add_argument("--url", default="http://localhost:5000")
+    parser.add_argument("--concurrency", type=int, default=50)
+    parser.add_argument("--duration", type=float, default=10.0, help="seconds per endpoint")
+    parser.add_argument("paths", nargs="*", default=DEFAULT_PATHS)
+    args = parser.parse_args()
+
+    print(f"{'endpoint':<16}{'req/s':>10}{'p50 ms':>10}{'p99 ms':>10}{'errors':>8}")
+    for path in args.paths:
+        r = asyncio.run(load(args.url.rstrip("/"), path, args.concurrency, args.duration))
+        p50 = f"{r['p50_ms']:.1f}" if r["p50_ms"] is not None else "-"
+        p99 = f"{r['p99_ms']:.1f}" if r["p99_ms"] is not None else "-"
+        print(f"{path:<16}{r['rps']:>10.0f}{p50:>10}{p99:>10}{r['errors']:>8}")
+
+
+if __name__ == "__main__":
+    main()
@@ -5,7 +5,7 @@ Each specialist agent votes.
 The committee merges opinions and produces a final answer.
 """
 import asyncio
-from ollama_client import stream_ollama
+from godbot.core.llm import stream_chat
 
 class CommitteeAgent:
     def __init__(self, bot):
@@ -43,14 +43,19 @@ class CommitteeAgent:
             [f"Agent {i+1} says:\n{res}" for i, res in enumerate(results)]
         )
 
-        final_prompt = (
-            "You are the arbiter agent. Combine these opinions into a single, "
-            "clear, accurate answer. Avoid repetition.\n\n"
-            f"{combined}\n\nFinal answer:"
-        )
+        messages = [
+            {
+                "role": "system",
+                "content": (
+                    "You are the arbiter agent. Combine these opinions into a single, "
+                    "clear, accurate answer. Avoid repetition."
+                ),
+            },
+            {"role": "user", "content": f"Question: {question}\n\n{combined}"},
+        ]
 
         final = ""
-        async for chunk in stream_ollama(final_prompt, self.bot.current_model):
+        async for chunk in stream_chat(messages, self.bot.current_model):
             c = chunk.get("response", "")
             if c:
                 final += c
@@ -1,197 +1,299 @@
 # dashboard.py
+"""
+Web dashboard (aiohttp), served on the bot's own event loop.
+
+Handlers run on the same loop as the Discord client, so they read and
+change bot state directly (no cross-thread access) and can await the
+bot's async APIs. Blocking work (SQLite reads) goes through
+asyncio.to_thread.
+"""
+import asyncio
+import json
 import os
-import threading
-import queue
-from flask import Flask, request, jsonify, send_from_directory
-from flask_cors import CORS
-
-# Try to import waitress for production server, fallback to development if not available
-try:
-    from waitress import serve
-    WAITRESS_AVAILABLE = True
-except ImportError:
-    WAITRESS_AVAILABLE = False
-    print("WARNING: waitress not installed. Using development server. Install with: pip install waitress")
-
-LOG_QUEUE = queue.Queue()
-MODEL_CACHE = []
-
-def start_dashboard(bot, port=5000):
-    app = Flask(__name__, static_folder="dashboard/ui")
-    CORS(app)
+import time
 
-    # Expose bot inside dashboard routes
-    app.bot = bot
-
-    # Get the directory where this file is located
-    BASE_DIR = os.path.dirname(os.path.abspath(__file__))
-    UI_DIR = os.path.join(BASE_DIR, "dashboard", "ui")
-
-    # -----------------------------
-    # INDEX HTML
-    # -----------------------------
-    @app.route("/")
-    def index():
-        return send_from_directory(UI_DIR, "index.html")
-
-    # -----------------------------
-    # STATIC FILES
-    # -----------------------------
-    @app.route("/<path:filename>")
-    def static_files(filename):
-        return send_from_directory(UI_DIR, filename)
-
-    # -----------------------------
-    # MODEL LIST + SWITCH
-    # -----------------------------
-    @app.route("/models", methods=["GET"])
-    def list_models():
-        import requests
-        try:
-            r = requests.get("http://localhost:11434/api/tags")
-            data = r.json().get("models", [])
-            names = [m["name"] for m in data]
-            return jsonify(names)
-        except:
-            return jsonify([])
-
-    @app.route("/set_model", methods=["POST"])
-    def set_model():
-        model = request.json.get("model")
-        app.bot.current_model = model
-        return jsonify({"status": "ok", "new_model": model})
-
-    # -----------------------------
-    # MEMORY VIEWER
-    # -----------------------------
-    @app.route("/memory", methods=["GET"])
-    def view_memory():
-        from main import load_memory
-        mem = load_memory()
-        return jsonify(mem)
-
-    @app.route("/memory", methods=["POST"])
-    def update_memory():
-        from main import save_memory
-        new_mem = request.json
-        save_memory(new_mem)
-        return jsonify({"status": "saved"})
-
-    # -----------------------------
-    # LONG MEMORY (DB)
-    # -----------------------------
-    @app.route("/long_memory", methods=["GET"])
-    def long_memory():
-        user = request.args.get("user")
-        if not user:
-            return jsonify({})
-        rows = app.bot.long_memory.get_recent(user, limit=50)
-        return jsonify(rows)
-
-    # -----------------------------
-    # PLUGIN MANAGER
-    # -----------------------------
-    @app.route("/plugins", methods=["GET"])
-    def plugins_list():
-        out = []
-        for name, plugin in app.bot.plugins.plugins.items():
-            out.append({
-                "name": name,
-                "folder": plugin.folder,
-                "behavior": plugin.behavior_injection or "None",
-                "loaded": True,
-            })
-        return jsonify(out)
-
-    @app.route("/plugins/reload", methods=["POST"])
-    def plugin_reload():
-        name = request.json.get("name")
-        if name in app.bot.plugins.plugins:
-            app.bot.plugins.reload_plugin(app.bot.plugins.plugins[name])
-            return jsonify({"status": "reloaded"})
-        return jsonify({"error": "not found"})
-
-    # -----------------------------
-    # AGENT MANAGER
-    # -----------------------------
-    @app.route("/agents", methods=["GET"])
-    def list_agents():
-        agent_list = app.bot.agent_manager.list()
-        # Format as objects with name and model
-        out = []
-        for name in agent_list:
-            agent = app.bot.agent_manager.agents.get(name)
-            if agent:
-                out.append({
-                    "name": agent.name,
-                    "model": agent.model
-                })
-        return jsonify(out)
-
-    @app.route("/agents/create", methods=["POST"])
-    def create_agent():
-        data = request.json
-        app.bot.agent_manager.create(data["name"], data["model"])
-        return jsonify({"status": "spawned"})
-
-    @app.route("/agents/kill", methods=["POST"])
-    def kill_agent():
-        data = request.json
-        app.bot.agent_manager.kill(data["name"])
-        return jsonify({"status": "killed"})
-
-    # -----------------------------
-    # VOICE CONTROLS
-    # -----------------------------
-    @app.route("/voice/enable", methods=["POST"])
-    def voice_enable():
-        app.bot.voice_agent.enabled = True
-        return jsonify({"status": "voice_on"})
-
-    @app.route("/voice/disable", methods=["POST"])
-    def voice_disable():
-        app.bot.voice_agent.enabled = False
-        return jsonify({"status": "voice_off"})
-
-    @app.route("/voice/status", methods=["GET"])
-    def voice_status():
-        return jsonify({
-            "enabled": app.bot.voice_agent.enabled,
-            "listening": getattr(app.bot.voice_agent, "listening", False)
-        })
+from aiohttp import web
+
+from godbot.core.logging import EVENTS
+from godbot.core.metrics import REGISTRY
+
+SSE_STATS_INTERVAL = 2.0  # seconds between "stats" events on /events
+SSE_REPLAY = 100  # recent events sent to a new /events subscriber
+SSE_MAX_PENDING = 256  # per-subscriber buffer; older events are dropped beyond this
+
+BASE_DIR = os.path.dirname(os.path.abspath(__file__))
+UI_DIR = os.path.join(BASE_DIR, "dashboard", "ui")
+
+BOT_KEY = web.AppKey("bot", object)
+
+routes = web.RouteTableDef()
+
+
+def sse_format(event):
+    return f"id: {event['id']}\nevent: {event['type']}\ndata: {json.dumps(event['data'], default=str)}\n\n"
+
+
+def queue_stats(bot):
+    """Queue depths shown live on the dashboard."""
+    from godbot.core.llm import queue_depth
+
+    stats = {"llm": queue_depth()}
+    scheduler = getattr(bot, "scheduler", None)
+    if scheduler is not None:
+        stats["scheduler_running"] = sum(t.running for t in scheduler.tasks.values())
+    reminders = getattr(bot, "reminders", None)
+    if reminders is not None:
+        stats["reminders_pending"] = len(reminders)
+    return stats
+
+
+@web.middleware
+async def cors_middleware(request, handler):
+    if request.method == "OPTIONS":
+        resp = web.Response()
+    else:
+        resp = await handler(request)
+    resp.headers["Access-Control-Allow-Origin"] = "*"
+    resp.headers["Access-Control-Allow-Headers"] = "Content-Type"
+    resp.headers["Access-Control-Allow-Methods"] = "GET, POST, OPTIONS"
+    return resp
+
+
+# -----------------------------
+# INDEX HTML
+# -----------------------------
+@routes.get("/")
+async def index(request):
+    return web.FileResponse(os.path.join(UI_DIR, "index.html"))
+
+
+# -----------------------------
+# MODEL LIST + SWITCH
+# -----------------------------
+@routes.get("/models")
+async def list_models(request):
+    # ?detail=1 adds size / quantization / family; ?refresh=1 re-reads /api/tags
+    catalog = request.app[BOT_KEY].model_catalog
+    if request.query.get("refresh") == "1" or not len(catalog):
+        await catalog.refresh()
+    if request.query.get("detail") == "1":
+        return web.json_response([catalog.get(n).to_dict() for n in catalog.names()])
+    return web.json_response(catalog.names())
+
+
+@routes.post("/set_model")
+async def set_model(request):
+    bot = request.app[BOT_KEY]
+    model = (await request.json()).get("model")
+    bot.current_model = model
+    bot.llm_context.invalidate(model)
+    bot.model_lifecycle.switch(model)
+    return web.json_response({"status": "ok", "new_model": model})
+
+
+@routes.get("/models/lifecycle")
+async def model_lifecycle(request):
+    # keep_alive policy, pinning and recent load/unload events
+    return web.json_response(request.app[BOT_KEY].model_lifecycle.status())
+
+
+@routes.get("/backends")
+async def backends(request):
+    # Ollama hosts: health, outstanding requests, installed / loaded models
+    from godbot.core.llm import get_router
+
+    return web.json_response(get_router().status())
+
+
+# -----------------------------
+# MEMORY VIEWER
+# -----------------------------
+@routes.get("/memory")
+async def view_memory(request):
+    return web.json_response(request.app[BOT_KEY].user_facts.data)
+
+
+@routes.post("/memory")
+async def update_memory(request):
+    request.app[BOT_KEY].user_facts.replace(await request.json())
+    return web.json_response({"status": "saved"})
 
-    # -----------------------------
-    # LIVE LOG STREAM
-    # -----------------------------
-    @app.route("/logs", methods=["GET"])
-    def stream_logs():
-        try:
-            logs = []
-            while not LOG_QUEUE.empty():
-                logs.append(LOG_QUEUE.get())
-            return jsonify(logs)
-        except:
-            return jsonify([])
-
-    # -----------------------------
-    # STATUS
-    # -----------------------------
-    @app.route("/status", methods=["GET"])
-    def status():
-        return jsonify({
-            "status": "ok",
-            "model": app.bot.current_model,
-            "voice_enabled": app.bot.voice_agent.enabled
+
+# -----------------------------
+# LONG MEMORY (DB)
+# -----------------------------
+@routes.get("/long_memory")
+async def long_memory(request):
+    user = request.query.get("user")
+    if not user:
+        return web.json_response({})
+    rows = await asyncio.to_thread(request.app[BOT_KEY].long_memory.get_recent, user, 50)
+    return web.json_response(rows)
+
+
+# -----------------------------
+# PLUGIN MANAGER
+# -----------------------------
+@routes.get("/plugins")
+async def plugins_list(request):
+    out = []
+    for name, plugin in request.app[BOT_KEY].plugins.plugins.items():
+        out.append({
+            "name": name,
+            "folder": plugin.folder,
+            "behavior": plugin.behavior_injection or "None",
+            "loaded": True,
         })
+    return web.json_response(out)
+
+
+@routes.post("/plugins/reload")
+async def plugin_reload(request):
+    plugins = request.app[BOT_KEY].plugins
+    name = (await request.json()).get("name")
+    if name in plugins.plugins:
+        plugins.reload_plugin(plugins.plugins[name])
+        return web.json_response({"status": "reloaded"})
+    return web.json_response({"error": "not found"})
+
+
+# -----------------------------
+# AGENT MANAGER
+# -----------------------------
+@routes.get("/agents")
+async def list_agents(request):
+    # [{"name": ..., "model": ...}]
+    return web.json_response(request.app[BOT_KEY].agent_manager.list())
+
+
+@routes.post("/agents/create")
+async def create_agent(request):
+    data = await request.json()
+    request.app[BOT_KEY].agent_manager.create(data["name"], data["model"])
+    return web.json_response({"status": "spawned"})
+
+
+@routes.post("/agents/kill")
+async def kill_agent(request):
+    data = await request.json()
+    request.app[BOT_KEY].agent_manager.kill(data["name"])
+    return web.json_response({"status": "killed"})
+
+
+# -----------------------------
+# VOICE CONTROLS
+# -----------------------------
+@routes.post("/voice/enable")
+async def voice_enable(request):
+    request.app[BOT_KEY].voice_agent.enabled = True
+    return web.json_response({"status": "voice_on"})
+
+
+@routes.post("/voice/disable")
+async def voice_disable(request):
+    request.app[BOT_KEY].voice_agent.enabled = False
+    return web.json_response({"status": "voice_off"})
 
-    # Background Flask thread
-    def run():
-        if WAITRESS_AVAILABLE:
-            serve(app, host="0.0.0.0", port=port, threads=4, channel_timeout=120)
-        else:
-            app.run(host="0.0.0.0", port=port, debug=False, threaded=True)
 
-    thread = threading.Thread(target=run, daemon=True)
-    thread.start()
-    print(f"Dashboard running on http://localhost:{port} ({'Production server (waitress)' if WAITRESS_AVAILABLE else 'Development server'})")
+@routes.get("/voice/status")
+async def voice_status(request):
+    voice_agent = request.app[BOT_KEY].voice_agent
+    return web.json_response({
+        "enabled": voice_agent.enabled,
+        "listening": getattr(voice_agent, "listening", False)
+    })
+
+
+# -----------------------------
+# LIVE LOG STREAM
+# -----------------------------
+@routes.get("/logs")
+async def recent_logs(request):
+    # Recent lines from the ring buffer (for clients without EventSource)
+    since = int(request.query.get("since", 0))
+    return web.json_response([e["data"]["line"] for e in EVENTS.recent("log") if e["id"] > since])
+
+
+@routes.get("/events")
+async def events(request):
+    """Server-sent events: "log", "latency" and periodic "stats" events."""
+    resp = web.StreamResponse(headers={
+        "Content-Type": "text/event-stream",
+        "Cache-Control": "no-cache",
+        "X-Accel-Buffering": "no",
+    })
+    await resp.prepare(request)
+
+    sub = EVENTS.subscribe(replay=SSE_REPLAY, maxlen=SSE_MAX_PENDING, loop=asyncio.get_running_loop())
+    try:
+        await resp.write(b"retry: 3000\n\n")
+        last_stats = 0.0
+        while True:
+            # write() waits for the socket to drain; meanwhile events pile up
+            # in the subscriber's bounded buffer, not here
+            for event in await sub.wait(timeout=SSE_STATS_INTERVAL):
+                await resp.write(sse_format(event).encode("utf-8"))
+            if time.monotonic() - last_stats >= SSE_STATS_INTERVAL:
+                last_stats = time.monotonic()
+                stats = queue_stats(request.app[BOT_KEY])
+                stats["dropped"] = sub.dropped
+                await resp.write(f"event: stats\ndata: {json.dumps(stats)}\n\n".encode("utf-8"))
+    except ConnectionResetError:
+        pass  # browser went away
+    finally:
+        EVENTS.unsubscribe(sub)
+    return resp
+
+
+# -----------------------------
+# METRICS (Prometheus)
+# -----------------------------
+@routes.get("/metrics")
+async def metrics(request):
+    return web.Response(
+        body=REGISTRY.render().encode("utf-8"),
+        headers={"Content-Type": "text/plain; version=0.0.4; charset=utf-8"},
+    )
+
+
+# -----------------------------
+# STATUS
+# -----------------------------
+@routes.get("/status")
+async def status(request):
+    from godbot.core.llm import get_router
+
+    bot = request.app[BOT_KEY]
+    router = get_router()
+    return web.json_response({
+        "status": "ok" if router.available() else "degraded",
+        "model": bot.current_model,
+        "voice_enabled": bot.voice_agent.enabled,
+        # Circuit breaker state of the LLM backends (see godbot.core.router)
+        "llm": {
+            "circuit": router.circuit_state(),
+            "available": router.available(),
+            "retry_in": round(router.retry_in(), 1),
+            "backends": {b.url: b.breaker.status() for b in router.backends},
+        },
+    })
+
+
+def create_dashboard_app(bot) -> web.Application:
+    app = web.Application(middlewares=[cors_middleware])
+    # Expose bot inside dashboard routes
+    app[BOT_KEY] = bot
+    app.add_routes(routes)
+    # Static files last so they never shadow an API route
+    app.router.add_static("/", UI_DIR)
     return app
+
+
+async def start_dashboard(bot, port=5000):
+    """Serve the dashboard on the running (bot) event loop."""
+    runner = web.AppRunner(create_dashboard_app(bot), access_log=None)
+    await runner.setup()
+    site = web.TCPSite(runner, host="0.0.0.0", port=port)
+    await site.start()
+    print(f"Dashboard running on http://localhost:{port}")
+    return runner
@@ -16,38 +16,79 @@ function showPage(page) {
 showPage("logs");
 
 /* -----------------------------------
-   LIVE LOGS 
+   LIVE LOGS (server-sent events)
 ------------------------------------ */
-setInterval(() => {
-    fetch("/logs")
-        .then(r => r.json())
-        .then(data => {
-            if (data.length > 0) {
-                let out = document.getElementById("log-output");
-                data.forEach(l => {
-                    out.textContent += l + "\n";
-                });
-                out.scrollTop = out.scrollHeight;
-            }
-        })
-        .catch(err => {
-            // Silently fail if logs endpoint not available
-        });
-}, 1000);
+const MAX_LOG_LINES = 2000;
+let logLines = [];
+
+function appendLog(line) {
+    logLines.push(line);
+    if (logLines.length > MAX_LOG_LINES) {
+        logLines = logLines.slice(-MAX_LOG_LINES);
+    }
+    let out = document.getElementById("log-output");
+    out.textContent = logLines.join("\n");
+    out.scrollTop = out.scrollHeight;
+}
+
+const events = new EventSource("/events");
+
+events.addEventListener("log", e => {
+    appendLog(JSON.parse(e.data).line);
+});
+
+events.addEventListener("latency", e => {
+    const t = JSON.parse(e.data);
+    const ttft = t.ttft_ms === null ? "n/a" : Math.round(t.ttft_ms) + "ms";
+    document.getElementById("stat-latency").textContent =
+        `${t.model}: ttft ${ttft}, total ${Math.round(t.total_ms)}ms`;
+});
+
+events.addEventListener("stats", e => {
+    const s = JSON.parse(e.data);
+    document.getElementById("stat-queue").textContent =
+        `generations ${s.llm.generations}, waiting ${s.llm.waiting}` +
+        (s.scheduler_running !== undefined ? `, tasks running ${s.scheduler_running}` : "") +
+        (s.reminders_pending !== undefined ? `, reminders ${s.reminders_pending}` : "") +
+        (s.dropped ? `, dropped ${s.dropped}` : "");
+});
+
+/* -----------------------------------
+   MODEL LOAD EVENTS
+------------------------------------ */
+function showModelEvent(ev) {
+    let list = document.getElementById("model-events");
+    let li = document.createElement("li");
+    const when = new Date(ev.ts * 1000).toLocaleTimeString();
+    const took = ev.seconds !== null && ev.seconds !== undefined ? ` in ${ev.seconds.toFixed(1)}s` : "";
+    const why = ev.reason ? ` (${ev.reason})` : "";
+    li.textContent = `${when} ${ev.model} ${ev.action}${took}${why}`;
+    list.prepend(li);
+    while (list.children.length > 50) {
+        list.removeChild(list.lastChild);
+    }
+    if (ev.action === "loaded") {
+        document.getElementById("model-status").textContent = `${ev.model} ready${took}`;
+    }
+}
+
+// Recent events are replayed when the stream connects
+events.addEventListener("model", e => showModelEvent(JSON.parse(e.data)));
 
 /* -----------------------------------
    MODEL LIST + SWITCH
 ------------------------------------ */
 function loadModels() {
-    fetch("/models")
+    fetch("/models?detail=1")
         .then(r => r.json())
         .then(models => {
             let sel = document.getElementById("model-list");
             sel.innerHTML = "";
             models.forEach(m => {
                 let opt = document.createElement("option");
-                opt.textContent = m;
-                opt.value = m;
+                const info = [m.parameter_size, m.quantization, m.family].filter(x => x).join(" ");
+                opt.textContent = `${m.name} (${info ? info + ", " : ""}${m.size_gb} GB)`;
+                opt.value = m.name;
                 sel.appendChild(opt);
             });
         })
@@ -70,7 +111,7 @@ function changeModel() {
     .then(res => res.json())
     .then(data => {
         document.getElementById("model-status").textContent = 
-            "Model changed to " + data.new_model;
+            "Model changed to " + data.new_model + " (warming up...)";
     })
     .catch(err => {
         document.getElementById("model-status").textContent = "Error: " + err;
@@ -1,3 +1,8 @@
 # deterministic/__init__.py
-from .registry import try_deterministic_tools  # convenience re-export
+from .registry import try_deterministic_tools, try_deterministic_tools_async  # convenience re-export
+from .results import EmbedResult, FileResult, HandlerResult, LLMContextResult, TextResult
 
+__all__ = [
+    "try_deterministic_tools", "try_deterministic_tools_async",
+    "EmbedResult", "FileResult", "HandlerResult", "LLMContextResult", "TextResult",
+]
@@ -165,7 +165,7 @@ def handle_millionaire_timeline(text: str) -> Optional[str]:
     if "millionaire" not in lower and "million" not in lower:
         return None
 
-    nums = re.findall(r"\d+(\.\d+)?", text)
+    nums = re.findall(r"\d+(?:\.\d+)?", text)
     if len(nums) < 2:
         return (
             "For a millionaire timeline, use:\n"
@@ -205,7 +205,7 @@ def handle_millionaire_timeline(text: str) -> Optional[str]:
         f"End balance then ≈ **${balance:,.0f}**."
     )
 
-@register_handler(priority=25)
+@register_handler(priority=25, cpu_bound=True, trigger=("stock", "portfolio", "invest", "etf", "index fund"))
 def handle_investment_projection(text: str) -> Optional[str]:
     """
     'invest 90000 3000 7 30'
@@ -216,7 +216,7 @@ def handle_investment_projection(text: str) -> Optional[str]:
     if not any(k in lower for k in ["stock", "portfolio", "invest", "investment", "etf", "index fund", "index etf"]):
         return None
 
-    nums = re.findall(r"\d+(\.\d+)?", text)
+    nums = re.findall(r"\d+(?:\.\d+)?", text)
     if len(nums) < 3:
         return (
             "For an investment projection, use:\n"
@@ -259,7 +259,7 @@ def handle_fire_number(text: str) -> Optional[str]:
     if "fire" not in lower and "lean fi" not in lower and "leanfi" not in lower:
         return None
 
-    nums = re.findall(r"\d+(\.\d+)?", text)
+    nums = re.findall(r"\d+(?:\.\d+)?", text)
     if not nums:
         return (
             "For FIRE number, use:\n"
@@ -302,7 +302,7 @@ def handle_coast_fi(text: str) -> Optional[str]:
     ):
         return None
 
-    nums = re.findall(r"\d+(\.\d+)?", text)
+    nums = re.findall(r"\d+(?:\.\d+)?", text)
     if len(nums) < 3:
         return (
             "For Coast FI, use:\n"
@@ -348,7 +348,7 @@ def handle_coast_fi_age(text: str) -> Optional[str]:
     if "coast_fi" not in lower and "coast fi" not in lower:
         return None
 
-    nums = re.findall(r"\d+(\.\d+)?", text)
+    nums = re.findall(r"\d+(?:\.\d+)?", text)
     if len(nums) < 4:
         return "Usage: coast_fi <savings> <annual%> <retire_age> <target_FI>"
 
@@ -389,7 +389,7 @@ def handle_lean_fi(text: str) -> Optional[str]:
     if "lean_fi" not in lower and "lean fi" not in lower:
         return None
 
-    nums = re.findall(r"\d+(\.\d+)?", text)
+    nums = re.findall(r"\d+(?:\.\d+)?", text)
     if not nums:
         return "Usage: lean_fi <monthly_expenses>"
 
@@ -416,7 +416,7 @@ def handle_safe_spend(text: str) -> Optional[str]:
     if "safe_spend" not in lower and "safe spend" not in lower:
         return None
 
-    nums = re.findall(r"\d+(\.\d+)?", text)
+    nums = re.findall(r"\d+(?:\.\d+)?", text)
     if len(nums) < 2:
         return "Usage: safe_spend <savings> <years>"
 
@@ -445,7 +445,7 @@ def handle_inflation_million(text: str) -> Optional[str]:
     if "infl_million" not in lower:
         return None
 
-    nums = re.findall(r"\d+(\.\d+)?", text)
+    nums = re.findall(r"\d+(?:\.\d+)?", text)
     if len(nums) < 5:
         return "Usage: infl_million <start> <monthly> <annual%> <infl%> <target>"
 
@@ -481,7 +481,7 @@ def handle_inflation_million(text: str) -> Optional[str]:
 # ---------------------------
 # 5. Net worth projection to specific age
 # ---------------------------
-@register_handler(priority=32)
+@register_handler(priority=32, cpu_bound=True, trigger=("networth_age", "net worth age"))
 def handle_networth_age(text: str) -> Optional[str]:
     """
     networth_age start monthly annual% current_age future_age
@@ -490,7 +490,7 @@ def handle_networth_age(text: str) -> Optional[str]:
     if "networth_age" not in lower and "net worth age" not in lower:
         return None
 
-    nums = re.findall(r"\d+(\.\d+)?", text)
+    nums = re.findall(r"\d+(?:\.\d+)?", text)
     if len(nums) < 5:
         return "Usage: networth_age <start> <monthly> <annual%> <current_age> <future_age>"
 
@@ -518,7 +518,7 @@ def handle_drawdown(text: str) -> Optional[str]:
     if "drawdown" not in lower:
         return None
 
-    nums = re.findall(r"\d+(\.\d+)?", text)
+    nums = re.findall(r"\d+(?:\.\d+)?", text)
     if len(nums) < 3:
         return "Usage: drawdown <savings> <annual%> <withdrawal%>"
 
@@ -45,7 +45,7 @@ def handle_bench_1rm(text: str) -> Optional[str]:
             f"**{one_rm:.1f} {units}** from {weight:.0f} {units} × {reps} reps."
         )
 
-    nums = re.findall(r"\d+(\.\d+)?", lower)
+    nums = re.findall(r"\d+(?:\.\d+)?", lower)
     if len(nums) >= 2 and "for" in lower and "reps" in lower:
         target_1rm = float(nums[0])
         reps = int(float(nums[1]))
@@ -75,7 +75,7 @@ def handle_1rm(text: str) -> Optional[str]:
     if not lower.startswith("1rm"):
         return None
 
-    nums = re.findall(r"\d+(\.\d+)?", text)
+    nums = re.findall(r"\d+(?:\.\d+)?", text)
     if len(nums) < 2:
         return "Usage: 1rm <weight> x <reps>"
 
@@ -94,7 +94,7 @@ def handle_reverse_1rm(text: str) -> Optional[str]:
     if "reverse_1rm" not in lower:
         return None
 
-    nums = re.findall(r"\d+(\.\d+)?", text)
+    nums = re.findall(r"\d+(?:\.\d+)?", text)
     if len(nums) < 2:
         return "Usage: reverse_1rm <1rm> <reps>"
 
@@ -164,7 +164,7 @@ def handle_warmup(text: str) -> Optional[str]:
     if "warmup" not in lower:
         return None
 
-    nums = re.findall(r"\d+(\.\d+)?", text)
+    nums = re.findall(r"\d+(?:\.\d+)?", text)
     if not nums:
         return "Usage: warmup <working_set_weight>"
 
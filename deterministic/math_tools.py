@@ -1,61 +1,304 @@
 # deterministic/math_tools.py
 import re
 import ast
+import math
+import time
 import operator as op
-from typing import Optional
+from functools import lru_cache
+from typing import Callable, Dict, FrozenSet, List, Optional, Tuple
 from .registry import register_handler
 
 # ---------- safe math eval ----------
+#
+# Expressions are tokenized (adding implicit multiplication, "^" -> "**"),
+# parsed with ast, checked against a whitelist and compiled into a tree of
+# closures; compiled expressions are LRU cached. Everything that could blow
+# up (huge literals, 9^9^9, exp(1e6)) is refused before it is computed, so
+# evaluation is cheap enough to run on the event loop.
 
-_ALLOWED_OPS = {
+MAX_EXPR_LEN = 256
+MAX_NODES = 128
+MAX_MAGNITUDE = 1e100      # |operand| and |result| of every operation
+MAX_EXPONENT = 1000        # |y| in x ** y
+MAX_OPS = 1000             # operations per evaluation
+MAX_SECONDS = 0.05         # wall-clock guard per evaluation
+
+
+class MathError(ValueError):
+    pass
+
+
+class MathLimitError(MathError):
+    """The expression is valid but too big or too slow to evaluate."""
+
+
+_BIN_OPS = {
     ast.Add: op.add,
     ast.Sub: op.sub,
     ast.Mult: op.mul,
     ast.Div: op.truediv,
-    ast.Pow: op.pow,
+}
+
+_UNARY_OPS = {
     ast.USub: op.neg,
     ast.UAdd: op.pos,
 }
 
-def _eval_ast(node):
-    if isinstance(node, ast.Num):  # Py <=3.7
-        return node.n
-    if isinstance(node, ast.Constant):  # Py 3.8+
-        if isinstance(node.value, (int, float)):
-            return node.value
-        raise ValueError("Only int/float constants allowed")
-    if isinstance(node, ast.BinOp) and type(node.op) in _ALLOWED_OPS:
-        return _ALLOWED_OPS[type(node.op)](_eval_ast(node.left), _eval_ast(node.right))
-    if isinstance(node, ast.UnaryOp) and type(node.op) in _ALLOWED_OPS:
-        return _ALLOWED_OPS[type(node.op)](_eval_ast(node.operand))
-    raise ValueError("Unsupported expression")
-
-def eval_math_expression(expr: str) -> float:
-    parsed = ast.parse(expr, mode="eval")
-    return _eval_ast(parsed.body)
+def _safe_round(x, ndigits=None):
+    # round(x, -10**9) would build 10**(10**9) before giving up
+    if ndigits is None:
+        return round(x)
+    if abs(ndigits) > 15:
+        raise MathLimitError("too many digits to round to")
+    if ndigits != int(ndigits):
+        raise MathError("round() needs a whole number of digits")
+    return round(x, int(ndigits))
+
+
+FUNCTIONS: Dict[str, Callable] = {
+    "sqrt": math.sqrt,
+    "cbrt": lambda x: math.copysign(abs(x) ** (1 / 3), x),
+    "exp": math.exp,
+    "ln": math.log,
+    "log": math.log,  # log(x) is natural, log(x, base)
+    "log10": math.log10,
+    "log2": math.log2,
+    "sin": math.sin,
+    "cos": math.cos,
+    "tan": math.tan,
+    "asin": math.asin,
+    "acos": math.acos,
+    "atan": math.atan,
+    "sinh": math.sinh,
+    "cosh": math.cosh,
+    "tanh": math.tanh,
+    "radians": math.radians,
+    "degrees": math.degrees,
+    "abs": abs,
+    "round": _safe_round,
+    "floor": math.floor,
+    "ceil": math.ceil,
+    "min": min,
+    "max": max,
+}
+
+CONSTANTS = {"pi": math.pi, "e": math.e, "tau": math.tau}
+
+_TOKEN_RE = re.compile(
+    r"\s*(?:(?P<num>(?:\d+\.?\d*|\.\d+)(?:[eE][-+]?\d+)?)|(?P<name>[A-Za-z_]\w*)|(?P<op>\*\*|[-+*/^(),×÷]))"
+)
+_OP_ALIASES = {"^": "**", "×": "*", "÷": "/"}
+
+
+def _tokenize(expr: str) -> List[str]:
+    """Split into tokens, inserting "*" for implicit multiplication (2x, 3(4), (1+2)(3), 2pi)."""
+    tokens: List[str] = []
+    kinds: List[str] = []
+    pos = 0
+    expr = expr.rstrip()
+    while pos < len(expr):
+        m = _TOKEN_RE.match(expr, pos)
+        if not m:
+            raise MathError(f"unexpected character {expr[pos]!r}")
+        pos = m.end()
+        kind = m.lastgroup
+        tok = _OP_ALIASES.get(m.group(kind), m.group(kind))
+        if kinds:
+            prev_kind, prev = kinds[-1], tokens[-1]
+            ends_value = prev_kind in ("num", "name") or prev == ")"
+            starts_value = kind in ("num", "name") or tok == "("
+            is_call = prev_kind == "name" and prev in FUNCTIONS and tok == "("
+            if ends_value and starts_value and not is_call:
+                tokens.append("*")
+                kinds.append("op")
+        tokens.append(tok)
+        kinds.append(kind)
+    return tokens
+
+
+def _check(value):
+    if isinstance(value, complex):
+        raise MathError("result is not a real number")
+    if abs(value) > MAX_MAGNITUDE:
+        raise MathLimitError("number too large")
+    return value
+
+
+def _safe_pow(base, exp):
+    if abs(exp) > MAX_EXPONENT:
+        raise MathLimitError("exponent too large")
+    # Estimate the size of the result before computing it
+    if abs(base) > 1 and exp > 0 and exp * math.log10(abs(base)) > math.log10(MAX_MAGNITUDE):
+        raise MathLimitError("number too large")
+    return op.pow(base, exp)
+
+
+class _Budget:
+    __slots__ = ("ops", "max_ops", "deadline")
+
+    def __init__(self, max_ops: int, timeout: float):
+        self.ops = 0
+        self.max_ops = max_ops
+        self.deadline = time.perf_counter() + timeout
+
+    def tick(self) -> None:
+        self.ops += 1
+        if self.ops > self.max_ops:
+            raise MathLimitError("too many operations")
+        if time.perf_counter() > self.deadline:
+            raise MathLimitError("took too long")
+
+
+Evaluator = Callable[[Dict[str, float], _Budget], float]
+
+
+def _compile(node, names: set) -> Evaluator:
+    if isinstance(node, ast.Constant):
+        value = node.value
+        if isinstance(value, bool) or not isinstance(value, (int, float)):
+            raise MathError("only numbers are allowed")
+        _check(value)
+        return lambda env, budget: value
+
+    if isinstance(node, ast.Name):
+        name = node.id
+        if name in FUNCTIONS:
+            raise MathError(f"{name} is a function")
+        if name in CONSTANTS:
+            value = CONSTANTS[name]
+            return lambda env, budget: value
+        names.add(name)
+
+        def load(env, budget):
+            try:
+                return env[name]
+            except KeyError:
+                raise MathError(f"unknown name {name!r}") from None
+        return load
+
+    if isinstance(node, ast.BinOp) and (type(node.op) in _BIN_OPS or isinstance(node.op, ast.Pow)):
+        fn = _safe_pow if isinstance(node.op, ast.Pow) else _BIN_OPS[type(node.op)]
+        left, right = _compile(node.left, names), _compile(node.right, names)
+
+        def binop(env, budget):
+            budget.tick()
+            return _check(fn(left(env, budget), right(env, budget)))
+        return binop
+
+    if isinstance(node, ast.UnaryOp) and type(node.op) in _UNARY_OPS:
+        fn = _UNARY_OPS[type(node.op)]
+        operand = _compile(node.operand, names)
+
+        def unary(env, budget):
+            budget.tick()
+            return fn(operand(env, budget))
+        return unary
+
+    if (isinstance(node, ast.Call) and isinstance(node.func, ast.Name)
+            and node.func.id in FUNCTIONS and not node.keywords):
+        fn = FUNCTIONS[node.func.id]
+        args = [_compile(a, names) for a in node.args]
+
+        def call(env, budget):
+            budget.tick()
+            return _check(fn(*(a(env, budget) for a in args)))
+        return call
+
+    raise MathError("unsupported expression")
+
+
+class CompiledExpression:
+    """A parsed, validated expression; evaluate() with different variables."""
+
+    def __init__(self, source: str, fn: Evaluator, names: FrozenSet[str]):
+        self.source = source
+        self.names = names
+        self._fn = fn
+
+    def evaluate(self, variables: Optional[Dict[str, float]] = None,
+                 max_ops: int = MAX_OPS, timeout: float = MAX_SECONDS) -> float:
+        env = {}
+        for name, value in (variables or {}).items():
+            if isinstance(value, bool) or not isinstance(value, (int, float)):
+                raise MathError(f"{name} must be a number")
+            env[name] = _check(value)
+        try:
+            return self._fn(env, _Budget(max_ops, timeout))
+        except MathError:
+            raise
+        except OverflowError as e:
+            raise MathLimitError("number too large") from e
+        except (ArithmeticError, ValueError, TypeError) as e:
+            raise MathError(str(e)) from e
+
+
+@lru_cache(maxsize=512)
+def compile_expression(expr: str) -> CompiledExpression:
+    """Tokenize, parse and validate expr (cached; raises MathError)."""
+    if len(expr) > MAX_EXPR_LEN:
+        raise MathLimitError("expression too long")
+    source = " ".join(_tokenize(expr))
+    if not source:
+        raise MathError("empty expression")
+    try:
+        tree = ast.parse(source, mode="eval")
+    except (SyntaxError, RecursionError, MemoryError) as e:
+        raise MathError("invalid expression") from e
+    if sum(1 for _ in ast.walk(tree)) > MAX_NODES:
+        raise MathLimitError("expression too long")
+    names: set = set()
+    return CompiledExpression(source, _compile(tree.body, names), frozenset(names))
+
+
+def eval_math_expression(expr: str, variables: Optional[Dict[str, float]] = None) -> float:
+    """Evaluate expr safely, e.g. eval_math_expression("2x^2 + sqrt(y)", {"x": 3, "y": 16})."""
+    return compile_expression(expr).evaluate(variables)
+
+
+def format_number(value) -> str:
+    if isinstance(value, float):
+        if value.is_integer() and abs(value) < 1e15:
+            return str(int(value))
+        return f"{value:.12g}"
+    return str(value)
+
+
+_TRIGGER_RE = re.compile(r"^.*?\b(?:what is|what's|whats|calculate|compute|evaluate|how much is|solve)\b\s*:?", re.I)
+_WHERE_RE = re.compile(r"\b(?:where|with|for|if)\s+([a-z_]\w*\s*=.*)$", re.I)
+_ASSIGN_RE = re.compile(r"([a-z_]\w*)\s*=\s*(-?(?:\d+\.?\d*|\.\d+)(?:e[-+]?\d+)?)", re.I)
+
+
+def _split_expression(text: str) -> Tuple[str, Dict[str, float]]:
+    """'what is 2x + 1 where x = 3?' -> ('2x + 1', {'x': 3.0})"""
+    expr = _TRIGGER_RE.sub("", text.strip(), count=1).strip().rstrip("?!. ")
+    variables: Dict[str, float] = {}
+    m = _WHERE_RE.search(expr)
+    if m:
+        variables = {name: float(value) for name, value in _ASSIGN_RE.findall(m.group(1))}
+        expr = expr[:m.start()].strip().rstrip(",")
+    return expr.rstrip("= "), variables
+
 
 @register_handler(priority=50)
 def handle_simple_math(text: str) -> Optional[str]:
     lower = text.lower()
-    trigger_words = ["what is", "what's", "calculate", "how much is", "solve", "="]
+    trigger_words = ["what is", "what's", "whats", "calculate", "compute", "evaluate", "how much is", "solve", "="]
     has_trigger = any(w in lower for w in trigger_words)
     has_digit = any(ch.isdigit() for ch in text)
-    has_op = any(ch in "+-*/^" for ch in text)
+    has_op = any(ch in "+-*/^×÷" for ch in text) or "(" in text
 
     if not (has_trigger and has_digit and has_op):
         return None
 
-    match = re.search(r"([-+*/^().\d\s]+)", text)
-    if not match:
-        return None
-
-    expr = match.group(1).strip().replace("^", "**")
+    expr, variables = _split_expression(text)
     try:
-        result = eval_math_expression(expr)
-    except Exception:
+        result = eval_math_expression(expr, variables)
+    except MathLimitError as e:
+        return f"That's too big to calculate safely ({e})."
+    except MathError:
         return None
 
-    return f"{expr} = **{result}**"
+    return f"{expr} = **{format_number(result)}**"
 
 # ---------- unit conversions ----------
 
@@ -261,7 +261,7 @@ def handle_macros(text: str) -> Optional[str]:
     if "macros" not in lower:
         return None
 
-    nums = re.findall(r"\d+(\.\d+)?", text)
+    nums = re.findall(r"\d+(?:\.\d+)?", text)
     if len(nums) < 2:
         return "Usage: macros <weight_lbs> <calories>"
 
@@ -291,7 +291,7 @@ def handle_protein(text: str) -> Optional[str]:
     if not text.lower().startswith("protein"):
         return None
 
-    nums = re.findall(r"\d+(\.\d+)?", text)
+    nums = re.findall(r"\d+(?:\.\d+)?", text)
     if not nums:
         return "Usage: protein <weight_lbs>"
 
@@ -317,7 +317,7 @@ def handle_bulk_cut_calories(text: str) -> Optional[str]:
     if "bulk_cut" not in lower:
         return None
 
-    nums = re.findall(r"\d+(\.\d+)?", text)
+    nums = re.findall(r"\d+(?:\.\d+)?", text)
     if not nums:
         return "Usage: bulk_cut <tdee> <cut/bulk>"
 
@@ -337,7 +337,7 @@ def handle_weight_timeline(text: str) -> Optional[str]:
     if "weight_timeline" not in lower:
         return None
 
-    nums = re.findall(r"\d+(\.\d+)?", text)
+    nums = re.findall(r"\d+(?:\.\d+)?", text)
     if len(nums) < 2:
         return "Usage: weight_timeline <deficit> <lbs_to_lose>"
 
@@ -1,30 +1,100 @@
 # deterministic/registry.py
-from typing import Callable, List, Tuple, Optional
+import inspect
+import threading
+from typing import Any, Awaitable, Callable, Dict, Iterable, List, Tuple, Optional, Union
 
-Handler = Callable[[str], Optional[str]]
+from godbot.core.metrics import counter
+from godbot.core.worker_pool import JobTimeout, WorkerPoolError
+
+from .results import HandlerResult, TextResult, as_result
+
+# str -> str | HandlerResult | None, sync or async (see deterministic.results)
+Handler = Callable[[str], Union[Any, Awaitable[Any]]]
 
 _handlers: List[Tuple[int, Handler]] = []  # (priority, fn)
+_cpu_bound: Dict[Handler, Tuple[str, ...]] = {}  # fn -> trigger keywords
+_lock = threading.Lock()  # plugins and tool modules may register from startup threads
+
+# Per-handler hit rate = hit / (hit + miss)
+CALLS = counter("godbot_deterministic_calls_total", "Deterministic handler calls", labels=("handler", "result"))
 
+TIMEOUT_REPLY = "That calculation is too big to run here — try smaller numbers."
 
-def register_handler(priority: int = 100):
+
+def register_handler(priority: int = 100, cpu_bound: bool = False, trigger: Iterable[str] = ()):
     """
     Decorator to register a deterministic handler.
 
-    Each handler takes (text: str) -> Optional[str].
-    If it returns a non-empty string, that response is used and we STOP.
+    Each handler takes (text: str) and returns None (no match), a str, or
+    a typed result from deterministic.results (TextResult, LLMContextResult,
+    EmbedResult, FileResult). The first match is used and we STOP.
     Lower priority number = tried earlier.
+
+    Handlers may be `async def` when they need I/O (cache lookups, DB
+    reads); those only run through try_deterministic_tools_async.
+
+    cpu_bound handlers (long loops, simulations) run in the bot's worker
+    process pool instead of on the event loop; they must be module-level
+    functions. trigger keywords (lowercase) let messages that can't match
+    skip the round trip to the pool.
     """
     def deco(fn: Handler) -> Handler:
-        _handlers.append((priority, fn))
-        _handlers.sort(key=lambda x: x[0])
+        if cpu_bound and inspect.iscoroutinefunction(fn):
+            raise TypeError(f"{fn.__name__}: cpu_bound handlers must be plain functions")
+        with _lock:
+            _handlers.append((priority, fn))
+            _handlers.sort(key=lambda x: x[0])
+            if cpu_bound:
+                _cpu_bound[fn] = tuple(trigger)
         return fn
     return deco
 
 
-def try_deterministic_tools(text: str) -> Optional[str]:
+def try_deterministic_tools(text: str) -> Optional[Any]:
+    """Run the sync handlers inline and return the first match as the handler returned it."""
     for _, fn in _handlers:
+        if inspect.iscoroutinefunction(fn):
+            continue
         resp = fn(text)
         if resp:
+            CALLS.labels(fn.__name__, "hit").inc()
             return resp
+        CALLS.labels(fn.__name__, "miss").inc()
     return None
 
+
+async def try_deterministic_tools_async(text: str, pool=None) -> Optional[HandlerResult]:
+    """
+    The event loop entry point: the first match as a typed result.
+
+    async handlers are awaited, cpu_bound handlers run in pool (a
+    godbot.core.worker_pool.WorkerPool) and the rest run inline. Without a
+    pool everything that isn't async runs inline.
+
+    A cpu_bound handler that times out answers with TIMEOUT_REPLY; one the
+    pool can't take (full, or its worker died) is skipped.
+    """
+    lower = text.lower()
+    for _, fn in list(_handlers):
+        trigger = _cpu_bound.get(fn)
+        if inspect.iscoroutinefunction(fn):
+            resp = await fn(text)
+        elif pool is None or trigger is None:
+            resp = fn(text)
+        elif trigger and not any(k in lower for k in trigger):
+            resp = None
+        else:
+            try:
+                resp = await pool.run(fn, text)
+            except JobTimeout:
+                CALLS.labels(fn.__name__, "timeout").inc()
+                return TextResult(TIMEOUT_REPLY)
+            except WorkerPoolError:
+                CALLS.labels(fn.__name__, "skipped").inc()
+                continue
+        result = as_result(resp)
+        if result is not None:
+            CALLS.labels(fn.__name__, "hit").inc()
+            return result
+        CALLS.labels(fn.__name__, "miss").inc()
+    return None
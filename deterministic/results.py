@@ -0,0 +1,77 @@
+# deterministic/results.py
+"""
+Typed results for deterministic handlers.
+
+A handler returns one of these (or a plain str, which means TextResult)
+and on_message delivers it by `kind`:
+
+- TextResult: reply with the text as is
+- LLMContextResult: the handler did the deterministic part and built a
+  prompt; the LLM writes the reply (cached under `route`)
+- EmbedResult: reply with a Discord embed
+- FileResult: reply with an attachment
+"""
+from dataclasses import dataclass, field
+from typing import Any, List, Optional, Tuple, Union
+
+
+@dataclass
+class TextResult:
+    text: str
+    kind = "text"
+
+    @property
+    def memory_text(self) -> str:
+        return self.text
+
+
+@dataclass
+class LLMContextResult:
+    prompt: str
+    route: str = "tool"  # response cache route and metrics label
+    data: dict = field(default_factory=dict)  # structured extras (e.g. the champions in a matchup)
+    kind = "llm"
+
+    @property
+    def memory_text(self) -> str:
+        return self.prompt
+
+
+@dataclass
+class EmbedResult:
+    title: str
+    description: str = ""
+    fields: List[Tuple[str, str]] = field(default_factory=list)
+    color: Optional[int] = None
+    kind = "embed"
+
+    @property
+    def memory_text(self) -> str:
+        lines = [self.title, self.description] + [f"{name}: {value}" for name, value in self.fields]
+        return "\n".join(line for line in lines if line)
+
+
+@dataclass
+class FileResult:
+    filename: str
+    data: bytes
+    text: str = ""  # message sent with the file
+    kind = "file"
+
+    @property
+    def memory_text(self) -> str:
+        return f"{self.text}\n[attached {self.filename}]".strip()
+
+
+HandlerResult = Union[TextResult, LLMContextResult, EmbedResult, FileResult]
+
+
+def as_result(value: Any) -> Optional[HandlerResult]:
+    """Normalize a handler's return value; None (or empty) means no match."""
+    if not value:
+        return None
+    if isinstance(value, str):
+        return TextResult(value)
+    if isinstance(value, (TextResult, LLMContextResult, EmbedResult, FileResult)):
+        return value
+    raise TypeError(f"unsupported handler result {type(value).__name__}")
@@ -5,6 +5,7 @@ import json
 from typing import Optional, Dict, Any
 from difflib import get_close_matches
 from .registry import register_handler
+from .results import LLMContextResult
 
 BUILD_DIR = os.path.join(os.getcwd(), "data", "wild_rift_builds")
 
@@ -163,7 +164,7 @@ def get_role(champ: str) -> str:
 
 
 @register_handler(priority=91)
-def handle_wildrift_matchup(text: str) -> Optional[Dict[str, Any]]:
+def handle_wildrift_matchup(text: str) -> Optional[LLMContextResult]:
     """Detect champion matchups and prepare context for the LLM."""
 
     matchup = detect_matchup(text)
@@ -210,8 +211,8 @@ def handle_wildrift_matchup(text: str) -> Optional[Dict[str, Any]]:
         "- Refer ONLY to the builds provided above\n"
     )
 
-    return {
-        "matchup_context": context,
-        "primary_champion": primary.capitalize(),
-        "opponents": [x.capitalize() for x in opponents]
-    }
+    return LLMContextResult(
+        context,
+        route="matchup",
+        data={"primary_champion": primary.capitalize(), "opponents": [x.capitalize() for x in opponents]},
+    )
@@ -0,0 +1,180 @@
+# godbot/app.py
+"""
+Application factory.
+
+    from godbot.app import create_app
+    from godbot.config import AppConfig
+
+    client = create_app(AppConfig.from_env())
+    client.run(token)
+
+Importing this module is cheap and has no side effects: Discord, the
+plugins, vector memory, the dashboard and the deterministic tools are only
+imported/initialized when the client starts (see startup()).
+"""
+import asyncio
+from typing import Optional
+
+from godbot.config import AppConfig
+
+
+def create_app(config: Optional[AppConfig] = None):
+    """Build the Discord client and register every command and event."""
+    import discord
+
+    from godbot.discord.bot import create_client
+    from godbot.discord.commands import (
+        register_core_commands,
+        register_finance_commands,
+        register_wildrift_commands,
+    )
+    from godbot.discord.handlers import register_events
+
+    config = config or AppConfig()
+
+    intents = discord.Intents.default()
+    intents.message_content = True
+    intents.voice_states = True
+
+    client = create_client(intents, config)
+
+    # Register modular slash commands
+    register_core_commands(client)
+    register_finance_commands(client)
+    register_wildrift_commands(client)
+    register_events(client)
+
+    return client
+
+
+# -----------------------------
+# STARTUP PHASES
+# -----------------------------
+
+def _init_memory(client) -> None:
+    from godbot.core.memory import MemoryDB
+    from godbot.core.reminders import ReminderService, ReminderStore
+    from godbot.core.response_cache import ResponseCache
+    from godbot.core.user_facts import UserFacts
+
+    config = client.config
+    client.long_memory = MemoryDB(config.long_memory_db)
+    client.user_facts = UserFacts(config.memory_file)
+    client.reminders = ReminderService(ReminderStore(config.reminders_db), client.send_reminder)
+    client.response_cache = ResponseCache(
+        ttl=config.response_cache_ttl,
+        db_path=config.response_cache_db or None,
+        routes=config.response_cache_routes,
+    )
+
+
+def _init_plugins(client) -> None:
+    from plugins.plugin_manager import SuperPluginManager
+
+    client.plugins = SuperPluginManager()
+
+
+def _init_vector_store(client) -> None:
+    from godbot.core.vector_memory import NullVectorMemory, VectorMemory
+
+    client.vector_memory = VectorMemory() if client.config.vector_memory_enabled else NullVectorMemory()
+
+
+def _init_builds(client) -> None:
+    # Force import of tool modules so they register
+    import deterministic.finance_tools  # noqa: F401
+    import deterministic.fitness_tools  # noqa: F401
+    import deterministic.math_tools  # noqa: F401
+    import deterministic.nutrition_tools  # noqa: F401
+    import deterministic.wildrift_tools  # noqa: F401
+
+
+def _init_voice(client) -> None:
+    import audio
+
+    client.voice_agent = audio.VoiceAgent(client)
+    client.voice_agent.enabled = client.config.voice_enabled
+
+
+async def _sync_commands(client, profile) -> None:
+    from godbot.discord.sync import sync_if_changed
+
+    config = client.config
+    with profile.phase("command_sync"):
+        synced = await sync_if_changed(client.tree, guild_id=config.dev_guild_id, force=config.force_sync)
+    print("Discord slash commands synced." if synced else "Discord slash commands unchanged, sync skipped.")
+
+
+async def _warm_model(client) -> None:
+    # Health check first so the preload lands on a host that has the model
+    await client.llm_router.check_all()
+    await client.model_lifecycle.preload(client.current_model, reason="startup")
+
+
+async def startup(client) -> None:
+    """
+    Run the startup phases (called from MyClient.setup_hook).
+
+    Independent subsystems are initialized in parallel worker threads
+    while the command sync talks to Discord; everything that needs them
+    runs afterwards.
+    """
+    from godbot.core.startup import StartupProfile
+
+    config = client.config
+    profile = StartupProfile()
+    client.startup_profile = profile
+
+    if config.sync_only:
+        await _sync_commands(client, profile)
+        await client.close()
+        return
+
+    from godbot.core.llm import set_keep_alive_policy, set_router
+
+    # Warm the model in Ollama while everything else starts up
+    set_router(client.llm_router)
+    set_keep_alive_policy(client.model_lifecycle.keep_alive_for)
+    asyncio.create_task(_warm_model(client))
+
+    sync_task = asyncio.create_task(_sync_commands(client, profile))
+    await profile.run_parallel("init", {
+        "memory": lambda: _init_memory(client),
+        "plugins": lambda: _init_plugins(client),
+        "vector_store": lambda: _init_vector_store(client),
+        "builds": lambda: _init_builds(client),
+        "voice": lambda: _init_voice(client),
+    })
+    await sync_task
+
+    if config.dashboard_enabled:
+        with profile.phase("dashboard"):
+            import dashboard
+
+            client.dashboard_runner = await dashboard.start_dashboard(client, port=config.dashboard_port)
+
+    with profile.phase("scheduler"):
+        import scheduled_tasks.daily_report as task_daily_report
+        import scheduled_tasks.memory_cleanup as task_memory_cleanup
+        import scheduled_tasks.model_lifecycle as task_model_lifecycle
+        import scheduled_tasks.model_refresh as task_model_refresh
+        import scheduled_tasks.ollama_health as task_ollama_health
+        import scheduled_tasks.ping_test as task_ping_test
+        import scheduled_tasks.plugin_autoreload as task_plugin_reload
+        from godbot.core.router import PROBE_INTERVAL
+
+        # Register scheduled tasks (Phase 12)
+        client.scheduler.add("heartbeat", 60, task_ping_test.ping_test)
+        client.scheduler.add("plugin_reload", 30, task_plugin_reload.plugin_autoreload, jitter=5)
+        client.scheduler.add("memory_cleanup", 1800, task_memory_cleanup.memory_cleanup, overlap="skip", jitter=60)
+        client.scheduler.add("daily_report", cron="0 9 * * *", func=task_daily_report.daily_report)
+        client.scheduler.add("model_refresh", client.model_catalog.refresh_interval, task_model_refresh.model_refresh)
+        client.scheduler.add("model_lifecycle", 60, task_model_lifecycle.model_lifecycle)
+        client.scheduler.add("ollama_health", PROBE_INTERVAL, task_ollama_health.ollama_health, overlap="skip")
+
+        asyncio.create_task(client.autoupdater())
+        asyncio.create_task(client.scheduler.start())
+        asyncio.create_task(client.reminders.run())
+
+    profile.finish()
+    print(f"[Startup] {profile.summary()}")
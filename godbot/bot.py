@@ -18,8 +18,8 @@ def main():
         sys.path.insert(0, repo_root)
     
     try:
-        # Import main - this will execute client.run(TOKEN) at module level
         import main
+        main.main()
     except Exception as e:
         log.error(f"Bot crashed: {e}", exc_info=True)
         raise
@@ -5,6 +5,8 @@ godbot CLI
 
 Commands:
     godbot start
+    godbot sync [--guild ID]
+    godbot bench [--routes message,ask,committee] [--concurrency N] [--messages N]
     godbot doctor
     godbot version
     godbot config
@@ -26,6 +28,40 @@ def cmd_start(args):
         sys.exit(1)
 
 
+def cmd_sync(args):
+    """Force a slash command sync, then exit."""
+    os.environ["GODBOT_FORCE_SYNC"] = "1"
+    os.environ["GODBOT_SYNC_ONLY"] = "1"
+    if args.guild:
+        os.environ["GODBOT_DEV_GUILD_ID"] = str(args.guild)
+    print(f"Syncing slash commands ({'guild ' + str(args.guild) if args.guild else 'global'})...")
+    cmd_start(args)
+
+
+def cmd_bench(args):
+    """Replay a message corpus through the handlers against a fake Ollama and report latency."""
+    import asyncio
+
+    from godbot.testing.bench import format_report, load_corpus, run_bench
+    from godbot.testing.fake_ollama import FakeOllama
+
+    fake = None
+    if not args.ollama_url:
+        fake = FakeOllama(
+            models=(args.model,), tokens_per_sec=args.tokens_per_sec, ttft=args.ttft,
+            tokens=args.tokens, jitter=args.jitter,
+        )
+    routes = [r.strip() for r in args.routes.split(",") if r.strip()]
+    print(f"Benchmarking {', '.join(routes)}: {args.messages} messages each, concurrency {args.concurrency}, "
+          f"against {args.ollama_url or 'fake Ollama'}\n")
+    report = asyncio.run(run_bench(
+        routes=routes, corpus=load_corpus(args.corpus), messages=args.messages,
+        concurrency=args.concurrency, ollama_url=args.ollama_url, model=args.model,
+        fake=fake, quiet=not args.verbose,
+    ))
+    print(format_report(report))
+
+
 def cmd_version(args):
     print("GodBot version 0.1.0")
 
@@ -62,6 +98,20 @@ def main():
 
     # Create subcommands
     start = subparsers.add_parser("start")
+    sync = subparsers.add_parser("sync", help="Force a slash command sync and exit")
+    sync.add_argument("--guild", type=int, default=None, help="Sync to a single guild (instant)")
+    bench = subparsers.add_parser("bench", help="End-to-end load test against a fake Ollama")
+    bench.add_argument("--routes", default="message,ask,committee", help="Comma separated: message, ask, committee")
+    bench.add_argument("--concurrency", type=int, default=8)
+    bench.add_argument("--messages", type=int, default=100, help="Messages per route")
+    bench.add_argument("--corpus", default=None, help="Text file, one message per line")
+    bench.add_argument("--model", default="fake-model")
+    bench.add_argument("--ollama-url", default=None, help="Benchmark a real Ollama instead of the fake one")
+    bench.add_argument("--tokens-per-sec", type=float, default=100.0, help="Fake Ollama generation speed")
+    bench.add_argument("--ttft", type=float, default=0.05, help="Fake Ollama time to first token (seconds)")
+    bench.add_argument("--tokens", type=int, default=40, help="Fake Ollama tokens per response")
+    bench.add_argument("--jitter", type=float, default=0.0, help="Fake Ollama +/- latency jitter (fraction)")
+    bench.add_argument("--verbose", action="store_true", help="Keep the handlers' console output")
     doctor = subparsers.add_parser("doctor")
     version = subparsers.add_parser("version")
     config = subparsers.add_parser("config")
@@ -71,6 +121,10 @@ def main():
     # Python 3.10 compatible (no match-case)
     if args.command == "start":
         cmd_start(args)
+    elif args.command == "sync":
+        cmd_sync(args)
+    elif args.command == "bench":
+        cmd_bench(args)
     elif args.command == "doctor":
         cmd_doctor(args)
     elif args.command == "version":
@@ -0,0 +1,99 @@
+# godbot/config.py
+"""
+Application configuration.
+
+AppConfig is a plain dataclass so tests and benchmarks can build one
+directly; the bot entry point uses AppConfig.from_env().
+"""
+import os
+from dataclasses import dataclass
+from typing import Optional, Tuple
+
+DEFAULT_MODEL = "dolphin-llama3:latest"  # Fast and reliable
+
+
+@dataclass
+class AppConfig:
+    token: Optional[str] = None
+    model: str = DEFAULT_MODEL
+    memory_file: str = "memory.json"
+    long_memory_db: str = "long_memory.db"
+    reminders_db: str = "reminders.db"
+    # Ollama hosts generations are spread over (see godbot.core.router)
+    ollama_urls: Tuple[str, ...] = ("http://localhost:11434",)
+    ollama_parallel: int = 4  # requests sent to one host at once; the rest queue in the router
+    llm_failure_threshold: int = 3  # consecutive failures that open a host's circuit breaker
+    # LLM response cache (see godbot.core.response_cache); empty db = memory only
+    response_cache_db: str = "response_cache.db"
+    response_cache_ttl: float = 3600
+    response_cache_routes: Tuple[str, ...] = ("greeting", "matchup")
+    # Model lifecycle (see godbot.core.model_lifecycle)
+    keep_alive: str = "30m"
+    keep_alive_overrides: str = ""  # "llama3:8b=1h,mistral:7b=10m"
+    pin_hours: Optional[str] = None  # "8-23": keep the default model loaded during these hours
+    agent_model_idle: float = 900  # unload specialist agent models idle this long (seconds)
+    # Which channel messages get an LLM reply (see godbot.core.triage)
+    triage_mode: str = "smart"  # default for channels without a /triage setting: mention, smart or all
+    triage_threshold: float = 0.5
+    triage_tokens_per_hour: int = 20000  # LLM tokens per channel per hour, 0 = unlimited
+    triage_file: str = "triage_channels.json"
+    # Messages from one user in one channel this close together get one reply (see godbot.core.debounce)
+    debounce_window: float = 1.0  # seconds, 0 = off
+    debounce_max_wait: float = 4.0  # longest a burst is held before answering
+    generation_timeout: float = 120.0  # seconds an LLM reply may take before it is stopped, 0 = no limit
+    # Process pool for CPU-bound deterministic handlers (see godbot.core.worker_pool)
+    worker_processes: int = 2
+    worker_timeout: float = 5.0
+    dashboard_enabled: bool = True
+    dashboard_port: int = 5000
+    voice_enabled: bool = True
+    vector_memory_enabled: bool = True
+    # Slash command sync (see godbot.discord.sync)
+    dev_guild_id: Optional[int] = None
+    force_sync: bool = False
+    sync_only: bool = False
+
+    @classmethod
+    def from_env(cls) -> "AppConfig":
+        """Build a config from the environment (and .env, if present)."""
+        from dotenv import load_dotenv
+
+        load_dotenv()
+
+        dev_guild = os.getenv("GODBOT_DEV_GUILD_ID")
+        ollama_urls = os.getenv("OLLAMA_URLS") or os.getenv("OLLAMA_URL", "http://localhost:11434")
+        return cls(
+            token=os.getenv("DISCORD_TOKEN"),
+            model=os.getenv("OLLAMA_MODEL", DEFAULT_MODEL),
+            memory_file=os.getenv("GODBOT_MEMORY_FILE", "memory.json"),
+            long_memory_db=os.getenv("GODBOT_LONG_MEMORY_DB", "long_memory.db"),
+            reminders_db=os.getenv("GODBOT_REMINDERS_DB", "reminders.db"),
+            ollama_urls=tuple(u.strip() for u in ollama_urls.split(",") if u.strip()),
+            ollama_parallel=int(os.getenv("GODBOT_OLLAMA_PARALLEL", "4")),
+            llm_failure_threshold=int(os.getenv("GODBOT_LLM_FAILURE_THRESHOLD", "3")),
+            response_cache_db=os.getenv("GODBOT_RESPONSE_CACHE_DB", "response_cache.db"),
+            response_cache_ttl=float(os.getenv("GODBOT_RESPONSE_CACHE_TTL", "3600")),
+            response_cache_routes=tuple(
+                r.strip() for r in os.getenv("GODBOT_RESPONSE_CACHE_ROUTES", "greeting,matchup").split(",") if r.strip()
+            ),
+            keep_alive=os.getenv("GODBOT_KEEP_ALIVE", "30m"),
+            keep_alive_overrides=os.getenv("GODBOT_KEEP_ALIVE_OVERRIDES", ""),
+            pin_hours=os.getenv("GODBOT_PIN_HOURS") or None,
+            agent_model_idle=float(os.getenv("GODBOT_AGENT_MODEL_IDLE", "900")),
+            triage_mode=os.getenv("GODBOT_TRIAGE_MODE", "smart"),
+            triage_threshold=float(os.getenv("GODBOT_TRIAGE_THRESHOLD", "0.5")),
+            triage_tokens_per_hour=int(os.getenv("GODBOT_TRIAGE_TOKENS_PER_HOUR", "20000")),
+            triage_file=os.getenv("GODBOT_TRIAGE_FILE", "triage_channels.json"),
+            debounce_window=float(os.getenv("GODBOT_DEBOUNCE_WINDOW", "1")),
+            debounce_max_wait=float(os.getenv("GODBOT_DEBOUNCE_MAX_WAIT", "4")),
+            generation_timeout=float(os.getenv("GODBOT_GENERATION_TIMEOUT", "120")),
+            worker_processes=int(os.getenv("GODBOT_WORKER_PROCESSES", "2")),
+            worker_timeout=float(os.getenv("GODBOT_WORKER_TIMEOUT", "5")),
+            dashboard_enabled=os.getenv("GODBOT_DASHBOARD", "1") == "1",
+            dashboard_port=int(os.getenv("GODBOT_DASHBOARD_PORT", "5000")),
+            voice_enabled=os.getenv("GODBOT_VOICE", "1") == "1",
+            vector_memory_enabled=os.getenv("GODBOT_VECTOR_MEMORY", "1") == "1",
+            dev_guild_id=int(dev_guild) if dev_guild else None,
+            force_sync=os.getenv("GODBOT_FORCE_SYNC") == "1",
+            sync_only=os.getenv("GODBOT_SYNC_ONLY") == "1",
+        )
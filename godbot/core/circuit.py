@@ -0,0 +1,94 @@
+# GodBot core circuit breaker
+"""
+Circuit breaker for a flaky dependency (one per Ollama backend, see
+godbot.core.router).
+
+- closed: calls go through; failure_threshold consecutive failures open it
+- open: calls are refused at once until retry_at
+- half_open: after the delay a single probe is let through; success
+  closes the circuit, failure re-opens it with the delay doubled (up to
+  max_delay)
+"""
+import time
+from typing import Any, Callable, Dict, Optional
+
+CLOSED = "closed"
+OPEN = "open"
+HALF_OPEN = "half_open"
+STATES = (CLOSED, HALF_OPEN, OPEN)
+
+
+class CircuitBreaker:
+    def __init__(
+        self,
+        name: str,
+        failure_threshold: int = 3,
+        base_delay: float = 5.0,
+        max_delay: float = 300.0,
+        probe_timeout: float = 60.0,
+        clock: Callable[[], float] = time.monotonic,
+    ):
+        self.name = name
+        self.failure_threshold = failure_threshold
+        self.base_delay = base_delay
+        self.max_delay = max_delay
+        self.probe_timeout = probe_timeout  # a probe that never reports back frees the slot after this
+        self._clock = clock
+        self.state = CLOSED
+        self.consecutive_failures = 0
+        self.trips = 0
+        self.delay = base_delay
+        self.retry_at = 0.0
+        self.last_error: Optional[str] = None
+        self._probe_started = 0.0
+
+    def ready(self) -> bool:
+        """Would allow() let a call through right now? (doesn't change state)"""
+        if self.state == CLOSED:
+            return True
+        now = self._clock()
+        if self.state == OPEN:
+            return now >= self.retry_at
+        return now - self._probe_started >= self.probe_timeout
+
+    def allow(self) -> bool:
+        """Claim a call. When the open delay is over, the first caller becomes the probe."""
+        if self.state == CLOSED:
+            return True
+        if not self.ready():
+            return False
+        self.state = HALF_OPEN
+        self._probe_started = self._clock()
+        return True
+
+    def record_success(self) -> None:
+        self.state = CLOSED
+        self.consecutive_failures = 0
+        self.delay = self.base_delay
+        self.last_error = None
+
+    def record_failure(self, error: str = "") -> None:
+        self.consecutive_failures += 1
+        self.last_error = error or self.last_error
+        if self.state == HALF_OPEN:
+            self._open(min(self.delay * 2, self.max_delay))
+        elif self.state == CLOSED and self.consecutive_failures >= self.failure_threshold:
+            self.trips += 1
+            self._open(self.base_delay)
+
+    def _open(self, delay: float) -> None:
+        self.state = OPEN
+        self.delay = delay
+        self.retry_at = self._clock() + delay
+
+    def retry_in(self) -> float:
+        return max(0.0, self.retry_at - self._clock()) if self.state == OPEN else 0.0
+
+    def status(self) -> Dict[str, Any]:
+        return {
+            "state": self.state,
+            "consecutive_failures": self.consecutive_failures,
+            "trips": self.trips,
+            "retry_in": round(self.retry_in(), 1),
+            "last_error": self.last_error,
+        }
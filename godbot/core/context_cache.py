@@ -0,0 +1,76 @@
+# GodBot core conversation context cache
+"""
+Ollama's /api/generate returns a `context` token array with the final
+chunk. Feeding it back on the next turn continues the conversation
+without re-sending (and re-evaluating) the text history.
+
+Contexts are stored per conversation key (user, optionally channel),
+expire after `ttl` seconds, are capped in number (LRU) and in length, and
+are only valid for the model that produced them.
+"""
+import time
+from collections import OrderedDict
+from typing import List, Optional
+
+# Phase 11.1 logging
+from godbot.core.logging import get_logger
+
+log = get_logger(__name__)
+
+
+class ContextEntry:
+    def __init__(self, model: str, context: List[int]):
+        self.model = model
+        self.context = context
+        self.updated = time.monotonic()
+
+
+class ConversationContextStore:
+    def __init__(self, ttl: float = 1800, max_entries: int = 1000, max_tokens: int = 8192):
+        self.ttl = ttl
+        self.max_entries = max_entries
+        self.max_tokens = max_tokens
+        self._entries: "OrderedDict[str, ContextEntry]" = OrderedDict()
+
+    @staticmethod
+    def key(user_id, channel_id=None, scope: str = "chat") -> str:
+        return f"{scope}:{user_id}:{channel_id}" if channel_id is not None else f"{scope}:{user_id}"
+
+    def get(self, key: str, model: str) -> Optional[List[int]]:
+        """Return the stored context for key if it is fresh and from `model`."""
+        entry = self._entries.get(key)
+        if entry is None:
+            return None
+        if entry.model != model or time.monotonic() - entry.updated > self.ttl:
+            del self._entries[key]
+            return None
+        self._entries.move_to_end(key)
+        return entry.context
+
+    def put(self, key: str, model: str, context: Optional[List[int]]) -> None:
+        """Store the context from a finished generation."""
+        if not context:
+            return
+        if len(context) > self.max_tokens:
+            # Too long to keep around - next turn falls back to text history
+            self._entries.pop(key, None)
+            return
+        self._entries[key] = ContextEntry(model, context)
+        self._entries.move_to_end(key)
+        while len(self._entries) > self.max_entries:
+            self._entries.popitem(last=False)
+
+    def drop(self, key: str) -> None:
+        self._entries.pop(key, None)
+
+    def invalidate(self, model: Optional[str] = None) -> int:
+        """Drop contexts (all, or those not produced by `model`). Returns the count dropped."""
+        stale = [k for k, e in self._entries.items() if model is None or e.model != model]
+        for k in stale:
+            del self._entries[k]
+        if stale:
+            log.info(f"Dropped {len(stale)} conversation contexts")
+        return len(stale)
+
+    def __len__(self) -> int:
+        return len(self._entries)
@@ -0,0 +1,109 @@
+# GodBot core cron expressions
+"""
+Minimal 5-field cron parser for the scheduler.
+
+    minute hour day-of-month month day-of-week
+
+Each field takes "*", numbers, ranges ("1-5"), lists ("1,15") and steps
+("*/15", "0-30/10"). Day-of-week is 0-6 with 0 = Sunday (7 is accepted as
+Sunday too). Like classic cron, when both day fields are restricted a day
+matches if either one does. Times are local.
+"""
+import time
+from datetime import datetime, timedelta
+from typing import Optional, Set
+
+ALIASES = {
+    "@hourly": "0 * * * *",
+    "@daily": "0 0 * * *",
+    "@midnight": "0 0 * * *",
+    "@weekly": "0 0 * * 0",
+    "@monthly": "0 0 1 * *",
+    "@yearly": "0 0 1 1 *",
+}
+
+# (min, max) for each field
+_BOUNDS = [(0, 59), (0, 23), (1, 31), (1, 12), (0, 7)]
+
+# Give up if no match within this many days (e.g. "0 0 31 2 *")
+_SEARCH_DAYS = 366 * 5
+
+
+class CronError(ValueError):
+    pass
+
+
+def _parse_field(field: str, lo: int, hi: int) -> Set[int]:
+    values: Set[int] = set()
+    for part in field.split(","):
+        step = 1
+        if "/" in part:
+            part, step_s = part.split("/", 1)
+            step = int(step_s)
+            if step < 1:
+                raise CronError(f"bad step in {field!r}")
+        if part == "*":
+            start, end = lo, hi
+        elif "-" in part:
+            a, b = part.split("-", 1)
+            start, end = int(a), int(b)
+        else:
+            start = int(part)
+            end = hi if step > 1 else start
+        if start < lo or end > hi or start > end:
+            raise CronError(f"{field!r} out of range {lo}-{hi}")
+        values.update(range(start, end + 1, step))
+    return values
+
+
+class CronExpr:
+    def __init__(self, expr: str):
+        self.expr = expr
+        fields = ALIASES.get(expr.strip(), expr).split()
+        if len(fields) != 5:
+            raise CronError(f"expected 5 fields, got {len(fields)}: {expr!r}")
+        try:
+            parsed = [_parse_field(f, lo, hi) for f, (lo, hi) in zip(fields, _BOUNDS)]
+        except ValueError as e:
+            raise CronError(f"bad cron expression {expr!r}: {e}") from None
+        self.minutes, self.hours, self.days, self.months, dow = parsed
+        self.weekdays = {d % 7 for d in dow}
+        self._any_day = fields[2] == "*"
+        self._any_weekday = fields[4] == "*"
+
+    def _day_matches(self, dt: datetime) -> bool:
+        weekday = (dt.weekday() + 1) % 7  # Python: Monday=0, cron: Sunday=0
+        if self._any_day and self._any_weekday:
+            return True
+        if self._any_day:
+            return weekday in self.weekdays
+        if self._any_weekday:
+            return dt.day in self.days
+        return dt.day in self.days or weekday in self.weekdays
+
+    def next_after(self, ts: Optional[float] = None) -> float:
+        """First matching minute strictly after ts (epoch seconds)."""
+        ts = time.time() if ts is None else ts
+        dt = datetime.fromtimestamp(ts).replace(second=0, microsecond=0) + timedelta(minutes=1)
+        limit = dt + timedelta(days=_SEARCH_DAYS)
+
+        while dt < limit:
+            if dt.month not in self.months:
+                # Jump to the first day of next month
+                dt = (dt.replace(day=1) + timedelta(days=32)).replace(day=1, hour=0, minute=0)
+                continue
+            if not self._day_matches(dt):
+                dt = (dt + timedelta(days=1)).replace(hour=0, minute=0)
+                continue
+            if dt.hour not in self.hours:
+                dt = (dt + timedelta(hours=1)).replace(minute=0)
+                continue
+            if dt.minute not in self.minutes:
+                dt += timedelta(minutes=1)
+                continue
+            return dt.timestamp()
+
+        raise CronError(f"{self.expr!r} never fires")
+
+    def __repr__(self) -> str:
+        return f"CronExpr({self.expr!r})"
@@ -0,0 +1,147 @@
+# GodBot core debounce
+"""
+Merges bursts of work per key into one run.
+
+    await debouncer.submit((channel_id, user_id), item, handler)
+
+Items arriving within `window` seconds of each other for the same key
+form one burst; `handler(burst)` runs once for the whole burst, at most
+`max_wait` seconds after its first item. If another item arrives while
+the handler is still running, that run is cancelled (the cancellation
+reaches whatever it is awaiting, e.g. an Ollama stream) and its items
+are merged into the next burst. A handler calls burst.commit() right
+before its side effects (sending the reply); after that it is left to
+finish and new items start a fresh burst.
+
+submit() returns once the burst the item ended up in has been handled,
+so callers can await it like a direct call. window <= 0 disables
+merging: every item is handled on its own, immediately.
+"""
+import asyncio
+import time
+from typing import Any, Awaitable, Callable, Dict, Hashable, List, Optional
+
+# Phase 11.1 logging
+from godbot.core.logging import get_logger
+from godbot.core.metrics import counter
+
+log = get_logger(__name__)
+
+EVENTS = counter("godbot_debounce_total", "Debounced items", labels=("event",))
+
+
+class Burst:
+    """Items handled together; handler(burst) reads .items."""
+
+    def __init__(self, key: Hashable, started: float):
+        self.key = key
+        self.items: List[Any] = []
+        self.started = started
+        self.committed = False
+        self.superseded = False
+        self.task: Optional[asyncio.Task] = None
+        self._waiters: List[asyncio.Future] = []
+        self._timer: Optional[asyncio.TimerHandle] = None
+
+    @property
+    def last(self) -> Any:
+        return self.items[-1]
+
+    def commit(self) -> None:
+        """Stop later items from cancelling this run."""
+        self.committed = True
+
+
+Handler = Callable[[Burst], Awaitable[None]]
+
+
+class Debouncer:
+    def __init__(self, window: float = 1.0, max_wait: float = 5.0, clock: Callable[[], float] = time.monotonic):
+        self.window = window
+        self.max_wait = max_wait
+        self._clock = clock
+        self._pending: Dict[Hashable, Burst] = {}  # collecting items, timer armed
+        self._running: Dict[Hashable, Burst] = {}  # handler in progress
+
+    async def submit(self, key: Hashable, item: Any, handler: Handler) -> None:
+        if self.window <= 0:
+            burst = Burst(key, self._clock())
+            burst.items.append(item)
+            await handler(burst)
+            return
+
+        loop = asyncio.get_running_loop()
+        burst = self._pending.get(key)
+        if burst is None:
+            burst = self._pending[key] = Burst(key, self._clock())
+            running = self._running.get(key)
+            if running is not None and not running.committed:
+                # Its reply isn't out yet: answer everything in one go instead
+                running.superseded = True
+                running.task.cancel()
+                del self._running[key]
+                burst.items.extend(running.items)
+                burst._waiters.extend(running._waiters)
+                burst.started = running.started
+                EVENTS.labels("superseded").inc()
+        elif burst.items:
+            EVENTS.labels("merged").inc()
+
+        waiter = loop.create_future()
+        burst.items.append(item)
+        burst._waiters.append(waiter)
+        EVENTS.labels("submitted").inc()
+
+        if burst._timer is not None:
+            burst._timer.cancel()
+        delay = min(self.window, burst.started + self.max_wait - self._clock())
+        burst._timer = loop.call_later(max(0.0, delay), self._flush, burst, handler)
+        # Shielded: the caller giving up doesn't cancel the others' burst
+        await asyncio.shield(waiter)
+
+    def _flush(self, burst: Burst, handler: Handler) -> None:
+        if self._pending.get(burst.key) is not burst:
+            return
+        del self._pending[burst.key]
+        self._running[burst.key] = burst
+        burst.task = asyncio.ensure_future(self._run(burst, handler))
+
+    async def _run(self, burst: Burst, handler: Handler) -> None:
+        try:
+            await handler(burst)
+        except asyncio.CancelledError:
+            if burst.superseded:
+                return  # its waiters moved to the next burst
+            raise
+        except Exception:
+            log.exception(f"Debounced handler failed for {burst.key!r}")
+        finally:
+            if self._running.get(burst.key) is burst:
+                del self._running[burst.key]
+            if not burst.superseded:
+                for waiter in burst._waiters:
+                    if not waiter.done():
+                        waiter.set_result(None)
+
+    def discard(self, match: Callable[[Any], bool]) -> int:
+        """Drop waiting (not yet handled) items match(item) is true for; returns how many."""
+        dropped = 0
+        for key, burst in list(self._pending.items()):
+            keep = [i for i, item in enumerate(burst.items) if not match(item)]
+            if len(keep) == len(burst.items):
+                continue
+            for i, waiter in enumerate(burst._waiters):
+                if i not in keep and not waiter.done():
+                    waiter.set_result(None)
+            dropped += len(burst.items) - len(keep)
+            burst.items = [burst.items[i] for i in keep]
+            burst._waiters = [burst._waiters[i] for i in keep]
+            if not burst.items:
+                burst._timer.cancel()
+                del self._pending[key]
+        if dropped:
+            EVENTS.labels("discarded").inc(dropped)
+        return dropped
+
+    def status(self) -> Dict[str, int]:
+        return {"pending": len(self._pending), "running": len(self._running)}
@@ -0,0 +1,146 @@
+# GodBot core generation tracking
+"""
+Cancellable handles for the LLM generations behind Discord replies.
+
+    async with client.generations.track([message.id], user_id, channel_id, model) as generation:
+        async for chunk in stream_response(...):
+            ...
+
+Each handle is registered under the Discord message ids it answers
+(or the interaction id for slash commands) and can be cancelled:
+
+- discard(message_id): the user deleted a message; a generation
+  answering several (a debounced burst) is only cancelled once all of
+  them are gone
+- cancel(key, reason): cancel whatever answers that message/interaction
+- cancel_where(user_id=..., channel_id=..., reason="stop"): /stop
+- after `timeout` seconds it is cancelled and the block raises TimeoutError
+
+Cancelling cancels the task running the block; the CancelledError
+unwinds the stream, single-flight drops its subscriber, and the HTTP
+connection to Ollama is closed, so the server stops generating.
+
+The generation time saved is estimated from the model's recent
+generations (median total time minus the time already spent) and
+counted in godbot_generation_saved_seconds_total.
+"""
+import asyncio
+import statistics
+import time
+from contextlib import asynccontextmanager
+from typing import AsyncIterator, Dict, Iterable, List, Optional, Set
+
+from godbot.core.llm import TIMINGS
+
+# Phase 11.1 logging
+from godbot.core.logging import get_logger
+from godbot.core.metrics import counter
+
+log = get_logger(__name__)
+
+CANCELLED = counter("godbot_generations_cancelled_total", "Generations stopped before finishing", labels=("reason",))
+SAVED_SECONDS = counter(
+    "godbot_generation_saved_seconds_total", "Estimated LLM time saved by stopping generations early",
+    labels=("reason",),
+)
+
+
+def expected_seconds(model: Optional[str]) -> Optional[float]:
+    """Median total time of the model's recent generations (None without data)."""
+    totals = [t["total_ms"] for t in list(TIMINGS) if t["model"] == model]
+    return statistics.median(totals) / 1000 if totals else None
+
+
+class Generation:
+    """One tracked generation; cancel() stops the task running it."""
+
+    def __init__(self, keys: List[int], user_id: int, channel_id: int, model: Optional[str], task: asyncio.Task):
+        self.keys = keys
+        self.user_id = user_id
+        self.channel_id = channel_id
+        self.model = model
+        self.task = task
+        self.started = time.monotonic()
+        self.reason: Optional[str] = None
+        self.gone: Set[int] = set()  # keys discarded while it ran
+
+    def cancel(self, reason: str) -> bool:
+        if self.task.done() or self.reason is not None:
+            return False
+        self.reason = reason
+        self.task.cancel()
+        return True
+
+    def elapsed(self) -> float:
+        return time.monotonic() - self.started
+
+
+class GenerationTracker:
+    def __init__(self, timeout: float = 120.0):
+        self.timeout = timeout  # seconds, 0 = no limit
+        self._by_key: Dict[int, Generation] = {}
+
+    @asynccontextmanager
+    async def track(
+        self, keys: Iterable[int], user_id: int, channel_id: int, model: Optional[str] = None,
+        timeout: Optional[float] = None,
+    ) -> AsyncIterator[Generation]:
+        generation = Generation(list(keys), user_id, channel_id, model, asyncio.current_task())
+        for key in generation.keys:
+            self._by_key[key] = generation
+        timeout = self.timeout if timeout is None else timeout
+        # A plain timer rather than asyncio.timeout() (3.11+): the deadline is a cancel()
+        deadline = asyncio.get_running_loop().call_later(timeout, generation.cancel, "timeout") if timeout else None
+        try:
+            yield generation
+        except asyncio.CancelledError:
+            self._record(generation, generation.reason or "cancelled")
+            if generation.reason == "timeout":
+                if hasattr(generation.task, "uncancel"):  # 3.11+: keep outer timeouts' bookkeeping right
+                    generation.task.uncancel()
+                raise TimeoutError(f"generation took longer than {timeout}s") from None
+            raise
+        finally:
+            if deadline is not None:
+                deadline.cancel()
+            for key in generation.keys:
+                if self._by_key.get(key) is generation:
+                    del self._by_key[key]
+
+    def _record(self, generation: Generation, reason: str) -> None:
+        CANCELLED.labels(reason).inc()
+        expected = expected_seconds(generation.model)
+        saved = max(0.0, expected - generation.elapsed()) if expected is not None else 0.0
+        SAVED_SECONDS.labels(reason).inc(saved)
+        log.info(f"Stopped generation for {generation.keys} ({reason}) after {generation.elapsed():.1f}s, ~{saved:.1f}s saved")
+
+    def get(self, key: int) -> Optional[Generation]:
+        return self._by_key.get(key)
+
+    def cancel(self, key: int, reason: str) -> bool:
+        """Cancel the generation answering message/interaction `key`."""
+        generation = self._by_key.get(key)
+        return generation is not None and generation.cancel(reason)
+
+    def discard(self, key: int, reason: str = "deleted") -> bool:
+        """Drop message `key` from its generation; cancel it if none of its messages are left."""
+        generation = self._by_key.pop(key, None)
+        if generation is None:
+            return False
+        generation.gone.add(key)
+        if len(generation.gone) < len(generation.keys):
+            log.info(f"Message {key} deleted, still answering {len(generation.keys) - len(generation.gone)} more")
+            return False
+        return generation.cancel(reason)
+
+    def cancel_where(self, user_id: Optional[int] = None, channel_id: Optional[int] = None,
+                     reason: str = "stop") -> int:
+        """Cancel every generation for a user and/or channel; returns how many."""
+        matching = {
+            id(g): g for g in self._by_key.values()
+            if (user_id is None or g.user_id == user_id) and (channel_id is None or g.channel_id == channel_id)
+        }
+        return sum(g.cancel(reason) for g in matching.values())
+
+    def active(self) -> int:
+        return len({id(g) for g in self._by_key.values()})
@@ -1,29 +1,369 @@
 # Part of the GodBot core LLM interface
 
-from typing import AsyncIterator, Optional, Dict, Any
+import asyncio
+import hashlib
+import json
+import statistics
+import time
+from collections import deque
+from typing import AsyncIterator, Callable, Deque, List, Optional, Dict, Any, Tuple
 
 # Phase 11.1 logging
-from godbot.core.logging import get_logger
-from ollama_client import stream_ollama
+from godbot.core.logging import EVENTS, get_logger
+from godbot.core.metrics import counter, gauge, histogram
+from godbot.core.router import OllamaRouter
+from ollama_client import OLLAMA_URL, stream_ollama, stream_ollama_chat
 
 log = get_logger(__name__)
 
+TTFT = histogram("godbot_llm_ttft_seconds", "Time to first token", labels=("model",))
+TOKENS_PER_SEC = histogram(
+    "godbot_llm_tokens_per_second", "Generation speed (eval tokens/s)", labels=("model",),
+    buckets=(1, 2, 5, 10, 20, 30, 50, 75, 100, 150, 200),
+)
+QUEUE_WAIT = histogram("godbot_llm_queue_wait_seconds", "Wait before the upstream request starts")
+GENERATIONS = counter("godbot_llm_generations_total", "Generation requests", labels=("result",))
+IN_FLIGHT = gauge("godbot_llm_in_flight", "Upstream generations in flight")
+
+# Recent generation timings (newest last), see record_timings()
+TIMINGS: Deque[Dict[str, Any]] = deque(maxlen=200)
+
+# Flipped off the first time the server answers /api/chat with 404
+_chat_supported = True
+
+# model -> keep_alive for each request (see ModelLifecycle.keep_alive_for)
+_keep_alive_policy: Optional[Callable[[str], Any]] = None
+
+# Ollama hosts every generation is routed over (see set_router)
+_router: Optional[OllamaRouter] = None
+
+Message = Dict[str, Any]  # {"role": "system" | "user" | "assistant" | "tool", "content": str, ...}
+
+
+def record_timings(model: str, start: float, first_token: Optional[float], final: Dict[str, Any]) -> Dict[str, Any]:
+    """
+    Record time-to-first-token and Ollama's prompt-eval stats for one call.
+
+    prompt_eval_count only counts tokens Ollama actually evaluated, so a
+    reused prompt cache shows up as a small count and a short prompt_eval_ms.
+    """
+    timing = {
+        "model": model,
+        "ttft_ms": (first_token - start) * 1000 if first_token is not None else None,
+        "total_ms": (time.perf_counter() - start) * 1000,
+        "prompt_eval_count": final.get("prompt_eval_count", 0),
+        "prompt_eval_ms": final.get("prompt_eval_duration", 0) / 1e6,
+        "eval_count": final.get("eval_count", 0),
+        "eval_ms": final.get("eval_duration", 0) / 1e6,
+    }
+    TIMINGS.append(timing)
+    EVENTS.publish("latency", timing)
+    if timing["ttft_ms"] is not None:
+        TTFT.labels(model).observe(timing["ttft_ms"] / 1000)
+    if timing["eval_count"] and timing["eval_ms"]:
+        TOKENS_PER_SEC.labels(model).observe(timing["eval_count"] / (timing["eval_ms"] / 1000))
+    ttft = f"{timing['ttft_ms']:.0f}ms" if timing["ttft_ms"] is not None else "n/a"
+    log.info(
+        f"{model}: ttft={ttft} prompt_eval={timing['prompt_eval_count']} tok "
+        f"in {timing['prompt_eval_ms']:.0f}ms, total={timing['total_ms']:.0f}ms"
+    )
+    return timing
+
+
+def set_keep_alive_policy(policy: Optional[Callable[[str], Any]]) -> None:
+    """Install the function that picks keep_alive per model (None = server default)."""
+    global _keep_alive_policy
+    _keep_alive_policy = policy
+
+
+def _keep_alive(model: str) -> Any:
+    return _keep_alive_policy(model) if _keep_alive_policy is not None else None
+
+
+def get_router() -> OllamaRouter:
+    """The router generations go through (a single OLLAMA_URL backend until set_router)."""
+    global _router
+    if _router is None:
+        _router = OllamaRouter([OLLAMA_URL])
+    return _router
+
+
+def set_router(router: Optional[OllamaRouter]) -> None:
+    global _router
+    _router = router
+
+
+def llm_available() -> bool:
+    """False while every Ollama backend's circuit breaker is open."""
+    return get_router().available()
+
+
+def timing_summary(model: Optional[str] = None) -> Dict[str, Any]:
+    """Median TTFT / prompt-eval over the recent calls (optionally for one model)."""
+    rows = [t for t in TIMINGS if model is None or t["model"] == model]
+    ttfts = [t["ttft_ms"] for t in rows if t["ttft_ms"] is not None]
+    return {
+        "calls": len(rows),
+        "ttft_ms_p50": statistics.median(ttfts) if ttfts else None,
+        "prompt_eval_ms_p50": statistics.median([t["prompt_eval_ms"] for t in rows]) if rows else None,
+        "prompt_eval_count_p50": statistics.median([t["prompt_eval_count"] for t in rows]) if rows else None,
+    }
+
+
+async def _generate_upstream(prompt, model, tools=None, system=None, context=None):
+    """One real /api/generate stream (timed)."""
+    start = time.perf_counter()
+    first_token = None
+    keep_alive = _keep_alive(model)
+    async for chunk in get_router().stream(model, lambda url: stream_ollama(
+        prompt, model, tools=tools, system=system, context=context, keep_alive=keep_alive, base_url=url
+    )):
+        if first_token is None and chunk.get("response"):
+            first_token = time.perf_counter()
+        if chunk.get("done"):
+            record_timings(model, start, first_token, chunk)
+        yield chunk
+
 
 async def stream_response(
     prompt: str,
     model: str,
     tools: Optional[Dict[str, Any]] = None,
+    system: Optional[str] = None,
+    context: Optional[List[int]] = None,
 ) -> AsyncIterator[Dict[str, Any]]:
     """
     Core streaming interface for all LLM calls.
 
     - Wraps stream_ollama so we have a single place to adjust behavior
+    - Routed to one of the configured Ollama hosts (see godbot.core.router)
     - tools: optional tool schemas passed through to Ollama
+    - system: static system prefix (see PersonalityManager); keep it
+      byte-identical across calls so Ollama reuses its prompt cache
+    - context: token context from a previous turn (see ConversationContextStore);
+      the final chunk carries the new one under "context"
+
+    Concurrent identical requests share one upstream generation (see
+    _single_flight).
+    """
+    key = _flight_key("generate", prompt, model, tools, system, context)
+    async for chunk in _single_flight(key, lambda: _generate_upstream(prompt, model, tools, system, context)):
+        yield chunk
+
+
+async def cached_stream_response(
+    cache,
+    route: str,
+    prompt: str,
+    model: str,
+    cache_key: Optional[str] = None,
+    version: str = "",
+    system: Optional[str] = None,
+    **kwargs: Any,
+) -> AsyncIterator[Dict[str, Any]]:
     """
-    if tools is not None:
-        async for chunk in stream_ollama(prompt, model, tools=tools):
+    stream_response with a ResponseCache in front.
+
+    - route: cache route; only routes enabled on the cache are cached
+    - cache_key: text the entry is keyed on (normalized); defaults to the
+      prompt. Pass the user's message when the prompt wraps it in a template.
+    - version: personality version, so prompt changes invalidate entries
+
+    A hit is returned as a single final chunk with "cached": True.
+    """
+    if cache is None or not cache.enabled(route):
+        async for chunk in stream_response(prompt, model, system=system, **kwargs):
             yield chunk
-    else:
-        async for chunk in stream_ollama(prompt, model):
+        return
+
+    key = cache.make_key(route, cache_key if cache_key is not None else prompt, model, version, system)
+    hit = cache.get(key)
+    if hit is not None:
+        yield {"model": model, "response": hit, "done": True, "cached": True}
+        return
+
+    text = ""
+    failed = False
+    async for chunk in stream_response(prompt, model, system=system, **kwargs):
+        if "error" in chunk:
+            failed = True
+        text += chunk.get("response", "")
+        yield chunk
+    if not failed and text.strip():
+        cache.put(key, text)
+
+
+def messages_to_prompt(messages: List[Message]) -> Tuple[Optional[str], str]:
+    """Flatten chat messages into (system, prompt) for the /api/generate fallback."""
+    system = "\n\n".join(m["content"] for m in messages if m["role"] == "system") or None
+    labels = {"user": "User", "assistant": "Assistant", "tool": "Tool result"}
+    lines = [f"{labels.get(m['role'], m['role'])}: {m['content']}" for m in messages if m["role"] != "system"]
+    lines.append("Assistant:")
+    return system, "\n".join(lines)
+
+
+def _normalize_chat_chunk(data: Dict[str, Any]) -> Dict[str, Any]:
+    """Give /api/chat chunks the same shape as /api/generate ones ("response" text)."""
+    message = data.get("message") or {}
+    out = dict(data)
+    out["response"] = message.get("content", "")
+    if message.get("tool_calls"):
+        out["tool_calls"] = message["tool_calls"]
+    return out
+
+
+async def _chat_upstream(messages, model, tools=None):
+    """One real /api/chat stream (timed), falling back to /api/generate."""
+    global _chat_supported
+
+    if _chat_supported:
+        start = time.perf_counter()
+        first_token = None
+        first = True
+        keep_alive = _keep_alive(model)
+        async for data in get_router().stream(model, lambda url: stream_ollama_chat(
+            messages, model, tools=tools, keep_alive=keep_alive, base_url=url
+        )):
+            if first and data.get("status") == 404 and not data.get("model_missing"):
+                log.warning("Ollama has no /api/chat, falling back to /api/generate")
+                _chat_supported = False
+                break
+            first = False
+            chunk = _normalize_chat_chunk(data)
+            if first_token is None and chunk["response"]:
+                first_token = time.perf_counter()
+            if chunk.get("done"):
+                record_timings(model, start, first_token, chunk)
             yield chunk
+        else:
+            return
+
+    system, prompt = messages_to_prompt(messages)
+    async for chunk in _generate_upstream(prompt, model, system=system):
+        yield chunk
+
+
+async def stream_chat(
+    messages: List[Message],
+    model: str,
+    tools: Optional[List[Dict[str, Any]]] = None,
+) -> AsyncIterator[Dict[str, Any]]:
+    """
+    Chat-endpoint streaming with role-tagged messages.
+
+    - Chunks are normalized to the generate shape: "response" holds the text
+      delta, and native tool calls arrive under "tool_calls"
+      ([{"function": {"name": ..., "arguments": {...}}}])
+    - Keep messages[0] (the system prefix) identical across calls so the
+      server can reuse its prompt cache
+    - Falls back to /api/generate (flattened prompt) if the server has no
+      chat endpoint
+    - Concurrent identical requests share one upstream generation
+    """
+    key = _flight_key("chat", messages, model, tools)
+    async for chunk in _single_flight(key, lambda: _chat_upstream(messages, model, tools)):
+        yield chunk
+
+
+# -----------------------------
+# SINGLE-FLIGHT
+# -----------------------------
+
+class _Flight:
+    """One upstream generation, fanned out to every subscriber."""
+
+    def __init__(self, key: str):
+        self.key = key
+        self.chunks: List[Dict[str, Any]] = []  # everything produced so far
+        self.done = False
+        self.subscribers = 0
+        self.task: Optional[asyncio.Task] = None
+        self._changed = asyncio.Event()
+
+    def notify(self) -> None:
+        self._changed.set()
+        self._changed = asyncio.Event()
+
+    async def subscribe(self) -> AsyncIterator[Dict[str, Any]]:
+        self.subscribers += 1
+        i = 0
+        try:
+            while True:
+                changed = self._changed
+                while i < len(self.chunks):
+                    yield self.chunks[i]
+                    i += 1
+                if self.done:
+                    return
+                await changed.wait()
+        finally:
+            self.subscribers -= 1
+            if self.subscribers == 0 and not self.done and self.task is not None:
+                # Nobody is listening anymore - stop the upstream generation.
+                # Unlisted right away: _produce only cleans up on a later loop
+                # iteration, and a request joining before that would get a
+                # truncated reply
+                if _IN_FLIGHT.get(self.key) is self:
+                    del _IN_FLIGHT[self.key]
+                self.task.cancel()
+
+
+_IN_FLIGHT: Dict[str, _Flight] = {}
+IN_FLIGHT.set_function(lambda: len(_IN_FLIGHT))
+
+
+def queue_depth() -> Dict[str, int]:
+    """Upstream generations in flight and the callers waiting on them."""
+    flights = list(_IN_FLIGHT.values())
+    return {
+        "generations": len(flights),
+        "waiting": sum(f.subscribers for f in flights),
+    }
+
+
+def _flight_key(kind: str, *parts: Any) -> str:
+    raw = json.dumps([kind, *parts], sort_keys=True, default=str)
+    return hashlib.sha256(raw.encode("utf-8")).hexdigest()
+
+
+async def _produce(
+    key: str, flight: _Flight, upstream: AsyncIterator[Dict[str, Any]], requested: float
+) -> None:
+    QUEUE_WAIT.observe(time.perf_counter() - requested)
+    try:
+        async for chunk in upstream:
+            flight.chunks.append(chunk)
+            flight.notify()
+    except asyncio.CancelledError:
+        raise
+    except Exception as e:
+        flight.chunks.append({"error": f"Ollama error: {str(e)}"})
+    finally:
+        flight.done = True
+        flight.notify()
+        if _IN_FLIGHT.get(key) is flight:
+            del _IN_FLIGHT[key]
+
+
+async def _single_flight(
+    key: str, factory: Callable[[], AsyncIterator[Dict[str, Any]]]
+) -> AsyncIterator[Dict[str, Any]]:
+    """
+    Join the in-flight generation for key, or start it.
+
+    Late joiners replay the chunks produced so far, so every subscriber
+    sees the full stream. The upstream is cancelled once the last
+    subscriber stops reading.
+    """
+    flight = _IN_FLIGHT.get(key)
+    if flight is None:
+        flight = _Flight(key)
+        _IN_FLIGHT[key] = flight
+        flight.task = asyncio.create_task(_produce(key, flight, factory(), time.perf_counter()))
+        GENERATIONS.labels("upstream").inc()
+    else:
+        GENERATIONS.labels("coalesced").inc()
+        log.info(f"Coalesced duplicate generation ({flight.subscribers} already waiting)")
 
+    async for chunk in flight.subscribe():
+        yield chunk
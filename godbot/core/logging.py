@@ -7,14 +7,20 @@ Provides:
     - Console logs
     - JSON log option (future)
     - Automatic logs directory creation
+    - EVENTS: in-process event bus (log lines, latencies) for the dashboard
 """
 
 from __future__ import annotations
 
+import asyncio
+import itertools
 import logging
 import logging.handlers
 import os
-from typing import Optional
+import threading
+import time
+from collections import deque
+from typing import Any, Deque, Dict, List, Optional
 
 
 LOG_DIR = "logs"
@@ -27,6 +33,125 @@ def ensure_log_dir():
         os.makedirs(LOG_DIR)
 
 
+# -----------------------------
+# EVENT BUS
+# -----------------------------
+
+Event = Dict[str, Any]  # {"id": int, "type": str, "ts": float, "data": ...}
+
+
+class Subscription:
+    """
+    One consumer of the event bus.
+
+    Events wait in a bounded deque. When a slow consumer falls behind the
+    oldest events are dropped (and counted) instead of buffering without
+    bound.
+    """
+
+    def __init__(self, maxlen: int = 256, loop: Optional[asyncio.AbstractEventLoop] = None):
+        self.events: Deque[Event] = deque(maxlen=maxlen)
+        self.dropped = 0
+        self._ready = threading.Event()
+        # Async consumers (see wait()) are woken on their own loop
+        self._loop = loop
+        self._async_ready = asyncio.Event() if loop is not None else None
+
+    def push(self, event: Event) -> None:
+        if len(self.events) == self.events.maxlen:
+            self.dropped += 1
+        self.events.append(event)
+        self._ready.set()
+        if self._loop is not None:
+            try:
+                self._loop.call_soon_threadsafe(self._async_ready.set)
+            except RuntimeError:
+                pass  # loop closed
+
+    async def wait(self, timeout: Optional[float] = None) -> List[Event]:
+        """Async version of get() for subscribers created with a loop."""
+        if not self.events:
+            try:
+                await asyncio.wait_for(self._async_ready.wait(), timeout)
+            except asyncio.TimeoutError:
+                pass
+        self._async_ready.clear()
+        return self._drain()
+
+    def get(self, timeout: Optional[float] = None) -> List[Event]:
+        """Wait up to timeout for events, then return (and clear) all pending ones."""
+        if not self.events:
+            self._ready.wait(timeout)
+        self._ready.clear()
+        return self._drain()
+
+    def _drain(self) -> List[Event]:
+        out = []
+        while self.events:
+            out.append(self.events.popleft())
+        return out
+
+
+class EventBus:
+    """Thread-safe fan-out of events with a ring buffer of recent history."""
+
+    def __init__(self, history: int = 1000):
+        self.history: Deque[Event] = deque(maxlen=history)
+        self.subscribers: List[Subscription] = []
+        self._ids = itertools.count(1)
+        self._lock = threading.Lock()
+
+    def publish(self, type: str, data: Any) -> Event:
+        event = {"id": next(self._ids), "type": type, "ts": time.time(), "data": data}
+        with self._lock:
+            self.history.append(event)
+            subscribers = list(self.subscribers)
+        for sub in subscribers:
+            sub.push(event)
+        return event
+
+    def recent(self, type: Optional[str] = None, limit: int = 100) -> List[Event]:
+        with self._lock:
+            events = [e for e in self.history if type is None or e["type"] == type]
+        return events[-limit:]
+
+    def subscribe(
+        self, replay: int = 0, maxlen: int = 256, loop: Optional[asyncio.AbstractEventLoop] = None
+    ) -> Subscription:
+        sub = Subscription(maxlen, loop)
+        with self._lock:
+            for event in list(self.history)[-replay:] if replay else []:
+                sub.push(event)
+            self.subscribers.append(sub)
+        return sub
+
+    def unsubscribe(self, sub: Subscription) -> None:
+        with self._lock:
+            if sub in self.subscribers:
+                self.subscribers.remove(sub)
+
+
+EVENTS = EventBus()
+
+
+class EventBusHandler(logging.Handler):
+    """Logging handler publishing each record to the event bus as a "log" event."""
+
+    def __init__(self, bus: EventBus, level=logging.INFO):
+        super().__init__(level)
+        self.bus = bus
+        self.setFormatter(logging.Formatter("%(asctime)s [%(levelname)s] %(name)s: %(message)s"))
+
+    def emit(self, record: logging.LogRecord) -> None:
+        try:
+            self.bus.publish("log", {"level": record.levelname, "logger": record.name, "line": self.format(record)})
+        except Exception:
+            self.handleError(record)
+
+
+EVENT_HANDLER = EventBusHandler(EVENTS)
+
+
 def get_logger(name: str) -> logging.Logger:
     """
     Centralized logger for all GodBot modules.
@@ -59,6 +184,9 @@ def get_logger(name: str) -> logging.Logger:
     file_handler.setFormatter(file_fmt)
     logger.addHandler(file_handler)
 
+    # Live stream for the dashboard (/events)
+    logger.addHandler(EVENT_HANDLER)
+
     return logger
 
 
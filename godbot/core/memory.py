@@ -1,6 +1,10 @@
 # GodBot core memory module
 import sqlite3
 
+from godbot.core.metrics import histogram
+
+SQLITE_WRITE = histogram("godbot_sqlite_write_seconds", "SQLite write latency (incl. commit)", labels=("db",))
+
 class MemoryDB:
     def __init__(self, filename):
         self.conn = sqlite3.connect(filename, check_same_thread=False)
@@ -19,11 +23,12 @@ class MemoryDB:
         self.conn.commit()
     
     def save(self, user_id, role, content):
-        self.conn.execute(
-            "INSERT INTO memory (user_id, role, content) VALUES (?, ?, ?)",
-            (user_id, role, content)
-        )
-        self.conn.commit()
+        with SQLITE_WRITE.labels("long_memory").time():
+            self.conn.execute(
+                "INSERT INTO memory (user_id, role, content) VALUES (?, ?, ?)",
+                (user_id, role, content)
+            )
+            self.conn.commit()
     
     def get_recent(self, user_id, limit=10):
         cur = self.conn.cursor()
@@ -0,0 +1,165 @@
+# GodBot core model catalog
+"""
+In-memory catalog of the models installed in Ollama.
+
+/api/tags is fetched asynchronously on an interval (see
+scheduled_tasks/model_refresh.py) and on demand, never from a keystroke.
+Autocomplete, /models and the dashboard all read from the catalog.
+Lookups use sorted indexes of lowercase names and name tokens, so prefix
+matches are a bisect; substring matches fill in after them.
+"""
+import asyncio
+import bisect
+import re
+import time
+from typing import Any, Awaitable, Callable, Dict, List, Optional
+
+# Phase 11.1 logging
+from godbot.core.logging import get_logger
+
+log = get_logger(__name__)
+
+REFRESH_INTERVAL = 300  # seconds
+
+_TOKEN_SPLIT = re.compile(r"[:/\-_.]+")
+
+
+class ModelInfo:
+    def __init__(self, name: str, size: int = 0, family: str = "", parameter_size: str = "",
+                 quantization: str = "", modified_at: str = "", digest: str = ""):
+        self.name = name
+        self.size = size
+        self.family = family
+        self.parameter_size = parameter_size
+        self.quantization = quantization
+        self.modified_at = modified_at
+        self.digest = digest
+
+    @classmethod
+    def from_tags(cls, entry: Dict[str, Any]) -> "ModelInfo":
+        details = entry.get("details") or {}
+        return cls(
+            name=entry["name"],
+            size=entry.get("size", 0),
+            family=details.get("family", ""),
+            parameter_size=details.get("parameter_size", ""),
+            quantization=details.get("quantization_level", ""),
+            modified_at=entry.get("modified_at", ""),
+            digest=entry.get("digest", ""),
+        )
+
+    @property
+    def size_gb(self) -> float:
+        return self.size / (1024 ** 3)
+
+    def describe(self) -> str:
+        """Short "7B Q4_0 llama, 4.1 GB" summary for display."""
+        parts = [p for p in (self.parameter_size, self.quantization, self.family) if p]
+        return f"{' '.join(parts)}, {self.size_gb:.1f} GB" if parts else f"{self.size_gb:.1f} GB"
+
+    def to_dict(self) -> Dict[str, Any]:
+        return dict(vars(self), size_gb=round(self.size_gb, 2))
+
+
+class ModelCatalog:
+    def __init__(self, fetch: Optional[Callable[[], Awaitable[List[Dict[str, Any]]]]] = None,
+                 refresh_interval: float = REFRESH_INTERVAL):
+        if fetch is None:
+            from godbot.core.llm import get_router
+
+            def fetch():
+                return get_router().list_models()  # union over the Ollama backends
+        self.fetch = fetch
+        self.refresh_interval = refresh_interval
+        self.models: Dict[str, ModelInfo] = {}
+        self.last_refresh = 0.0
+        self.last_error: Optional[str] = None
+        self._names: List[str] = []  # sorted lowercase names
+        self._tokens: List[tuple] = []  # sorted (token, name)
+        self._by_lower: Dict[str, str] = {}  # lowercase -> real name
+        self._refreshing: Optional[asyncio.Task] = None
+
+    # -----------------------------
+    # REFRESH
+    # -----------------------------
+
+    @property
+    def stale(self) -> bool:
+        return not self.models or time.time() - self.last_refresh > self.refresh_interval
+
+    async def refresh(self) -> bool:
+        """Fetch /api/tags now (concurrent callers share one request)."""
+        if self._refreshing is None or self._refreshing.done():
+            self._refreshing = asyncio.create_task(self._refresh())
+        return await asyncio.shield(self._refreshing)
+
+    def refresh_in_background(self) -> None:
+        """Kick off a refresh if the catalog is stale; don't wait for it."""
+        if self.stale and (self._refreshing is None or self._refreshing.done()):
+            self._refreshing = asyncio.create_task(self._refresh())
+
+    async def _refresh(self) -> bool:
+        try:
+            entries = await self.fetch()
+        except Exception as e:
+            self.last_error = str(e)
+            log.warning(f"Model catalog refresh failed: {e}")
+            return False
+        self._load(entries)
+        self.last_error = None
+        return True
+
+    def _load(self, entries: List[Dict[str, Any]]) -> None:
+        models = {e["name"]: ModelInfo.from_tags(e) for e in entries if e.get("name")}
+        self._names = sorted(n.lower() for n in models)
+        self._tokens = sorted(
+            (token, name.lower()) for name in models for token in _TOKEN_SPLIT.split(name.lower()) if token
+        )
+        self._by_lower = {n.lower(): n for n in models}
+        self.models = models
+        self.last_refresh = time.time()
+
+    # -----------------------------
+    # LOOKUP
+    # -----------------------------
+
+    def get(self, name: str) -> Optional[ModelInfo]:
+        return self.models.get(name)
+
+    def __contains__(self, name: str) -> bool:
+        return name in self.models
+
+    def __len__(self) -> int:
+        return len(self.models)
+
+    def names(self) -> List[str]:
+        return [self._by_lower[n] for n in self._names]
+
+    def search(self, query: str, limit: int = 25) -> List[str]:
+        """Names matching query: full-name prefix, then token prefix, then substring."""
+        if not self.models:
+            return []
+        q = query.lower().strip()
+        if not q:
+            return self.names()[:limit]
+
+        seen: Dict[str, None] = {}  # ordered set
+
+        i = bisect.bisect_left(self._names, q)
+        while i < len(self._names) and self._names[i].startswith(q) and len(seen) < limit:
+            seen.setdefault(self._names[i])
+            i += 1
+
+        i = bisect.bisect_left(self._tokens, (q,))
+        while i < len(self._tokens) and self._tokens[i][0].startswith(q) and len(seen) < limit:
+            seen.setdefault(self._tokens[i][1])
+            i += 1
+
+        if len(seen) < limit:
+            for name in self._names:
+                if q in name:
+                    seen.setdefault(name)
+                    if len(seen) >= limit:
+                        break
+
+        return [self._by_lower[n] for n in seen]
@@ -0,0 +1,186 @@
+# GodBot core model lifecycle
+"""
+Keeps the models we need loaded in Ollama and frees the ones we don't.
+
+- preload() loads a model ahead of the first request (on /setmodel and at
+  startup), so users don't pay the load time
+- keep_alive_for() picks the keep_alive sent with every request: a
+  per-model override, "forever" (-1) for the pinned model during its
+  pinned hours, or the default
+- tick() (scheduled) pins/unpins the default model when its hours start or
+  end and unloads specialist agent models that have gone idle
+
+Load and unload events go to the event bus ("model" events) for the
+dashboard.
+"""
+import asyncio
+import time
+from collections import deque
+from datetime import datetime
+from typing import Any, Awaitable, Callable, Deque, Dict, Iterable, Optional, Tuple
+
+# Phase 11.1 logging
+from godbot.core.logging import EVENTS, get_logger
+from godbot.core.metrics import histogram
+
+log = get_logger(__name__)
+
+MODEL_LOAD = histogram(
+    "godbot_model_load_seconds", "Model load time in Ollama", labels=("model",),
+    buckets=(0.1, 0.5, 1, 2.5, 5, 10, 20, 30, 60, 120),
+)
+
+
+def parse_hours(spec: Optional[str]) -> Optional[Tuple[int, int]]:
+    """"8-23" -> (8, 23): hours 8:00 up to 23:00 local. Wraps past midnight ("22-6")."""
+    if not spec:
+        return None
+    start, end = (int(h) for h in spec.split("-", 1))
+    if not (0 <= start <= 23 and 0 <= end <= 24):
+        raise ValueError(f"bad hour range: {spec!r}")
+    return start, end
+
+
+def parse_keep_alive_overrides(spec: Optional[str]) -> Dict[str, str]:
+    """"llama3:8b=1h,mistral:7b=10m" -> {"llama3:8b": "1h", "mistral:7b": "10m"}"""
+    out = {}
+    for item in (spec or "").split(","):
+        if "=" in item:
+            model, value = item.split("=", 1)
+            out[model.strip()] = value.strip()
+    return out
+
+
+class ModelLifecycle:
+    def __init__(
+        self,
+        default_keep_alive: Any = "30m",
+        overrides: Optional[Dict[str, Any]] = None,
+        pinned_model: Optional[str] = None,
+        pinned_hours: Optional[Tuple[int, int]] = None,
+        agent_idle: float = 900,
+        load: Optional[Callable[..., Awaitable[Dict[str, Any]]]] = None,
+        loaded: Optional[Callable[[], Awaitable[list]]] = None,
+        clock: Callable[[], datetime] = datetime.now,
+    ):
+        if load is None or loaded is None:
+            from godbot.core.llm import get_router
+
+            # Resolved per call: the router is configured after the bot is built
+            load = load or (lambda model, keep_alive: get_router().load_model(model, keep_alive))
+            loaded = loaded or (lambda: get_router().loaded_models())
+        self.default_keep_alive = default_keep_alive
+        self.overrides = dict(overrides or {})
+        self.pinned_model = pinned_model
+        self.pinned_hours = pinned_hours
+        self.agent_idle = agent_idle
+        self._load = load
+        self._loaded = loaded
+        self._clock = clock
+        self.last_used: Dict[str, float] = {}
+        self.events: Deque[Dict[str, Any]] = deque(maxlen=100)
+        self._pinned_now = False
+        self._loading: Dict[str, asyncio.Task] = {}
+
+    # -----------------------------
+    # KEEP-ALIVE POLICY
+    # -----------------------------
+
+    def in_pinned_hours(self) -> bool:
+        if not self.pinned_hours:
+            return False
+        start, end = self.pinned_hours
+        hour = self._clock().hour
+        return start <= hour < end if start <= end else hour >= start or hour < end
+
+    def keep_alive_for(self, model: str) -> Any:
+        """keep_alive for a request to model (also records the use)."""
+        self.last_used[model] = time.time()
+        if model == self.pinned_model and self.in_pinned_hours():
+            return -1
+        return self.overrides.get(model, self.default_keep_alive)
+
+    # -----------------------------
+    # LOAD / UNLOAD
+    # -----------------------------
+
+    def _event(self, model: str, action: str, seconds: Optional[float] = None, **extra) -> None:
+        event = {"model": model, "action": action, "seconds": seconds, "ts": time.time(), **extra}
+        self.events.append(event)
+        EVENTS.publish("model", event)
+
+    async def preload(self, model: str, reason: str = "") -> Optional[float]:
+        """Load model now; concurrent preloads of one model share a request. Returns load seconds."""
+        task = self._loading.get(model)
+        if task is None or task.done():
+            task = self._loading[model] = asyncio.create_task(self._preload(model, reason))
+        return await asyncio.shield(task)
+
+    async def _preload(self, model: str, reason: str) -> Optional[float]:
+        keep_alive = self.keep_alive_for(model)
+        start = time.perf_counter()
+        try:
+            result = await self._load(model, keep_alive)
+        except Exception as e:
+            log.warning(f"Preloading {model} failed: {e}")
+            self._event(model, "load_failed", error=str(e), reason=reason)
+            return None
+        wall = time.perf_counter() - start
+        # load_duration is ~0 when the model was already resident
+        seconds = result.get("load_duration", wall * 1e9) / 1e9
+        MODEL_LOAD.labels(model).observe(seconds)
+        log.info(f"Loaded {model} in {seconds:.1f}s (keep_alive={keep_alive}, {reason or 'preload'})")
+        self._event(model, "loaded", seconds, keep_alive=keep_alive, reason=reason)
+        return seconds
+
+    async def unload(self, model: str, reason: str = "") -> bool:
+        try:
+            await self._load(model, 0)
+        except Exception as e:
+            log.warning(f"Unloading {model} failed: {e}")
+            return False
+        self.last_used.pop(model, None)
+        log.info(f"Unloaded {model} ({reason or 'unload'})")
+        self._event(model, "unloaded", reason=reason)
+        return True
+
+    def switch(self, model: str) -> "asyncio.Task":
+        """Called on /setmodel: warm the new model in the background."""
+        return asyncio.create_task(self.preload(model, reason="switch"))
+
+    # -----------------------------
+    # PERIODIC
+    # -----------------------------
+
+    async def tick(self, current_model: str, agent_models: Iterable[str] = ()) -> None:
+        """Pin/unpin the default model on its hours and unload idle agent models."""
+        pinned = self.in_pinned_hours()
+        if self.pinned_model and pinned != self._pinned_now:
+            self._pinned_now = pinned
+            # Re-sending the model with the new keep_alive resets Ollama's timer
+            await self.preload(self.pinned_model, reason="pin" if pinned else "unpin")
+
+        idle_before = time.time() - self.agent_idle
+        protected = {current_model, self.pinned_model}
+        candidates = set(agent_models) - protected
+        if not candidates:
+            return
+        try:
+            loaded = {m.get("name") for m in await self._loaded()}
+        except Exception as e:
+            log.warning(f"Could not list loaded models: {e}")
+            return
+        for model in candidates & loaded:
+            if self.last_used.get(model, 0) < idle_before:
+                await self.unload(model, reason="idle agent model")
+
+    def status(self) -> Dict[str, Any]:
+        return {
+            "default_keep_alive": self.default_keep_alive,
+            "overrides": self.overrides,
+            "pinned_model": self.pinned_model,
+            "pinned_hours": self.pinned_hours,
+            "pinned_now": self.in_pinned_hours() if self.pinned_model else False,
+            "last_used": self.last_used,
+            "events": list(self.events),
+        }
@@ -0,0 +1,371 @@
+# GodBot core reply post-processing
+"""
+Cleans model output before it reaches Discord, with a few precompiled
+regexes instead of chained str.replace calls.
+
+    cleaner = PostProcessor("God Bot")
+    cleaner.process(text)          # a whole reply
+
+    stream = cleaner.stream()      # while streaming
+    shown += stream.feed(chunk)    # cleaned text that won't change anymore
+    shown += stream.finish()
+
+The rules are the tables below:
+
+- ROLE_PREFIXES: stripped from the start of the reply, along with
+  quotes wrapping the whole reply
+- REWRITES: identity fixes, applied in one alternation pass
+- DROP_SENTENCES: sentences containing assistant boilerplate are removed
+- DROP_LINES: transcript-looking lines ("- user: hi", role labels,
+  "hi = hello") are removed
+
+Text inside ``` code fences is passed through untouched. Elsewhere runs
+of spaces are collapsed to one, and runs of blank lines to one.
+
+process() is finish() on a fresh stream, so the live text and the final
+reply always agree. Given the whole reply at once it takes a shortcut:
+each rule runs once over the full text instead of line by line. While
+streaming, text is released a sentence at a time: a line is kept or
+dropped once its first LINE_LOOKAHEAD characters (or its end) are in,
+a sentence once the next one has started, and code a line at a time.
+"""
+import re
+from typing import Dict, List, Optional
+
+# Phase 11.1 logging
+from godbot.core.logging import get_logger
+
+log = get_logger(__name__)
+
+ROLE_PREFIXES = ("Reply:", "Response:", "God Bot:", "Assistant:", "User:")
+
+# {bot_name} is filled in; the longest match wins
+REWRITES: Dict[str, str] = {
+    "Seeing as I am a Dolphin,": "",
+    "As a Dolphin,": "",
+    "As Dolphin,": "",
+    "as Dolphin,": "",
+    "I am a Dolphin": "I'm just chilling",
+    "I'm a Dolphin": "I'm good",
+    "My name is Dolphin": "My name is {bot_name}",
+    "I am Dolphin": "I am {bot_name}",
+    "I'm Dolphin": "I'm {bot_name}",
+    "Dolphin": "{bot_name}",
+    "/\\": "",
+    "/ \\": "",
+}
+
+# Case-insensitive
+DROP_SENTENCES = (
+    "as an AI",
+    "I'm an AI",
+    "I am an AI",
+    "I don't have personal experiences",
+    "I don't possess that capability",
+    "I don't have that capability",
+    "I strive to provide",
+    "I can help you with",
+    "If you'd like, I could",
+    "If you'd like, you could",
+    "I'll do my best to assist",
+    "I'll do my best to help",
+    "I don't have access to",
+    "I'm not able to",
+    "I cannot",
+    "It's my pleasure to be here",
+    "Don't hesitate to reach out",
+    "if you have any questions",
+    "need assistance",
+    "engage in friendly conversations",
+    "How can I assist you today",
+    "How can I help you today",
+    "Is there anything else I can",
+    "How's your day going",
+    "Have a fantastic day",
+    "Have a great day",
+    "Have a wonderful day",
+    "Have a nice day",
+)
+
+# Matched at the start of a line (after indentation), case-insensitive;
+# {bot_name} is filled in
+DROP_LINES = (
+    r"(?:[-*][^\S\n]?)?(?:user|assistant|god bot|{bot_name}):",  # role labels, also as bullets: "- user: ..."
+    r"(?=[^\n]{0,29}$)[^\n]* = ",  # short "hi = hello" definitions
+)
+
+LINE_LOOKAHEAD = 32  # characters (after indentation) that decide a line's fate
+_QUOTES = "\"'"
+_FENCE = "```"
+_SENTENCE_END = re.compile(r"[.!?]+[\"')\]]*\s+(?=\S)")
+_SENTENCE = re.compile(r".*?(?:[.!?]+[\"')\]]*\s*|$)", re.S)
+_SENTENCE_START = re.compile(r"[.!?]+[\"')\]]*[^\S\n]*|\n")  # a sentence starts where these end
+_SENTENCE_STOP = re.compile(r"[.!?]+[\"')\]]*[^\S\n]*|(?=\n)")
+_TRAILING_SPACE = re.compile(r"[^\S\n]+$", re.M)
+_SPACE_RUN = re.compile(r"(?<=\S)[^\S\n]+")  # only run when "  " or a tab is in the text
+_BLANK_RUN = re.compile(r"\n{3,}")
+
+
+def _collapse_spaces(text: str) -> str:
+    if "  " in text or "\t" in text:
+        return _SPACE_RUN.sub(" ", text)
+    return text
+
+
+def _alternation(words) -> str:
+    """
+    Regex matching any of words, factored into a trie ("ab|ac" -> "a(?:b|c)").
+
+    re tries alternatives one by one at every position; sharing prefixes
+    makes a long phrase table several times cheaper to search. Where one
+    word is a prefix of another the longer one wins.
+    """
+    root: dict = {}
+    for word in words:
+        node = root
+        for ch in word:
+            node = node.setdefault(ch, {})
+        node[""] = {}
+
+    def build(node) -> str:
+        branches = [re.escape(ch) + build(child) for ch, child in sorted(node.items()) if ch]
+        if not branches:
+            return ""
+        pattern = branches[0] if len(branches) == 1 else "(?:" + "|".join(branches) + ")"
+        return f"(?:{pattern})?" if "" in node else pattern
+
+    return build(root)
+
+
+class PostProcessor:
+    def __init__(self, bot_name: str = "God Bot"):
+        self.bot_name = bot_name
+        self.prefix_re = re.compile("|".join(re.escape(p) + r"\s*" for p in ROLE_PREFIXES), re.I)
+        self._prefix_lower = [p.lower() for p in ROLE_PREFIXES]
+        self.rewrites = {k: v.format(bot_name=bot_name) for k, v in REWRITES.items()}
+        self.rewrite_re = re.compile(_alternation(REWRITES))
+        # Searched in lowercased text: much faster than re.I on an alternation
+        self.drop_sentence_re = re.compile(_alternation(p.lower() for p in DROP_SENTENCES))
+        rules = "|".join(DROP_LINES).replace("{bot_name}", re.escape(bot_name))
+        # A role label must fit in the lookahead for the stream to recognise it
+        self.line_lookahead = max(LINE_LOOKAHEAD, len(bot_name) + 4)
+        self.drop_line_re = re.compile(rf"[^\S\n]*(?:{rules})", re.I)
+        self.drop_lines_re = re.compile(rf"^[^\S\n]*(?:{rules})[^\n]*\n?", re.I | re.M)
+
+    def stream(self) -> "StreamCleaner":
+        return StreamCleaner(self)
+
+    def process(self, text: str) -> str:
+        return self.stream().finish(text).strip()
+
+    def rewrite(self, text: str) -> str:
+        return self.rewrite_re.sub(lambda m: self.rewrites[m.group(0)], text)
+
+    def drop_sentences(self, text: str) -> str:
+        """Remove the sentences containing a DROP_SENTENCES phrase."""
+        lower = text.lower()
+        m = self.drop_sentence_re.search(lower)
+        if m is None:
+            return text
+        if len(lower) != len(text):
+            # Lowercasing changed offsets (some non-ASCII letters): sentence by sentence
+            return "\n".join(
+                "".join(s for s in _SENTENCE.findall(line) if not self.drop_sentence_re.search(s.lower()))
+                for line in text.split("\n")
+            )
+        kept = []
+        start = 0
+        while m is not None:
+            begin = start
+            for boundary in _SENTENCE_START.finditer(text, start, m.start()):
+                begin = boundary.end()
+            stop = _SENTENCE_STOP.search(text, m.end())
+            end = stop.end() if stop else len(text)
+            kept.append(text[start:begin])
+            start = end
+            m = self.drop_sentence_re.search(lower, end)
+        kept.append(text[start:])
+        return "".join(kept)
+
+    def clean_text(self, text: str) -> str:
+        """Every rule at once on complete lines without code fences (the process() fast path)."""
+        text = self.drop_sentences(self.rewrite(self.drop_lines_re.sub("", text)))
+        if " \n" in text or "\t" in text:
+            text = _TRAILING_SPACE.sub("", text)
+        text = _collapse_spaces(text)
+        if "\n\n\n" in text:
+            text = _BLANK_RUN.sub("\n\n", text)
+        return text.strip()
+
+    def maybe_prefix(self, text: str) -> bool:
+        """True if text could still grow into a role prefix."""
+        lower = text.lower()
+        return any(p.startswith(lower) for p in self._prefix_lower)
+
+
+class StreamCleaner:
+    """Incremental PostProcessor state for one reply."""
+
+    def __init__(self, processor: PostProcessor):
+        self._p = processor
+        self._buf = ""
+        self._started = False  # role prefixes / opening quote handled
+        self._quote: Optional[str] = None  # opening quote not decided yet
+        self._wrapper: Optional[str] = None  # quote wrapping the whole reply
+        self._line: Optional[str] = None  # None (undecided), "keep", "drop" or "code"
+        self._in_code = False
+        self._newlines = 0  # line breaks owed before the next text
+        self._fresh = True  # no segment of the current line seen yet
+        self._space = False  # a space is owed before the next text on this line
+        self._emitted = False
+
+    def feed(self, chunk: str) -> str:
+        self._buf += chunk
+        return self._drain(final=False)
+
+    def finish(self, chunk: str = "") -> str:
+        """Flush everything (the last chunk may be passed in)."""
+        self._buf += chunk
+        return self._drain(final=True)
+
+    # ---- stages ----
+
+    def _start(self, final: bool) -> bool:
+        """Strip role prefixes and an opening quote; False while undecided."""
+        while True:
+            text = self._buf.lstrip()
+            if not text:
+                self._buf = ""
+                return final
+            if self._quote is None and text[0] in _QUOTES:
+                self._quote = text[0]
+                self._buf = text[1:]
+                continue
+            m = self._p.prefix_re.match(text)
+            if m:
+                self._buf = text[m.end():]
+                continue
+            if not final and self._p.maybe_prefix(text):
+                self._buf = text
+                return False
+            self._buf = text
+            return True
+
+    def _decide_quote(self, final: bool) -> bool:
+        """
+        Is the opening quote a wrapper or part of a quoted phrase? Decided on
+        the first line: a one-line reply ending in the quote is wrapped, and
+        otherwise the quote is kept if it shows up again on that line.
+        """
+        buf, quote = self._buf, self._quote
+        nl = buf.find("\n")
+        if nl < 0 and not final:
+            return False
+        self._quote = None
+        if nl < 0 and buf.rstrip().endswith(quote):
+            self._buf = buf.rstrip()[:-1]
+        elif quote in (buf if nl < 0 else buf[:nl]):
+            self._buf = quote + buf
+        else:
+            self._wrapper = quote
+        return True
+
+    def _emit(self, out: List[str], text: str, code: bool = False) -> None:
+        first, self._fresh = self._fresh, False
+        if not code:
+            text = _collapse_spaces(text)
+        body = text.rstrip()
+        if not first and not code:
+            # Only a line's first segment keeps its indentation
+            self._space = self._space or body[:1].isspace()
+            body = body.lstrip()
+        if not body:
+            self._space = self._space or bool(text)
+            return
+        if not self._emitted:
+            body = body.lstrip()
+        elif self._newlines:
+            out.append("\n" * (self._newlines if code else min(self._newlines, 2)))
+        elif self._space:
+            out.append(" ")
+        self._newlines = 0
+        self._space = len(body) < len(text)
+        self._emitted = True
+        out.append(body)
+
+    def _end_line(self) -> None:
+        self._line = None
+        self._newlines += 1
+        self._fresh = True
+        self._space = False
+
+    def _drain(self, final: bool) -> str:
+        out: List[str] = []
+        if not self._started:
+            self._started = self._start(final)
+            if not self._started:
+                return ""
+        if self._quote is not None and not self._decide_quote(final):
+            return ""
+        if final and self._wrapper is not None and self._buf.rstrip().endswith(self._wrapper):
+            self._buf = self._buf.rstrip()[:-1]
+
+        if final and not self._emitted and self._line is None and _FENCE not in self._buf:
+            # Whole reply at once: whole-text regex passes instead of the line loop
+            text = self._p.clean_text(self._buf)
+            self._buf = ""
+            if text:
+                self._emit(out, text, code=True)
+            return "".join(out)
+
+        while self._buf:
+            buf = self._buf
+            nl = buf.find("\n")
+            line = buf if nl < 0 else buf[:nl]
+
+            if self._line is None:
+                stripped = line.lstrip()
+                if nl < 0 and not final and (self._in_code or len(stripped) < self._p.line_lookahead):
+                    break  # code goes out a whole line at a time; prose once it can be classified
+                if stripped.startswith(_FENCE):
+                    self._in_code = not self._in_code
+                    self._line = "code"
+                elif self._in_code:
+                    self._line = "code"
+                elif not stripped:
+                    # Blank line (only complete ones get here)
+                    self._buf = buf[nl + 1:] if nl >= 0 else ""
+                    self._newlines += 1
+                    continue
+                elif self._p.drop_line_re.match(line):
+                    self._line = "drop"
+                else:
+                    self._line = "keep"
+
+            if self._line == "drop":
+                self._buf = buf[nl + 1:] if nl >= 0 else ""
+                if nl >= 0:
+                    self._line = None
+                continue
+
+            if (not final and nl >= 0 and self._wrapper is not None and line.rstrip().endswith(self._wrapper)
+                    and not buf[nl + 1:].strip()):
+                break  # maybe the closing quote of a wrapped reply
+            if nl >= 0:
+                segment, self._buf = line, buf[nl + 1:]
+            elif final:
+                segment, self._buf = buf, ""
+            elif self._line == "code":
+                break
+            else:
+                ends = list(_SENTENCE_END.finditer(buf))
+                if not ends:
+                    break
+                segment, self._buf = buf[:ends[-1].end()], buf[ends[-1].end():]
+
+            if self._line == "keep":
+                segment = self._p.drop_sentences(self._p.rewrite(segment))
+            self._emit(out, segment, code=self._line == "code")
+            if nl >= 0:
+                self._end_line()
+        return "".join(out)
@@ -0,0 +1,199 @@
+# GodBot core reminders
+"""
+Persistent reminders driven by a single timer coroutine.
+
+ReminderStore keeps reminders in SQLite (indexed on due time) so they
+survive restarts. ReminderService keeps a min-heap of (due, id) and one
+coroutine that sleeps until the earliest reminder, instead of one sleeping
+task per reminder. Recurring reminders are rescheduled after they fire.
+Each reminder is sent in its own task (bounded by send_timeout), so a slow
+channel fetch doesn't hold up the others.
+"""
+import asyncio
+import heapq
+import sqlite3
+import threading
+import time
+from typing import Awaitable, Callable, List, Optional, Set, Tuple
+
+# Phase 11.1 logging
+from godbot.core.logging import get_logger
+from godbot.core.memory import SQLITE_WRITE
+
+log = get_logger(__name__)
+
+
+class Reminder:
+    def __init__(self, id, user_id, channel_id, message, due, repeat=None, created=None):
+        self.id = id
+        self.user_id = str(user_id)
+        self.channel_id = str(channel_id)
+        self.message = message
+        self.due = due
+        self.repeat = repeat  # seconds between occurrences, None = one-shot
+        self.created = created
+
+    def __repr__(self) -> str:
+        return f"Reminder(id={self.id}, due={self.due}, repeat={self.repeat})"
+
+
+class ReminderStore:
+    _COLUMNS = "id, user_id, channel_id, message, due, repeat, created"
+
+    def __init__(self, filename):
+        self.conn = sqlite3.connect(filename, check_same_thread=False)
+        self.lock = threading.Lock()
+        self.create()
+
+    def create(self):
+        self.conn.execute("""
+        CREATE TABLE IF NOT EXISTS reminders (
+            id INTEGER PRIMARY KEY AUTOINCREMENT,
+            user_id TEXT,
+            channel_id TEXT,
+            message TEXT,
+            due REAL,
+            repeat REAL,
+            created REAL
+        )
+        """)
+        self.conn.execute("CREATE INDEX IF NOT EXISTS idx_reminders_due ON reminders (due)")
+        self.conn.commit()
+
+    def add(self, user_id, channel_id, message: str, due: float, repeat: Optional[float] = None) -> Reminder:
+        created = time.time()
+        with self.lock, SQLITE_WRITE.labels("reminders").time():
+            cur = self.conn.execute(
+                "INSERT INTO reminders (user_id, channel_id, message, due, repeat, created) VALUES (?, ?, ?, ?, ?, ?)",
+                (str(user_id), str(channel_id), message, due, repeat, created),
+            )
+            self.conn.commit()
+        return Reminder(cur.lastrowid, user_id, channel_id, message, due, repeat, created)
+
+    def get(self, reminder_id: int) -> Optional[Reminder]:
+        row = self.conn.execute(f"SELECT {self._COLUMNS} FROM reminders WHERE id=?", (reminder_id,)).fetchone()
+        return Reminder(*row) if row else None
+
+    def pending(self) -> List[Reminder]:
+        rows = self.conn.execute(f"SELECT {self._COLUMNS} FROM reminders ORDER BY due").fetchall()
+        return [Reminder(*row) for row in rows]
+
+    def list_for(self, user_id) -> List[Reminder]:
+        rows = self.conn.execute(
+            f"SELECT {self._COLUMNS} FROM reminders WHERE user_id=? ORDER BY due", (str(user_id),)
+        ).fetchall()
+        return [Reminder(*row) for row in rows]
+
+    def reschedule(self, reminder_id: int, due: float) -> None:
+        with self.lock, SQLITE_WRITE.labels("reminders").time():
+            self.conn.execute("UPDATE reminders SET due=? WHERE id=?", (due, reminder_id))
+            self.conn.commit()
+
+    def delete(self, reminder_id: int, user_id=None) -> bool:
+        """Delete a reminder (only if it belongs to user_id, when given)."""
+        sql, args = "DELETE FROM reminders WHERE id=?", [reminder_id]
+        if user_id is not None:
+            sql += " AND user_id=?"
+            args.append(str(user_id))
+        with self.lock, SQLITE_WRITE.labels("reminders").time():
+            cur = self.conn.execute(sql, args)
+            self.conn.commit()
+        return cur.rowcount > 0
+
+
+class ReminderService:
+    """One coroutine firing every reminder in the store when it comes due."""
+
+    def __init__(self, store: ReminderStore, send: Callable[[Reminder], Awaitable[None]], send_timeout: float = 30.0):
+        self.store = store
+        self.send = send
+        self.send_timeout = send_timeout
+        self.running = False
+        self._heap: List[Tuple[float, int]] = []  # (due, reminder id)
+        self._pending: Set[int] = set()  # ids in the heap still to fire
+        self._cancelled: Set[int] = set()  # ids in the heap to skip when popped
+        self._wake = asyncio.Event()
+        self._sending: Set[asyncio.Task] = set()
+
+    def add(self, user_id, channel_id, message: str, delay: float, repeat: Optional[float] = None) -> Reminder:
+        reminder = self.store.add(user_id, channel_id, message, time.time() + delay, repeat)
+        self._push(reminder)
+        return reminder
+
+    def cancel(self, reminder_id: int, user_id=None) -> bool:
+        if not self.store.delete(reminder_id, user_id):
+            return False
+        # Not pending when it's being sent right now: _fire sees it's gone
+        if reminder_id in self._pending:
+            self._pending.discard(reminder_id)
+            self._cancelled.add(reminder_id)
+        return True
+
+    def list_for(self, user_id) -> List[Reminder]:
+        return self.store.list_for(user_id)
+
+    def __len__(self) -> int:
+        return len(self._pending)
+
+    def _push(self, reminder: Reminder) -> None:
+        heapq.heappush(self._heap, (reminder.due, reminder.id))
+        self._pending.add(reminder.id)
+        self._wake.set()
+
+    async def _fire(self, reminder_id: int, due: float, now: float) -> None:
+        reminder = self.store.get(reminder_id)
+        if reminder is None or reminder.due != due:
+            return  # cancelled, or a stale heap entry for an earlier due time
+        try:
+            await asyncio.wait_for(self.send(reminder), self.send_timeout)
+        except asyncio.TimeoutError:
+            print(f"[Reminder] Sending reminder {reminder_id} timed out after {self.send_timeout}s")
+        except Exception as e:
+            print(f"[Reminder] Error sending reminder {reminder_id}: {e}")
+
+        if reminder.repeat:
+            if self.store.get(reminder_id) is None:
+                return  # cancelled while it was being sent
+            # Skip occurrences missed while the bot was down
+            due = reminder.due + reminder.repeat
+            if due <= now:
+                due += ((now - due) // reminder.repeat + 1) * reminder.repeat
+            self.store.reschedule(reminder_id, due)
+            reminder.due = due
+            self._push(reminder)
+        else:
+            self.store.delete(reminder_id)
+
+    async def run(self) -> None:
+        """Load pending reminders from the store and fire them as they come due."""
+        if self.running:
+            return
+        self.running = True
+
+        for reminder in self.store.pending():
+            if reminder.id not in self._pending:  # add() may have pushed it already
+                self._push(reminder)
+        print(f"[Reminder] Loaded {len(self._heap)} pending reminders")
+
+        while self.running:
+            self._wake.clear()
+            now = time.time()
+            while self._heap and self._heap[0][0] <= now:
+                due, reminder_id = heapq.heappop(self._heap)
+                self._pending.discard(reminder_id)
+                if reminder_id in self._cancelled:
+                    self._cancelled.discard(reminder_id)
+                    continue
+                task = asyncio.create_task(self._fire(reminder_id, due, now))
+                self._sending.add(task)
+                task.add_done_callback(self._sending.discard)
+
+            timeout = max(0.0, self._heap[0][0] - time.time()) if self._heap else None
+            try:
+                await asyncio.wait_for(self._wake.wait(), timeout)
+            except asyncio.TimeoutError:
+                pass
+
+    def stop(self) -> None:
+        self.running = False
+        self._wake.set()
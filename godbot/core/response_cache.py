@@ -0,0 +1,142 @@
+# GodBot core response cache
+"""
+Cache of finished LLM replies for prompts that repeat.
+
+Keys are (route, normalized prompt, model, personality version, system
+prefix). Lookups hit a bounded in-memory LRU first and an optional SQLite
+table second. Entries expire after `ttl` seconds. Caching is opt-in per
+route ("greeting", "matchup", ...), so only prompts whose answer does not
+depend on the conversation are cached.
+"""
+import hashlib
+import re
+import sqlite3
+import time
+from collections import OrderedDict
+from typing import Iterable, Optional, Tuple
+
+# Phase 11.1 logging
+from godbot.core.logging import get_logger
+from godbot.core.memory import SQLITE_WRITE
+
+log = get_logger(__name__)
+
+DEFAULT_ROUTES = ("greeting", "matchup")
+
+# Different phrasings that should share one cache entry
+CANONICAL_PHRASES = {
+    "hi": "<greeting>",
+    "hey": "<greeting>",
+    "hello": "<greeting>",
+    "yo": "<greeting>",
+    "sup": "<greeting>",
+    "whats up": "<greeting>",
+    "what is up": "<greeting>",
+    "hey there": "<greeting>",
+    "hi there": "<greeting>",
+}
+
+_PUNCT_RE = re.compile(r"[^\w\s]")
+_SPACE_RE = re.compile(r"\s+")
+
+
+def normalize_prompt(text: str) -> str:
+    """Lowercase, drop punctuation, collapse whitespace, map known synonyms."""
+    norm = _SPACE_RE.sub(" ", _PUNCT_RE.sub("", text.lower())).strip()
+    return CANONICAL_PHRASES.get(norm, norm)
+
+
+class ResponseCache:
+    def __init__(
+        self,
+        max_entries: int = 512,
+        ttl: float = 3600,
+        db_path: Optional[str] = None,
+        routes: Iterable[str] = DEFAULT_ROUTES,
+    ):
+        self.max_entries = max_entries
+        self.ttl = ttl
+        self.routes = set(routes)
+        self.hits = 0
+        self.misses = 0
+        self._lru: "OrderedDict[str, Tuple[str, float]]" = OrderedDict()  # key -> (response, created)
+        self.conn = None
+        if db_path:
+            self.conn = sqlite3.connect(db_path, check_same_thread=False)
+            self.conn.execute("""
+            CREATE TABLE IF NOT EXISTS response_cache (
+                key TEXT PRIMARY KEY,
+                response TEXT,
+                created REAL
+            )
+            """)
+            self.conn.commit()
+
+    def enabled(self, route: str) -> bool:
+        return route in self.routes
+
+    @staticmethod
+    def make_key(route: str, prompt: str, model: str, version: str = "", system: Optional[str] = None) -> str:
+        raw = "\x1f".join([route, normalize_prompt(prompt), model, version, system or ""])
+        return hashlib.sha256(raw.encode("utf-8")).hexdigest()
+
+    def get(self, key: str) -> Optional[str]:
+        now = time.time()
+        entry = self._lru.get(key)
+        if entry is None and self.conn is not None:
+            row = self.conn.execute(
+                "SELECT response, created FROM response_cache WHERE key=?", (key,)
+            ).fetchone()
+            if row:
+                entry = (row[0], row[1])
+                self._remember(key, entry)
+
+        if entry is None or now - entry[1] > self.ttl:
+            if entry is not None:
+                self._forget(key)
+            self.misses += 1
+            return None
+
+        self._lru.move_to_end(key)
+        self.hits += 1
+        return entry[0]
+
+    def put(self, key: str, response: str) -> None:
+        entry = (response, time.time())
+        self._remember(key, entry)
+        if self.conn is not None:
+            with SQLITE_WRITE.labels("response_cache").time():
+                self.conn.execute(
+                    "INSERT OR REPLACE INTO response_cache (key, response, created) VALUES (?, ?, ?)",
+                    (key, entry[0], entry[1]),
+                )
+                self.conn.commit()
+
+    def purge_expired(self) -> int:
+        """Drop expired rows from SQLite (the LRU expires lazily)."""
+        if self.conn is None:
+            return 0
+        cur = self.conn.execute("DELETE FROM response_cache WHERE created < ?", (time.time() - self.ttl,))
+        self.conn.commit()
+        return cur.rowcount
+
+    def _remember(self, key: str, entry: Tuple[str, float]) -> None:
+        self._lru[key] = entry
+        self._lru.move_to_end(key)
+        while len(self._lru) > self.max_entries:
+            self._lru.popitem(last=False)
+
+    def _forget(self, key: str) -> None:
+        self._lru.pop(key, None)
+        if self.conn is not None:
+            self.conn.execute("DELETE FROM response_cache WHERE key=?", (key,))
+            self.conn.commit()
+
+    def stats(self) -> dict:
+        total = self.hits + self.misses
+        return {
+            "entries": len(self._lru),
+            "hits": self.hits,
+            "misses": self.misses,
+            "hit_rate": self.hits / total if total else 0.0,
+        }
@@ -0,0 +1,336 @@
+# GodBot core LLM router
+"""
+Spreads generations over several Ollama hosts.
+
+- Each Backend has a fixed number of slots (requests sent at once); the
+  rest wait in the router, so a request still queued when its backend goes
+  down moves to another one
+- pick() only considers hosts that have the model (from their /api/tags),
+  prefers one that already has it loaded (/api/ps) and has a free slot,
+  and otherwise takes the least outstanding requests
+- A connection error before the first chunk fails over to the next backend
+- Each backend has a circuit breaker (godbot.core.circuit): consecutive
+  connection failures or timeouts open it, and while every backend's
+  circuit is open requests fail at once with a "circuit_open" error
+  instead of waiting on a dead host. Health checks probe open backends
+  with exponential backoff.
+
+godbot.core.llm sends every generation through the router (see
+get_router / set_router there).
+"""
+import asyncio
+import time
+from typing import Any, AsyncIterator, Callable, Dict, Iterable, List, Optional, Set
+
+from godbot.core.circuit import CLOSED, OPEN, STATES, CircuitBreaker
+
+# Phase 11.1 logging
+from godbot.core.logging import EVENTS, get_logger
+from godbot.core.metrics import counter, gauge
+
+log = get_logger(__name__)
+
+HEALTH_INTERVAL = 30  # seconds between health checks of a healthy backend
+PROBE_INTERVAL = 5  # how often scheduled_tasks/ollama_health.py looks for due checks and probes
+
+BACKEND_REQUESTS = counter(
+    "godbot_ollama_backend_requests_total", "Generations sent to each Ollama backend",
+    labels=("backend", "result"),
+)
+BACKEND_OUTSTANDING = gauge(
+    "godbot_ollama_backend_outstanding", "Requests running or queued per Ollama backend", labels=("backend",)
+)
+BACKEND_UP = gauge("godbot_ollama_backend_up", "1 if the Ollama backend's circuit is closed", labels=("backend",))
+BACKEND_CIRCUIT = gauge(
+    "godbot_ollama_backend_circuit", "Circuit state per Ollama backend (0 closed, 1 half-open, 2 open)",
+    labels=("backend",),
+)
+FAST_FAILS = counter("godbot_llm_fast_fails_total", "Generations refused because every circuit was open")
+
+
+def _model_names(name: str) -> Set[str]:
+    # "llama3" and "llama3:latest" are the same model
+    return {name, f"{name}:latest"} if ":" not in name else {name}
+
+
+class Backend:
+    def __init__(self, url: str, max_concurrency: int = 4, breaker: Optional[CircuitBreaker] = None):
+        self.url = url.rstrip("/")
+        self.max_concurrency = max_concurrency
+        self.breaker = breaker or CircuitBreaker(self.url)
+        self.outstanding = 0  # running + queued
+        self.models: Optional[Set[str]] = None  # None = not checked yet (assume it has everything)
+        self.tags: List[Dict[str, Any]] = []
+        self.loaded: Set[str] = set()
+        self.last_check = 0.0
+        self.failures = 0
+        self._slots: Optional[asyncio.Semaphore] = None
+        self._slots_loop = None
+        BACKEND_OUTSTANDING.labels(self.url).set_function(lambda: self.outstanding)
+        BACKEND_UP.labels(self.url).set_function(lambda: int(self.healthy))
+        BACKEND_CIRCUIT.labels(self.url).set_function(lambda: STATES.index(self.breaker.state))
+
+    def __repr__(self) -> str:
+        return f"Backend({self.url!r}, outstanding={self.outstanding}, circuit={self.breaker.state})"
+
+    @property
+    def healthy(self) -> bool:
+        return self.breaker.state == CLOSED
+
+    @property
+    def slots(self) -> asyncio.Semaphore:
+        loop = asyncio.get_running_loop()
+        if self._slots is None or self._slots_loop is not loop:
+            self._slots = asyncio.Semaphore(self.max_concurrency)
+            self._slots_loop = loop
+        return self._slots
+
+    def has_model(self, model: str) -> bool:
+        return self.models is None or not self.models.isdisjoint(_model_names(model))
+
+    def is_loaded(self, model: str) -> bool:
+        return not self.loaded.isdisjoint(_model_names(model))
+
+    def mark_down(self, error: str) -> None:
+        self.failures += 1
+        was = self.breaker.state
+        self.breaker.record_failure(error)
+        if self.breaker.state == OPEN and was != OPEN:
+            log.warning(
+                f"Ollama backend {self.url} circuit open for {self.breaker.delay:.0f}s "
+                f"after {self.breaker.consecutive_failures} failures: {error}"
+            )
+            EVENTS.publish("backend", {"url": self.url, "healthy": False, "error": error,
+                                       "retry_in": self.breaker.delay})
+
+    def mark_ok(self) -> None:
+        if not self.healthy:
+            log.info(f"Ollama backend {self.url} is back up")
+            EVENTS.publish("backend", {"url": self.url, "healthy": True})
+        self.breaker.record_success()
+
+    def mark_up(self, tags: List[Dict[str, Any]], loaded: Iterable[Dict[str, Any]]) -> None:
+        self.tags = tags
+        self.models = {m["name"] for m in tags if m.get("name")}
+        self.loaded = {m["name"] for m in loaded if m.get("name")}
+        self.mark_ok()
+
+    def status(self) -> Dict[str, Any]:
+        return {
+            "url": self.url,
+            "healthy": self.healthy,
+            "circuit": self.breaker.status(),
+            "outstanding": self.outstanding,
+            "max_concurrency": self.max_concurrency,
+            "models": sorted(self.models) if self.models is not None else None,
+            "loaded": sorted(self.loaded),
+            "last_check": self.last_check,
+            "failures": self.failures,
+        }
+
+
+class OllamaRouter:
+    def __init__(
+        self,
+        urls: Iterable[str],
+        max_concurrency: int = 4,
+        check_timeout: float = 5,
+        failure_threshold: int = 3,
+        health_interval: float = HEALTH_INTERVAL,
+    ):
+        from ollama_client import list_models, load_model, loaded_models
+
+        self.backends = [
+            Backend(url, max_concurrency, CircuitBreaker(url, failure_threshold=failure_threshold)) for url in urls
+        ]
+        if not self.backends:
+            raise ValueError("OllamaRouter needs at least one backend URL")
+        self.check_timeout = check_timeout
+        self.health_interval = health_interval
+        self._list_models = list_models
+        self._load_model = load_model
+        self._loaded_models = loaded_models
+
+    # -----------------------------
+    # HEALTH
+    # -----------------------------
+
+    async def check(self, backend: Backend) -> bool:
+        """Health check one backend; also refreshes its installed and loaded models."""
+        backend.last_check = time.time()
+        try:
+            tags = await self._list_models(timeout=self.check_timeout, base_url=backend.url)
+            loaded = await self._loaded_models(timeout=self.check_timeout, base_url=backend.url)
+        except Exception as e:
+            backend.mark_down(str(e) or type(e).__name__)
+            return False
+        backend.mark_up(tags, loaded)
+        return True
+
+    async def check_all(self, due_only: bool = False) -> int:
+        """
+        Check the backends concurrently; returns how many are healthy.
+
+        Open circuits are only probed once their backoff is over. With
+        due_only, healthy backends checked in the last health_interval are
+        skipped too (the scheduled task runs every PROBE_INTERVAL).
+        """
+        now = time.time()
+        due = []
+        for b in self.backends:
+            if b.breaker.state == CLOSED:
+                if not due_only or now - b.last_check >= self.health_interval:
+                    due.append(b)
+            elif b.breaker.allow():
+                due.append(b)
+        await asyncio.gather(*(self.check(b) for b in due))
+        return sum(b.healthy for b in self.backends)
+
+    def available(self) -> bool:
+        """False while every backend's circuit is open (requests would fail at once)."""
+        return any(b.breaker.ready() for b in self.backends)
+
+    def retry_in(self) -> float:
+        """Seconds until the next backend may be probed (0 when one is available)."""
+        return 0.0 if self.available() else min(b.breaker.retry_in() for b in self.backends)
+
+    # -----------------------------
+    # PLACEMENT
+    # -----------------------------
+
+    def pick(self, model: str, exclude: Iterable[Backend] = ()) -> Optional[Backend]:
+        """Backend for the next request to model, or None if no untried backend can take it."""
+        exclude = list(exclude)
+        ready = [b for b in self.backends if b not in exclude and b.has_model(model) and b.breaker.ready()]
+        if not ready:
+            return None
+        # Closed circuits first; a backend past its backoff only gets the request as a probe
+        healthy = [b for b in ready if b.healthy] or ready
+        # A host with the model already in memory skips the load, unless it's saturated
+        warm = [b for b in healthy if b.is_loaded(model) and b.outstanding < b.max_concurrency]
+        return min(warm or healthy, key=lambda b: b.outstanding)
+
+    def _has_healthy_alternative(self, model: str, tried: List[Backend]) -> bool:
+        return any(b.healthy and b.has_model(model) and b not in tried for b in self.backends)
+
+    def _unavailable(self, model: str) -> Dict[str, Any]:
+        if not any(b.has_model(model) for b in self.backends):
+            return {"error": f"No Ollama backend has the model {model}"}
+        FAST_FAILS.inc()
+        return {"error": f"The language model is unavailable (retrying in {self.retry_in():.0f}s)",
+                "circuit_open": True}
+
+    async def stream(
+        self, model: str, call: Callable[[str], AsyncIterator[Dict[str, Any]]]
+    ) -> AsyncIterator[Dict[str, Any]]:
+        """
+        Run call(base_url) on the best backend for model and yield its chunks.
+
+        Fails over while nothing has been yielded yet; after that an error
+        is passed through (the caller already has part of the answer).
+        """
+        tried: List[Backend] = []
+        last_error: Optional[Dict[str, Any]] = None
+        while True:
+            backend = self.pick(model, exclude=tried)
+            if backend is None:
+                yield last_error or self._unavailable(model)
+                return
+            tried.append(backend)
+            if not backend.breaker.allow():
+                continue  # another request took its half-open probe slot; try the next backend
+
+            backend.outstanding += 1
+            try:
+                async with backend.slots:
+                    if not backend.healthy and self._has_healthy_alternative(model, tried):
+                        # Went down while this request was queued for it
+                        BACKEND_REQUESTS.labels(backend.url, "requeued").inc()
+                        continue
+
+                    started = failed = False
+                    async for chunk in call(backend.url):
+                        if "error" in chunk:
+                            failed = True
+                            if chunk.get("unreachable") or chunk.get("timeout"):
+                                backend.mark_down(chunk["error"])
+                            if chunk.get("model_missing") and backend.models is not None:
+                                backend.models -= _model_names(model)
+                            if not started and chunk.get("retryable"):
+                                last_error = chunk
+                                break
+                        elif not started:
+                            backend.mark_ok()
+                        started = True
+                        yield chunk
+                    else:
+                        if failed:
+                            # Passed through to the caller (e.g. a 400): no output, model may not be loaded
+                            BACKEND_REQUESTS.labels(backend.url, "error").inc()
+                        else:
+                            BACKEND_REQUESTS.labels(backend.url, "ok").inc()
+                            backend.loaded |= {model}
+                        return
+                    BACKEND_REQUESTS.labels(backend.url, "failover").inc()
+                    log.warning(f"Failing over from {backend.url}: {last_error['error']}")
+            finally:
+                backend.outstanding -= 1
+
+    # -----------------------------
+    # MODELS ACROSS BACKENDS
+    # -----------------------------
+
+    async def list_models(self) -> List[Dict[str, Any]]:
+        """Installed models across the healthy backends (/api/tags shape, one entry per name)."""
+        await self.check_all()
+        seen: Dict[str, Dict[str, Any]] = {}
+        for backend in self.backends:
+            if backend.healthy:
+                for entry in backend.tags:
+                    seen.setdefault(entry.get("name"), entry)
+        if not any(b.healthy for b in self.backends):
+            raise ConnectionError("no Ollama backend is reachable")
+        return list(seen.values())
+
+    async def loaded_models(self) -> List[Dict[str, Any]]:
+        """Models loaded on any healthy backend (/api/ps shape)."""
+        out = []
+        for backend in self.backends:
+            if not backend.healthy:
+                continue
+            try:
+                loaded = await self._loaded_models(timeout=self.check_timeout, base_url=backend.url)
+            except Exception as e:
+                backend.mark_down(str(e) or type(e).__name__)
+                continue
+            backend.loaded = {m["name"] for m in loaded if m.get("name")}
+            out.extend(loaded)
+        return out
+
+    async def load_model(self, model: str, keep_alive: Any) -> Dict[str, Any]:
+        """
+        Preload model on the backend its next request would go to. keep_alive=0
+        unloads it from every backend that has it loaded.
+        """
+        if keep_alive == 0:
+            result: Dict[str, Any] = {}
+            for backend in self.backends:
+                if backend.healthy and backend.is_loaded(model):
+                    result = await self._load_model(model, 0, base_url=backend.url)
+                    backend.loaded -= _model_names(model)
+            return result
+
+        backend = self.pick(model)
+        if backend is None:
+            raise LookupError(f"no available Ollama backend has the model {model}")
+        result = await self._load_model(model, keep_alive, base_url=backend.url)
+        backend.loaded |= {model}
+        return result
+
+    def status(self) -> List[Dict[str, Any]]:
+        return [b.status() for b in self.backends]
+
+    def circuit_state(self) -> str:
+        """Overall state: closed if any backend is, else half_open if one is probing, else open."""
+        states = {b.breaker.state for b in self.backends}
+        return next(s for s in STATES if s in states)
@@ -1,38 +1,187 @@
 # GodBot core scheduler module
+"""
+Timer scheduler built on a min-heap of next-run deadlines.
+
+The loop sleeps until the earliest deadline (or until a task is added or
+re-enabled) instead of polling. Each task runs on a fixed interval or a
+cron expression (see godbot.core.cron), with optional random jitter.
+
+Overlap policy when a run is due while the previous one is still going:
+- "skip":  drop this run (default)
+- "queue": run once more right after the current run finishes
+- "allow": start another run concurrently
+"""
 import asyncio
+import heapq
+import random
 import time
-from typing import Callable, Dict, Any
+from typing import Callable, Dict, List, Optional, Set, Tuple
 
 # Phase 11.1 logging
 from godbot.core.logging import get_logger
+from godbot.core.cron import CronExpr
 
 log = get_logger(__name__)
 
+OVERLAP_POLICIES = ("skip", "queue", "allow")
+
+
 class ScheduledTask:
-    def __init__(self, name: str, interval: int, func: Callable, enabled=True):
+    def __init__(
+        self,
+        name: str,
+        interval: Optional[int],
+        func: Callable,
+        enabled=True,
+        cron: Optional[str] = None,
+        overlap: str = "skip",
+        jitter: float = 0,
+    ):
+        if overlap not in OVERLAP_POLICIES:
+            raise ValueError(f"overlap must be one of {OVERLAP_POLICIES}, got {overlap!r}")
+        if interval is None and cron is None:
+            raise ValueError("either interval or cron is required")
         self.name = name
         self.interval = interval  # seconds
+        self.cron = CronExpr(cron) if cron else None
         self.func = func
         self.enabled = enabled
+        self.overlap = overlap
+        self.jitter = jitter
+        self.next_run: Optional[float] = None
         self.last_run = 0
+        # Stats
+        self.running = 0
+        self.queued = False
+        self.runs = 0
+        self.failures = 0
+        self.skipped = 0
+        self.last_duration: Optional[float] = None
+        self.total_duration = 0.0
+        self.last_error: Optional[str] = None
+
+    def schedule_after(self, now: float, first: bool = False) -> float:
+        """Compute (and store) the next deadline after now."""
+        if self.cron is not None:
+            due = self.cron.next_after(now)
+        else:
+            due = now if first else now + self.interval
+        if self.jitter:
+            due += random.uniform(0, self.jitter)
+        self.next_run = due
+        return due
+
+    @property
+    def avg_duration(self) -> Optional[float]:
+        return self.total_duration / self.runs if self.runs else None
+
+    def describe(self) -> str:
+        when = f"cron '{self.cron.expr}'" if self.cron else f"every {self.interval}s"
+        parts = [f"{self.name}: {when} (enabled={self.enabled}, overlap={self.overlap})"]
+        parts.append(f"runs={self.runs} failures={self.failures} skipped={self.skipped}")
+        if self.last_duration is not None:
+            parts.append(f"last={self.last_duration * 1000:.0f}ms avg={self.avg_duration * 1000:.0f}ms")
+        if self.running:
+            parts.append("running")
+        if self.next_run and self.enabled:
+            parts.append(f"next in {max(0, self.next_run - time.time()):.0f}s")
+        line = " | ".join(parts)
+        if self.last_error:
+            line += f"\n  last error: {self.last_error}"
+        return line
+
 
 class Scheduler:
     def __init__(self, bot):
         self.bot = bot
         self.tasks: Dict[str, ScheduledTask] = {}
         self.running = False
+        self._heap: List[Tuple[float, int, str]] = []  # (deadline, seq, task name)
+        self._seq = 0
+        self._wake = asyncio.Event()
+        self._inflight: Set[asyncio.Task] = set()
 
-    def add(self, name: str, interval_sec: int, func: Callable):
-        self.tasks[name] = ScheduledTask(name, interval_sec, func)
-        print(f"[Scheduler] Added task: {name} every {interval_sec}s")
+    def add(
+        self,
+        name: str,
+        interval_sec: Optional[int] = None,
+        func: Optional[Callable] = None,
+        *,
+        cron: Optional[str] = None,
+        overlap: str = "skip",
+        jitter: float = 0,
+    ):
+        task = ScheduledTask(name, interval_sec, func, cron=cron, overlap=overlap, jitter=jitter)
+        self.tasks[name] = task
+        if self.running:
+            self._push(task, time.time(), first=True)
+        when = f"cron '{cron}'" if cron else f"every {interval_sec}s"
+        print(f"[Scheduler] Added task: {name} {when}")
+        return task
 
     def enable(self, name: str):
-        if name in self.tasks:
-            self.tasks[name].enabled = True
+        task = self.tasks.get(name)
+        if task and not task.enabled:
+            task.enabled = True
+            if self.running:
+                self._push(task, time.time())
 
     def disable(self, name: str):
         if name in self.tasks:
+            # Its heap entry goes stale and is dropped when it comes up
             self.tasks[name].enabled = False
+            self.tasks[name].next_run = None
+
+    def _push(self, task: ScheduledTask, now: float, first: bool = False):
+        due = task.schedule_after(now, first=first)
+        self._seq += 1
+        heapq.heappush(self._heap, (due, self._seq, task.name))
+        self._wake.set()
+
+    def _pop_due(self, now: float) -> List[ScheduledTask]:
+        due = []
+        while self._heap and self._heap[0][0] <= now:
+            deadline, _, name = heapq.heappop(self._heap)
+            task = self.tasks.get(name)
+            # Skip entries left behind by disable() / re-enable()
+            if task is None or not task.enabled or task.next_run != deadline:
+                continue
+            due.append(task)
+        return due
+
+    def _dispatch(self, task: ScheduledTask):
+        if task.running and task.overlap != "allow":
+            if task.overlap == "queue":
+                task.queued = True
+            else:
+                task.skipped += 1
+                log.warning(f"Skipping {task.name}: previous run still going")
+            return
+        self._spawn(task)
+
+    def _spawn(self, task: ScheduledTask):
+        t = asyncio.create_task(self._run(task))
+        self._inflight.add(t)
+        t.add_done_callback(self._inflight.discard)
+
+    async def _run(self, task: ScheduledTask):
+        task.running += 1
+        task.last_run = time.time()
+        start = time.perf_counter()
+        try:
+            await task.func(self.bot)
+        except Exception as e:
+            task.failures += 1
+            task.last_error = f"{type(e).__name__}: {e}"
+            print(f"[Scheduler] Error in task {task.name}: {e}")
+        finally:
+            task.last_duration = time.perf_counter() - start
+            task.total_duration += task.last_duration
+            task.runs += 1
+            task.running -= 1
+        if task.queued and task.enabled:
+            task.queued = False
+            self._spawn(task)
 
     async def start(self):
         if self.running:
@@ -41,19 +190,27 @@ class Scheduler:
         self.running = True
         print("[Scheduler] Started")
 
-        while True:
-            now = time.time()
-
-            for name, task in self.tasks.items():
-                if not task.enabled:
-                    continue
+        now = time.time()
+        for task in self.tasks.values():
+            if task.enabled:
+                self._push(task, now, first=True)
 
-                if now - task.last_run >= task.interval:
-                    try:
-                        asyncio.create_task(task.func(self.bot))
-                        task.last_run = now
-                    except Exception as e:
-                        print(f"[Scheduler] Error in task {name}: {e}")
+        while self.running:
+            self._wake.clear()
+            now = time.time()
+            for task in self._pop_due(now):
+                self._dispatch(task)
+                self._push(task, now)
 
-            await asyncio.sleep(1)
+            if self._heap:
+                timeout = max(0.0, self._heap[0][0] - time.time())
+            else:
+                timeout = None
+            try:
+                await asyncio.wait_for(self._wake.wait(), timeout)
+            except asyncio.TimeoutError:
+                pass
 
+    def stop(self):
+        self.running = False
+        self._wake.set()
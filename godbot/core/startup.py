@@ -0,0 +1,60 @@
+# GodBot core startup profiling
+"""
+Measured startup phases.
+
+Each phase is timed; independent phases can run in parallel worker
+threads. The collected timings are kept on the client
+(client.startup_profile) and printed once startup finishes.
+"""
+import asyncio
+import time
+from contextlib import contextmanager
+from typing import Callable, Dict
+
+# Phase 11.1 logging
+from godbot.core.logging import get_logger
+
+log = get_logger(__name__)
+
+
+class StartupProfile:
+    def __init__(self):
+        self.phases: Dict[str, float] = {}  # name -> seconds
+        self.started = time.perf_counter()
+        self.finished = None
+
+    @contextmanager
+    def phase(self, name: str):
+        """Time a sequential phase."""
+        t0 = time.perf_counter()
+        try:
+            yield
+        finally:
+            self.phases[name] = time.perf_counter() - t0
+
+    async def run_parallel(self, group: str, phases: Dict[str, Callable[[], None]]) -> None:
+        """
+        Run independent blocking phases concurrently in worker threads.
+        Each phase is timed individually and the whole group as `group`.
+        """
+        async def run_one(name: str, fn: Callable[[], None]):
+            t0 = time.perf_counter()
+            try:
+                await asyncio.to_thread(fn)
+            finally:
+                self.phases[name] = time.perf_counter() - t0
+
+        with self.phase(group):
+            await asyncio.gather(*(run_one(name, fn) for name, fn in phases.items()))
+
+    def finish(self) -> None:
+        self.finished = time.perf_counter()
+
+    @property
+    def total(self) -> float:
+        end = self.finished if self.finished is not None else time.perf_counter()
+        return end - self.started
+
+    def summary(self) -> str:
+        parts = [f"{name}={secs * 1000:.0f}ms" for name, secs in self.phases.items()]
+        return f"Startup {self.total * 1000:.0f}ms ({', '.join(parts)})"
@@ -0,0 +1,242 @@
+# GodBot core message triage
+"""
+Decides, before any LLM work, whether a channel message deserves a
+generated reply. Every check is plain string work (microseconds).
+
+    decision = triage.decide(text, channel_id, mentioned=..., reply_to_bot=...)
+    decision.llm    # generate a reply
+    decision.tools  # deterministic tools may still answer (no tokens spent)
+
+Pipeline, first match wins:
+1. DMs, @mentions and replies to the bot are always answered
+2. the channel's mode:
+   - "mention": nothing else (the tools stay quiet too)
+   - "all": answer everything (the old freeform behaviour)
+   - "smart": score the message with a small linear classifier over
+     question/addressing/chatter features and answer above threshold
+3. the channel's token budget (LLM tokens per hour, refilled
+   continuously): once spent, unsolicited messages get tools only
+
+Channel modes are set with /triage and kept in a small JSON file.
+"""
+import json
+import math
+import os
+import re
+import threading
+import time
+from dataclasses import dataclass
+from typing import Callable, Dict, Optional
+
+# Phase 11.1 logging
+from godbot.core.logging import get_logger
+from godbot.core.metrics import counter, gauge
+
+log = get_logger(__name__)
+
+MODES = ("mention", "smart", "all")
+
+DECISIONS = counter("godbot_triage_decisions_total", "Triage decisions", labels=("decision", "reason"))
+AVOIDED = gauge("godbot_triage_llm_avoided_ratio", "Fraction of channel messages triage kept away from the LLM")
+
+_INTERROGATIVES = frozenset(
+    "what whats what's how why who whom whose when where which can could should would is are am "
+    "do does did will was were any anyone has have".split()
+)
+_IMPERATIVES = frozenset(
+    "explain tell help recommend give show list write suggest compare calculate convert describe "
+    "summarize define translate plan find".split()
+)
+_CHATTER = frozenset(
+    "lol lmao lmfao haha hahaha xd gg ggs ok okay k kk nice same true yeah yea yep yes no nope ty thx "
+    "thanks rip bruh wow damn omg oof fr real based sure cool hey hi hello yo sup gm gn".split()
+)
+_ADDRESS = frozenset("you your you're youre u ur".split())
+_HELP_PHRASES = ("any ideas", "anyone know", "help me", "need help", "any tips", "any advice", "thoughts?")
+_WORD_RE = re.compile(r"[a-z']+")
+_URL_RE = re.compile(r"https?://")
+
+# Linear model: weight per feature, score = sigmoid(sum). Hand-tuned; pass Triage(weights=...) to adjust
+DEFAULT_WEIGHTS: Dict[str, float] = {
+    "bias": -1.0,
+    "question_mark": 2.5,
+    "interrogative": 1.5,
+    "imperative": 2.0,
+    "asks_help": 2.0,
+    "addresses_bot": 3.0,
+    "addresses_you": 0.5,
+    "words_4": 0.5,
+    "words_12": 0.5,
+    "short": -1.0,
+    "chatter": -3.0,
+    "url": -1.0,
+    "mentions_other": -3.0,
+}
+
+
+@dataclass(frozen=True)
+class Decision:
+    llm: bool
+    tools: bool
+    reason: str
+    score: Optional[float] = None
+
+
+def features(text: str, bot_names=("godbot", "god bot")) -> Dict[str, float]:
+    lower = text.lower().strip()
+    words = _WORD_RE.findall(lower)
+    first = words[0] if words else ""
+    f = {"bias": 1.0}
+    if lower.endswith("?"):
+        f["question_mark"] = 1.0
+    if first in _INTERROGATIVES:
+        f["interrogative"] = 1.0
+    if first in _IMPERATIVES:
+        f["imperative"] = 1.0
+    if any(p in lower for p in _HELP_PHRASES):
+        f["asks_help"] = 1.0
+    if any(name in lower for name in bot_names):
+        f["addresses_bot"] = 1.0
+    if any(w in _ADDRESS for w in words):
+        f["addresses_you"] = 1.0
+    if len(words) >= 4:
+        f["words_4"] = 1.0
+    if len(words) >= 12:
+        f["words_12"] = 1.0
+    if len(words) < 3 and "question_mark" not in f:
+        f["short"] = 1.0
+    if words and all(w in _CHATTER for w in words):
+        f["chatter"] = 1.0
+    if _URL_RE.search(lower):
+        f["url"] = 1.0
+    if "<@" in lower:
+        f["mentions_other"] = 1.0
+    return f
+
+
+def score(text: str, weights: Dict[str, float] = DEFAULT_WEIGHTS) -> float:
+    """Probability-like score in (0, 1) that the message wants an answer."""
+    total = sum(weights.get(name, 0.0) * value for name, value in features(text).items())
+    return 1 / (1 + math.exp(-total))
+
+
+class _Budget:
+    """Token bucket: capacity tokens, refilled at capacity per hour."""
+
+    __slots__ = ("tokens", "updated")
+
+    def __init__(self, capacity: float, now: float):
+        self.tokens = capacity
+        self.updated = now
+
+
+class Triage:
+    def __init__(
+        self,
+        default_mode: str = "smart",
+        threshold: float = 0.5,
+        tokens_per_hour: int = 20000,
+        path: Optional[str] = None,
+        weights: Optional[Dict[str, float]] = None,
+        clock: Callable[[], float] = time.monotonic,
+    ):
+        if default_mode not in MODES:
+            raise ValueError(f"triage mode must be one of {', '.join(MODES)}")
+        self.default_mode = default_mode
+        self.threshold = threshold
+        self.tokens_per_hour = tokens_per_hour  # 0 = unlimited
+        self.path = path
+        self.weights = weights or DEFAULT_WEIGHTS
+        self._clock = clock
+        self._lock = threading.Lock()
+        self._modes: Dict[int, str] = self._load()
+        self._budgets: Dict[int, _Budget] = {}
+        self.counts = {"llm": 0, "tools": 0, "ignored": 0}
+        AVOIDED.set_function(self.avoided_ratio)
+
+    # ---- channel modes ----
+
+    def _load(self) -> Dict[int, str]:
+        if not self.path or not os.path.exists(self.path):
+            return {}
+        try:
+            with open(self.path, encoding="utf-8") as f:
+                return {int(k): v for k, v in json.load(f).items() if v in MODES}
+        except (OSError, ValueError) as e:
+            log.warning(f"Could not read triage settings {self.path}: {e}")
+            return {}
+
+    def mode(self, channel_id: int) -> str:
+        return self._modes.get(channel_id, self.default_mode)
+
+    def set_mode(self, channel_id: int, mode: Optional[str]) -> None:
+        """Set a channel's mode; None goes back to the default."""
+        if mode is not None and mode not in MODES:
+            raise ValueError(f"triage mode must be one of {', '.join(MODES)}")
+        with self._lock:
+            if mode is None:
+                self._modes.pop(channel_id, None)
+            else:
+                self._modes[channel_id] = mode
+            if self.path:
+                with open(self.path, "w", encoding="utf-8") as f:
+                    json.dump({str(k): v for k, v in self._modes.items()}, f, indent=4)
+
+    # ---- token budgets ----
+
+    def _bucket(self, channel_id: int) -> _Budget:
+        now = self._clock()
+        bucket = self._budgets.get(channel_id)
+        if bucket is None:
+            bucket = self._budgets[channel_id] = _Budget(self.tokens_per_hour, now)
+        else:
+            bucket.tokens = min(self.tokens_per_hour, bucket.tokens + (now - bucket.updated) * self.tokens_per_hour / 3600)
+            bucket.updated = now
+        return bucket
+
+    def budget_left(self, channel_id: int) -> Optional[float]:
+        if not self.tokens_per_hour:
+            return None
+        return self._bucket(channel_id).tokens
+
+    def charge(self, channel_id: int, tokens: int) -> None:
+        """Record LLM tokens spent answering in a channel."""
+        if self.tokens_per_hour and tokens > 0:
+            self._bucket(channel_id).tokens -= tokens
+
+    # ---- decisions ----
+
+    def _decide(self, text, channel_id, dm, mentioned, reply_to_bot) -> Decision:
+        if dm:
+            return Decision(True, True, "dm")
+        if mentioned:
+            return Decision(True, True, "mention")
+        if reply_to_bot:
+            return Decision(True, True, "reply")
+
+        mode = self.mode(channel_id)
+        if mode == "mention":
+            return Decision(False, False, "not_addressed")
+        s = None
+        if mode == "smart":
+            s = score(text, self.weights)
+            if s < self.threshold:
+                return Decision(False, True, "classifier", s)
+        if self.tokens_per_hour and self._bucket(channel_id).tokens <= 0:
+            return Decision(False, True, "budget", s)
+        return Decision(True, True, "question" if mode == "smart" else "freeform", s)
+
+    def decide(self, text: str, channel_id: int, dm: bool = False, mentioned: bool = False,
+               reply_to_bot: bool = False) -> Decision:
+        decision = self._decide(text, channel_id, dm, mentioned, reply_to_bot)
+        outcome = "llm" if decision.llm else "tools" if decision.tools else "ignored"
+        self.counts[outcome] += 1
+        DECISIONS.labels(outcome, decision.reason).inc()
+        return decision
+
+    def avoided_ratio(self) -> float:
+        total = sum(self.counts.values())
+        return (total - self.counts["llm"]) / total if total else 0.0
+
+    def stats(self) -> dict:
+        return {**self.counts, "avoided_ratio": round(self.avoided_ratio(), 3)}
@@ -0,0 +1,103 @@
+# GodBot core user facts module (memory.json)
+import json
+import os
+from typing import Dict, List
+
+MEM_FILE = "memory.json"
+
+FACT_KEYWORDS = [
+    "i like", "my name is", "i live", "i'm from",
+    "i am ", "my favorite", "i prefer", "i love",
+    "i hate", "i work", "my job", "i study",
+    "my age is", "i'm ", "call me"
+]
+
+
+def load_memory(path: str = MEM_FILE) -> Dict:
+    """Load memory.json or create if doesn't exist"""
+    if not os.path.exists(path):
+        with open(path, "w", encoding="utf-8") as f:
+            json.dump({}, f)
+        return {}
+    with open(path, "r", encoding="utf-8") as f:
+        try:
+            return json.load(f)
+        except ValueError:
+            return {}
+
+
+def clean_memory(mem: Dict) -> Dict:
+    """Deduplicate and limit memory facts"""
+    for user in mem:
+        facts = mem[user].get("facts", [])
+        # Deduplicate
+        mem[user]["facts"] = list(dict.fromkeys(facts))[-20:]
+    return mem
+
+
+def save_memory(mem: Dict, path: str = MEM_FILE) -> None:
+    """Save memory to memory.json"""
+    mem = clean_memory(mem)
+    with open(path, "w", encoding="utf-8") as f:
+        json.dump(mem, f, indent=4)
+
+
+class UserFacts:
+    """
+    Simple rule-based per-user fact memory backed by memory.json.
+    Only stores stable facts like preferences, names, locations.
+    """
+
+    def __init__(self, path: str = MEM_FILE):
+        self.path = path
+        self.data: Dict = load_memory(path)
+
+    def save(self) -> None:
+        save_memory(self.data, self.path)
+
+    def replace(self, mem: Dict) -> None:
+        """Replace all facts (used by the dashboard memory editor)."""
+        self.data = mem
+        self.save()
+
+    def store_fact(self, user_id, text: str) -> bool:
+        """Store text as a fact if it looks like one. Returns True if stored."""
+        lowered = text.lower()
+
+        # Only store if it contains a fact-like keyword
+        if not any(k in lowered for k in FACT_KEYWORDS):
+            return False
+
+        uid = str(user_id)
+        if uid not in self.data:
+            self.data[uid] = {"facts": []}
+
+        # Don't store duplicates
+        if text in self.data[uid]["facts"]:
+            return False
+
+        # Keep facts short - truncate if needed
+        fact = text[:200] if len(text) > 200 else text
+        self.data[uid]["facts"].append(fact)
+        # Limit to 20 facts per user
+        if len(self.data[uid]["facts"]) > 20:
+            self.data[uid]["facts"] = self.data[uid]["facts"][-20:]
+        self.save()
+        print(f"[MEMORY] Stored fact for {uid}: {fact[:50]}...")
+        return True
+
+    def get_facts(self, user_id) -> List[str]:
+        """Get stored facts for a user"""
+        uid = str(user_id)
+        if uid in self.data and self.data[uid].get("facts"):
+            return self.data[uid]["facts"]
+        return []
+
+    def forget(self, user_id) -> bool:
+        """Clear all facts for a user. Returns False if there was nothing stored."""
+        uid = str(user_id)
+        if uid not in self.data:
+            return False
+        self.data[uid] = {"facts": []}
+        self.save()
+        return True
@@ -1,4 +1,16 @@
 # GodBot core vector memory module
+
+
+class NullVectorMemory:
+    """No-op vector memory (ChromaDB missing or vector memory disabled)."""
+    def __init__(self):
+        pass
+    def add(self, user, text):
+        pass
+    def search(self, query, n=5):
+        return []
+
+
 try:
     import chromadb
     from sentence_transformers import SentenceTransformer
@@ -25,11 +37,5 @@ try:
             return []
 except:
     # Fallback if ChromaDB not installed
-    class VectorMemory:
-        def __init__(self):
-            pass
-        def add(self, user, text):
-            pass
-        def search(self, query, n=5):
-            return []
+    VectorMemory = NullVectorMemory
 
@@ -0,0 +1,172 @@
+# GodBot core worker pool
+"""
+Bounded process pool for CPU-bound work that must not run on the event
+loop (see register_handler(cpu_bound=True) in deterministic.registry).
+
+    pool = WorkerPool("deterministic", max_workers=2, timeout=5)
+    result = await pool.run(fn, arg)
+
+- At most max_workers jobs run at once and at most max_queue more wait
+  for a worker; beyond that run() raises PoolFull instead of queueing
+  without bound. Waiting jobs are held here rather than in the executor,
+  so the queue metrics are exact and a waiting job can be cancelled.
+- A job that runs past its timeout raises JobTimeout. A running process
+  can't be interrupted, so the pool's workers are killed and replaced
+  (other jobs running at that moment fail with WorkerPoolError).
+- Cancelling the task awaiting run() drops the job if it is still
+  waiting; a running job finishes in the background.
+
+fn and its arguments must be picklable (module-level functions). Workers
+are started with forkserver, not fork, because the bot process has
+threads running.
+"""
+import asyncio
+import multiprocessing
+import time
+import weakref
+from concurrent.futures import ProcessPoolExecutor
+from concurrent.futures.process import BrokenProcessPool
+from typing import Any, Callable, Optional
+
+# Phase 11.1 logging
+from godbot.core.logging import get_logger
+from godbot.core.metrics import counter, gauge, histogram
+
+log = get_logger(__name__)
+
+JOBS = counter("godbot_worker_pool_jobs_total", "Worker pool jobs by result", labels=("pool", "result"))
+QUEUE_WAIT = histogram("godbot_worker_pool_queue_seconds", "Time jobs waited for a free worker", labels=("pool",))
+RUN_TIME = histogram("godbot_worker_pool_run_seconds", "Time jobs ran in a worker process", labels=("pool",))
+IN_FLIGHT = gauge("godbot_worker_pool_in_flight", "Jobs queued or running", labels=("pool",))
+QUEUED = gauge("godbot_worker_pool_queued", "Jobs waiting for a worker process", labels=("pool",))
+
+
+class WorkerPoolError(RuntimeError):
+    pass
+
+
+class PoolFull(WorkerPoolError):
+    pass
+
+
+class JobTimeout(WorkerPoolError):
+    pass
+
+
+def _mp_context():
+    methods = multiprocessing.get_all_start_methods()
+    return multiprocessing.get_context("forkserver" if "forkserver" in methods else "spawn")
+
+
+class WorkerPool:
+    def __init__(self, name: str, max_workers: int = 2, max_queue: Optional[int] = None, timeout: float = 5.0):
+        self.name = name
+        self.max_workers = max(1, max_workers)
+        self.max_queue = max_queue if max_queue is not None else self.max_workers * 8
+        self.timeout = timeout
+        self.in_flight = 0  # queued + running
+        self.running = 0
+        self.restarts = 0
+        self._executor: Optional[ProcessPoolExecutor] = None
+        self._killed: "weakref.WeakSet[ProcessPoolExecutor]" = weakref.WeakSet()
+        self._slots: Optional[asyncio.Semaphore] = None
+        self._slots_loop = None
+        IN_FLIGHT.labels(name).set_function(lambda: self.in_flight)
+        QUEUED.labels(name).set_function(lambda: self.in_flight - self.running)
+
+    @property
+    def slots(self) -> asyncio.Semaphore:
+        loop = asyncio.get_running_loop()
+        if self._slots is None or self._slots_loop is not loop:
+            self._slots = asyncio.Semaphore(self.max_workers)
+            self._slots_loop = loop
+        return self._slots
+
+    def _get_executor(self) -> ProcessPoolExecutor:
+        if self._executor is None:
+            self._executor = ProcessPoolExecutor(self.max_workers, mp_context=_mp_context())
+        return self._executor
+
+    def _kill(self, executor: ProcessPoolExecutor) -> None:
+        """Stop a pool whose workers may be stuck in a job; the next run() starts a new one."""
+        if self._executor is executor:
+            self._executor = None
+            self.restarts += 1
+        self._killed.add(executor)
+        processes = list((getattr(executor, "_processes", None) or {}).values())
+        executor.shutdown(wait=False, cancel_futures=True)
+        for process in processes:
+            process.kill()
+
+    async def run(self, fn: Callable, *args: Any, timeout: Optional[float] = None) -> Any:
+        """Run fn(*args) in a worker process and return its result (or raise its exception)."""
+        if self.in_flight >= self.max_workers + self.max_queue:
+            JOBS.labels(self.name, "rejected").inc()
+            raise PoolFull(f"{self.name} pool is full ({self.in_flight} jobs)")
+
+        self.in_flight += 1
+        queued_at = time.perf_counter()
+        try:
+            async with self.slots:
+                QUEUE_WAIT.labels(self.name).observe(time.perf_counter() - queued_at)
+                self.running += 1
+                try:
+                    return await self._run(fn, args, timeout or self.timeout)
+                finally:
+                    self.running -= 1
+        except asyncio.CancelledError:
+            JOBS.labels(self.name, "cancelled").inc()
+            raise
+        finally:
+            self.in_flight -= 1
+
+    async def _run(self, fn: Callable, args: tuple, timeout: float) -> Any:
+        name = getattr(fn, "__name__", repr(fn))
+        executor = self._get_executor()
+        try:
+            future = executor.submit(fn, *args)
+        except BrokenProcessPool:
+            self._kill(executor)
+            executor = self._get_executor()
+            future = executor.submit(fn, *args)
+
+        start = time.perf_counter()
+        try:
+            result = await asyncio.wait_for(asyncio.wrap_future(future), timeout)
+        except asyncio.TimeoutError:
+            JOBS.labels(self.name, "timeout").inc()
+            log.warning(f"{self.name} pool job {name} ran over {timeout}s, restarting workers")
+            self._kill(executor)
+            raise JobTimeout(f"{name} took longer than {timeout}s") from None
+        except asyncio.CancelledError:
+            if executor not in self._killed:
+                raise
+            # The job was dropped when the pool was killed, not by our caller
+            JOBS.labels(self.name, "error").inc()
+            raise WorkerPoolError(f"{self.name} pool was restarted") from None
+        except BrokenProcessPool as e:
+            JOBS.labels(self.name, "error").inc()
+            self._kill(executor)
+            raise WorkerPoolError(f"{self.name} pool worker died") from e
+        except Exception:
+            JOBS.labels(self.name, "error").inc()
+            raise
+        finally:
+            RUN_TIME.labels(self.name).observe(time.perf_counter() - start)
+
+        JOBS.labels(self.name, "ok").inc()
+        return result
+
+    def status(self) -> dict:
+        return {
+            "workers": self.max_workers,
+            "running": self.running,
+            "queued": self.in_flight - self.running,
+            "max_queue": self.max_queue,
+            "restarts": self.restarts,
+        }
+
+    def shutdown(self) -> None:
+        if self._executor is not None:
+            self._executor.shutdown(wait=False, cancel_futures=True)
+            self._executor = None
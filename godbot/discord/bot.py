@@ -5,31 +5,56 @@ Discord bot client implementation
 import discord
 from discord import app_commands
 import asyncio
+from typing import Optional
 
-from godbot.core.memory import MemoryDB
-from godbot.core.vector_memory import VectorMemory
-from godbot.core.llm import stream_response
-from plugins.plugin_manager import SuperPluginManager
+from godbot.config import AppConfig
+from godbot.core.context_cache import ConversationContextStore
+from godbot.core.debounce import Debouncer
+from godbot.core.generations import GenerationTracker
+from godbot.core.model_catalog import ModelCatalog
+from godbot.core.model_lifecycle import ModelLifecycle, parse_hours, parse_keep_alive_overrides
+from godbot.core.llm import stream_chat, stream_response
+from godbot.core.router import OllamaRouter
 from agents import AgentManager
 from research_agent import ResearchAgent
 from committee_agent import CommitteeAgent
 from optimizer import PerformanceOptimizer
 from personality import PersonalityManager
-import audio
-import dashboard
 from godbot.core.scheduler import Scheduler
-import scheduled_tasks.memory_cleanup as task_memory_cleanup
-import scheduled_tasks.plugin_autoreload as task_plugin_reload
-import scheduled_tasks.daily_report as task_daily_report
-import scheduled_tasks.ping_test as task_ping_test
+from godbot.core.triage import Triage
+from godbot.core.worker_pool import WorkerPool
 
 
 class MyClient(discord.Client):
-    def __init__(self, intents: discord.Intents):
+    def __init__(self, intents: discord.Intents, config: Optional[AppConfig] = None):
         super().__init__(intents=intents)
+        self.config = config or AppConfig()
         self.tree = app_commands.CommandTree(self)
-        self.current_model = "dolphin-llama3:latest"  # Fast and reliable
-        self.long_memory = MemoryDB("long_memory.db")
+        self.current_model = self.config.model
+        self.llm_router = OllamaRouter(
+            self.config.ollama_urls, self.config.ollama_parallel, failure_threshold=self.config.llm_failure_threshold
+        )
+        self.llm_context = ConversationContextStore()  # Ollama context vectors per conversation
+        self.model_catalog = ModelCatalog()  # installed Ollama models, refreshed by the scheduler
+        self.model_lifecycle = ModelLifecycle(
+            default_keep_alive=self.config.keep_alive,
+            overrides=parse_keep_alive_overrides(self.config.keep_alive_overrides),
+            pinned_model=self.config.model,
+            pinned_hours=parse_hours(self.config.pin_hours),
+            agent_idle=self.config.agent_model_idle,
+        )
+        self.triage = Triage(
+            self.config.triage_mode,
+            threshold=self.config.triage_threshold,
+            tokens_per_hour=self.config.triage_tokens_per_hour,
+            path=self.config.triage_file or None,
+        )
+        self.debouncer = Debouncer(self.config.debounce_window, self.config.debounce_max_wait)
+        self.generations = GenerationTracker(self.config.generation_timeout)  # cancellable LLM replies
+        # CPU-bound deterministic handlers run here, off the event loop
+        self.worker_pool = WorkerPool(
+            "deterministic", self.config.worker_processes, timeout=self.config.worker_timeout
+        )
         # Tools now handled via deterministic registry
         # Stub for backward compatibility
         class ToolStub:
@@ -38,62 +63,76 @@ class MyClient(discord.Client):
             def call_tool(self, name, args):
                 return None
         self.tools = ToolStub()
-        self.plugins = SuperPluginManager()
-        self.vector_memory = VectorMemory()
+        # Heavy subsystems are initialized by godbot.app.startup() in setup_hook
+        self.long_memory = None
+        self.user_facts = None
+        self.reminders = None
+        self.response_cache = None
+        self.plugins = None
+        self.vector_memory = None
+        self.voice_agent = None
+        self.startup_profile = None
         self.agent_manager = AgentManager()
         self.research_agent = ResearchAgent(self)
         self.committee_agent = CommitteeAgent(self)
         self.optimizer = PerformanceOptimizer(self)
         self.personality = PersonalityManager()
-        self.voice_agent = audio.VoiceAgent(self)
         self.scheduler = Scheduler(self)
         self.dashboard_config = {}  # For storing config like report_channel_id
+        self.dashboard_runner = None  # aiohttp runner, see dashboard.start_dashboard
 
     async def setup_hook(self):
-        await self.tree.sync()
-        print("Discord slash commands synced.")
-        dashboard.start_dashboard(self, port=5000)
-        print("Dashboard running on http://localhost:5000")
-        asyncio.create_task(self.autoupdater())
-        
-        # Register scheduled tasks (Phase 12)
-        self.scheduler.add("heartbeat", 60, task_ping_test.ping_test)
-        self.scheduler.add("plugin_reload", 30, task_plugin_reload.plugin_autoreload)
-        self.scheduler.add("memory_cleanup", 1800, task_memory_cleanup.memory_cleanup)
-        self.scheduler.add("daily_report", 86400, task_daily_report.daily_report)
-        
-        # Start scheduler
-        asyncio.create_task(self.scheduler.start())
+        from godbot.app import startup
+
+        await startup(self)
+
+    async def close(self):
+        import ollama_client
+
+        if self.dashboard_runner is not None:
+            await self.dashboard_runner.cleanup()
+            self.dashboard_runner = None
+        await ollama_client.close()
+        self.worker_pool.shutdown()
+        await super().close()
 
     async def autoupdater(self):
         while True:
             await asyncio.sleep(3600)
             self.plugins.auto_update()
 
+    async def send_reminder(self, reminder):
+        """Deliver a due reminder (see godbot.core.reminders.ReminderService)."""
+        channel_id = int(reminder.channel_id)
+        channel = self.get_channel(channel_id) or await self.fetch_channel(channel_id)
+        await channel.send(f"⏰ <@{reminder.user_id}> Reminder: {reminder.message}")
+
     async def stream(self, prompt):
         """Stream method for agents to use"""
         async for chunk in stream_response(prompt, self.current_model):
             yield chunk
 
     async def direct_agent_call(self, prompt):
-        # Format prompt like the agent wrapper for consistency
-        agent_prompt = f"""You are God Bot, a helpful and intelligent AI assistant.
+        messages = [
+            {
+                "role": "system",
+                "content": (
+                    "You are God Bot, a helpful and intelligent AI assistant.\n\n"
+                    "Your name is God Bot. You are friendly, knowledgeable, and respond naturally."
+                ),
+            },
+            {"role": "user", "content": prompt},
+        ]
 
-Your name is God Bot. You are friendly, knowledgeable, and respond naturally.
-
-User: {prompt}
-Assistant:"""
-        
         full = ""
-        async for chunk in stream_response(agent_prompt, self.current_model):
+        async for chunk in stream_chat(messages, self.current_model):
             txt = chunk.get("response", "")
             if txt:
                 full += txt
-        
+
         return full if full.strip() else "(no response)"
 
 
-def create_client(intents: discord.Intents) -> MyClient:
+def create_client(intents: discord.Intents, config: Optional[AppConfig] = None) -> MyClient:
     """Create and return a configured Discord client"""
-    return MyClient(intents)
-
+    return MyClient(intents, config)
@@ -1,2 +1,5 @@
+from .core_cmds import register_core_commands
 from .finance_cmds import register_finance_commands
 from .wildrift_cmds import register_wildrift_commands
+
+__all__ = ["register_core_commands", "register_finance_commands", "register_wildrift_commands"]
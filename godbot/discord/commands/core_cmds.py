@@ -0,0 +1,256 @@
+# godbot/discord/commands/core_cmds.py
+"""
+Core slash commands: agent, models, plugins, voice, agents, tasks, reminders, memory
+"""
+from typing import Optional
+
+import discord
+from discord import app_commands
+
+from godbot.discord.handlers import run_agent
+
+
+def register_core_commands(client: discord.Client) -> None:
+    tree = client.tree
+
+    @tree.command(name="ask", description="Ask the agent (with tool-use).")
+    async def ask_cmd(interaction: discord.Interaction, prompt: str):
+        try:
+            response = await run_agent(client, interaction, prompt)
+        except Exception as e:
+            await interaction.followup.send(f"Error: {str(e)}")
+
+    @tree.command(name="research", description="Conduct deep research on a topic.")
+    async def research_cmd(interaction: discord.Interaction, topic: str, depth: str = "medium"):
+        await interaction.response.defer()
+        msg = await interaction.followup.send(f"Researching '{topic}'...")
+
+        valid_depths = ["shallow", "medium", "deep"]
+        if depth not in valid_depths:
+            depth = "medium"
+
+        try:
+            result = await client.research_agent.research(topic, depth)
+            final_text = f"**Research on: {topic}**\n\n{result}"
+            if len(final_text) > 2000:
+                final_text = final_text[:1997] + "..."
+            await msg.edit(content=final_text)
+        except Exception as e:
+            await msg.edit(content=f"Research failed: {str(e)}")
+
+    @tree.command(name="committee", description="Have multiple agents discuss a question.")
+    async def committee_cmd(interaction: discord.Interaction, question: str):
+        await interaction.response.defer()
+        msg = await interaction.followup.send("Forming committee...")
+
+        try:
+            result = await client.committee_agent.discuss(question)
+            consensus = result["consensus"]
+            if len(consensus) > 2000:
+                consensus = consensus[:1997] + "..."
+            await msg.edit(content=f"**Committee Discussion:**\n\n{consensus}")
+        except Exception as e:
+            await msg.edit(content=f"Committee discussion failed: {str(e)}")
+
+    @tree.command(name="committee2", description="Committee V2 analysis")
+    async def committee2_cmd(interaction: discord.Interaction, question: str):
+        await interaction.response.defer()
+        result = await client.committee_agent.discuss(question)
+        await interaction.followup.send(result["consensus"][:2000])
+
+    async def model_autocomplete(interaction: discord.Interaction, current: str):
+        """Autocomplete for available Ollama models (served from the model catalog)"""
+        catalog = client.model_catalog
+        catalog.refresh_in_background()
+        # Return top 25 matches (Discord limit)
+        return [app_commands.Choice(name=m, value=m) for m in catalog.search(current, limit=25)]
+
+    @tree.command(name="setmodel", description="Switch Ollama model.")
+    @app_commands.autocomplete(model=model_autocomplete)
+    async def setmodel_cmd(interaction: discord.Interaction, model: str):
+        client.current_model = model
+        # Context tokens are model-specific; next turns fall back to text history
+        client.llm_context.invalidate(model)
+        # Load it now so the next message doesn't pay for it
+        client.model_lifecycle.switch(model)
+        await interaction.response.send_message(f"✅ Model changed to **{model}** (warming up)")
+
+    @tree.command(name="models", description="List available Ollama models.")
+    async def models_cmd(interaction: discord.Interaction, refresh: bool = False):
+        catalog = client.model_catalog
+        if refresh or not len(catalog):
+            await interaction.response.defer()
+            await catalog.refresh()
+            send = interaction.followup.send
+        else:
+            send = interaction.response.send_message
+
+        if not len(catalog):
+            if catalog.last_error:
+                await send("❌ Could not connect to Ollama.")
+            else:
+                await send("No models found. Run `ollama pull <model>` to download one.")
+            return
+
+        current = client.current_model
+        lines = [f"**Available Models:** (current: `{current}`)\n"]
+        for name in catalog.names()[:20]:  # Limit to 20
+            marker = "→ " if name == current else "  "
+            lines.append(f"`{marker}{name}` ({catalog.get(name).describe()})")
+        await send("\n".join(lines))
+
+    @tree.command(name="plugins_list", description="List installed plugins.")
+    async def plugins_list(interaction: discord.Interaction):
+        out = client.plugins.list_plugins()
+        await interaction.response.send_message("\n".join(map(str, out)) or "No plugins installed.")
+
+    @tree.command(name="plugin_install", description="Install plugin from local folder.")
+    async def plugin_install(interaction: discord.Interaction, folder: str):
+        name = client.plugins.install_from_folder(folder)
+        await interaction.response.send_message(f"Installed plugin: {name}")
+
+    @tree.command(name="plugin_remove", description="Remove plugin.")
+    async def plugin_remove(interaction: discord.Interaction, name: str):
+        ok = client.plugins.remove(name)
+        await interaction.response.send_message("Removed." if ok else "Not found.")
+
+    @tree.command(name="joinvoice", description="Bot joins your VC")
+    async def joinvoice(interaction: discord.Interaction):
+        if not interaction.user.voice:
+            return await interaction.response.send_message("You must be in a voice channel.")
+        channel = interaction.user.voice.channel
+        await client.voice_agent.join(channel)
+        await interaction.response.send_message("Joined voice channel.")
+
+    @tree.command(name="leavevoice", description="Bot leaves the voice channel.")
+    async def leavevoice(interaction: discord.Interaction):
+        await client.voice_agent.leave()
+        await interaction.response.send_message("Left voice channel.")
+
+    @tree.command(name="muteai", description="Stop the AI from listening.")
+    async def muteai(interaction: discord.Interaction):
+        client.voice_agent.enabled = False
+        await interaction.response.send_message("AI voice agent muted.")
+
+    @tree.command(name="unmuteai", description="Enable AI listening.")
+    async def unmuteai(interaction: discord.Interaction):
+        client.voice_agent.enabled = True
+        await interaction.response.send_message("AI voice agent unmuted.")
+
+    @tree.command(name="agent_create", description="Create a new agent.")
+    async def agent_create(interaction: discord.Interaction, name: str, model: str):
+        client.agent_manager.create(name, model)
+        await interaction.response.send_message(f"Agent '{name}' spawned.")
+
+    @tree.command(name="agent_list", description="List all agents.")
+    async def agent_list(interaction: discord.Interaction):
+        await interaction.response.send_message(str(client.agent_manager.list()))
+
+    @tree.command(name="agent_kill", description="Kill an agent.")
+    async def agent_kill(interaction: discord.Interaction, name: str):
+        client.agent_manager.kill(name)
+        await interaction.response.send_message(f"Killed {name}.")
+
+    @tree.command(name="task_list", description="List scheduled tasks.")
+    async def task_list(interaction: discord.Interaction):
+        out = [t.describe() for t in client.scheduler.tasks.values()]
+        await interaction.response.send_message("\n".join(out)[:1900] or "No tasks scheduled.")
+
+    @tree.command(name="task_enable", description="Enable a task.")
+    async def task_enable(interaction: discord.Interaction, name: str):
+        client.scheduler.enable(name)
+        await interaction.response.send_message(f"✅ Enabled: {name}")
+
+    @tree.command(name="task_disable", description="Disable a task.")
+    async def task_disable(interaction: discord.Interaction, name: str):
+        client.scheduler.disable(name)
+        await interaction.response.send_message(f"❌ Disabled: {name}")
+
+    @tree.command(name="triage", description="Show or set when the bot answers unprompted in this channel.")
+    @app_commands.default_permissions(manage_channels=True)
+    @app_commands.choices(mode=[
+        app_commands.Choice(name="mention: only when mentioned or replied to", value="mention"),
+        app_commands.Choice(name="smart: questions and requests", value="smart"),
+        app_commands.Choice(name="all: every message", value="all"),
+        app_commands.Choice(name="default", value="default"),
+    ])
+    async def triage_cmd(interaction: discord.Interaction, mode: Optional[app_commands.Choice[str]] = None):
+        triage = client.triage
+        channel_id = interaction.channel.id
+        if mode is not None:
+            triage.set_mode(channel_id, None if mode.value == "default" else mode.value)
+        budget = triage.budget_left(channel_id)
+        stats = triage.stats()
+        await interaction.response.send_message(
+            f"Triage mode here: **{triage.mode(channel_id)}** (default {triage.default_mode})\n"
+            f"LLM budget left this hour: {'unlimited' if budget is None else f'{max(0, budget):,.0f} tokens'}\n"
+            f"LLM calls avoided so far: {stats['avoided_ratio']:.0%} of {stats['llm'] + stats['tools'] + stats['ignored']} messages"
+        )
+
+    @tree.command(name="stop", description="Stop the replies the bot is writing for you in this channel.")
+    async def stop_cmd(interaction: discord.Interaction):
+        user_id, channel_id = interaction.user.id, interaction.channel.id
+        queued = client.debouncer.discard(lambda item: item[0].author.id == user_id and item[0].channel.id == channel_id)
+        stopped = client.generations.cancel_where(user_id=user_id, channel_id=channel_id, reason="stop")
+        if stopped or queued:
+            await interaction.response.send_message(f"⏹️ Stopped {stopped + queued} repl{'y' if stopped + queued == 1 else 'ies'}.")
+        else:
+            await interaction.response.send_message("Nothing to stop.")
+
+    @tree.command(name="remind", description="Set a reminder: remind <minutes> <message> [every_minutes]")
+    async def remind(interaction: discord.Interaction, minutes: int, message: str, every_minutes: int = 0):
+        if minutes < 1 or minutes > 10080:  # Max 7 days
+            await interaction.response.send_message("⏰ Minutes must be between 1 and 10080 (7 days).")
+            return
+        if every_minutes and (every_minutes < 5 or every_minutes > 43200):  # 5 min - 30 days
+            await interaction.response.send_message("⏰ Repeat interval must be between 5 and 43200 minutes.")
+            return
+
+        reminder = client.reminders.add(
+            interaction.user.id,
+            interaction.channel.id,
+            message,
+            minutes * 60,
+            repeat=every_minutes * 60 if every_minutes else None,
+        )
+        repeat = f", then every {every_minutes} minutes" if every_minutes else ""
+        await interaction.response.send_message(f"⏳ Reminder #{reminder.id} set for {minutes} minutes{repeat}!")
+
+    reminders_group = app_commands.Group(name="reminders", description="Manage your reminders.")
+
+    @reminders_group.command(name="list", description="List your pending reminders.")
+    async def reminders_list(interaction: discord.Interaction):
+        pending = client.reminders.list_for(interaction.user.id)
+        if not pending:
+            await interaction.response.send_message("No pending reminders.")
+            return
+        lines = []
+        for r in pending:
+            repeat = f" (every {int(r.repeat // 60)}m)" if r.repeat else ""
+            lines.append(f"#{r.id} <t:{int(r.due)}:R>{repeat}: {r.message}")
+        await interaction.response.send_message("\n".join(lines)[:1900])
+
+    @reminders_group.command(name="cancel", description="Cancel one of your reminders.")
+    async def reminders_cancel(interaction: discord.Interaction, reminder_id: int):
+        if client.reminders.cancel(reminder_id, user_id=interaction.user.id):
+            await interaction.response.send_message(f"🗑️ Cancelled reminder #{reminder_id}.")
+        else:
+            await interaction.response.send_message(f"No reminder #{reminder_id} of yours.")
+
+    tree.add_command(reminders_group)
+
+    @tree.command(name="mymemory", description="View what the bot remembers about you.")
+    async def mymemory_cmd(interaction: discord.Interaction):
+        facts = client.user_facts.get_facts(interaction.user.id)
+        if facts:
+            fact_list = "\n".join([f"• {f}" for f in facts])
+            await interaction.response.send_message(f"**What I remember about you:**\n{fact_list[:1900]}")
+        else:
+            await interaction.response.send_message("I don't have any memories stored about you yet.")
+
+    @tree.command(name="forgetme", description="Clear all memories about you.")
+    async def forgetme_cmd(interaction: discord.Interaction):
+        if client.user_facts.forget(interaction.user.id):
+            await interaction.response.send_message("✅ I've forgotten everything about you.")
+        else:
+            await interaction.response.send_message("I didn't have any memories about you anyway.")
@@ -0,0 +1,485 @@
+# godbot/discord/handlers.py
+"""
+Message and agent handlers: /ask agent loop and freeform on_message replies
+"""
+import asyncio
+import io
+
+import discord
+
+from deterministic import try_deterministic_tools_async
+from deterministic.results import EmbedResult, FileResult, LLMContextResult, TextResult
+from godbot.core.llm import cached_stream_response, llm_available, stream_chat, stream_response
+from godbot.core.metrics import counter, histogram
+
+MESSAGES = counter("godbot_messages_total", "Messages answered", labels=("route",))
+DISCORD_EDITS = counter("godbot_discord_edits_total", "Discord message edits")
+VECTOR_SEARCH = histogram("godbot_vector_search_seconds", "Vector memory search latency")
+
+# Sent at once while every Ollama backend's circuit breaker is open
+DEGRADED_REPLY = (
+    "My language model is offline right now, so I can only do the built-in stuff "
+    "(math, conversions, reminders, builds). Try again in a minute!"
+)
+
+
+def compress_history(history: list) -> str:
+    """
+    Summaries long conversation histories into ~800 chars.
+    """
+    text = ""
+    for role, msg in history[-12:]:   # take only last 12 messages
+        text += f"{role}: {msg}\n"
+
+    if len(text) < 900:
+        return text
+
+    return "Summary: Conversation has involved topics such as " + ", ".join(
+        set([msg.split(" ")[0] for role, msg in history[-12:] if msg])
+    )
+
+
+AGENT_HISTORY_TURNS = 8  # past messages sent as role-tagged history for /ask
+
+
+async def _stream_agent_reply(client, messages, msg, tools=None):
+    """Stream a chat reply into msg, cleaned as it arrives. Returns (raw text, tool_calls, error)."""
+    full_text = ""
+    tool_calls = []
+    cleaner = client.personality.postprocessor.stream()
+    shown = ""
+    last_update = 0
+    chunk_count = 0
+    
+    async for data in stream_chat(messages, client.current_model, tools=tools):
+        # Check for errors from Ollama
+        if "error" in data:
+            print(f"[ERROR] Ollama error: {data['error']}")
+            return full_text, tool_calls, data["error"]
+        
+        tool_calls.extend(data.get("tool_calls", []))
+        chunk = data.get("response", "")
+        if chunk:
+            chunk_count += 1
+            full_text += chunk
+            shown += cleaner.feed(chunk)
+            # Optimize: Update every 50 chars instead of 30 for better performance
+            if len(shown) - last_update >= 50:
+                await msg.edit(content=shown[:2000])  # Limit to 2000 chars for Discord
+                DISCORD_EDITS.inc()
+                last_update = len(shown)
+    
+    print(f"[DEBUG] Received {chunk_count} chunks, total length: {len(full_text)}")
+    return full_text, tool_calls, None
+
+
+async def run_agent(client, interaction, prompt):
+    try:
+        await interaction.response.defer()
+        msg = await interaction.followup.send("Thinking...")
+        
+        user_id = str(interaction.user.id)
+        
+        # Native tool schemas (Ollama tool-calling format)
+        tool_schemas = client.tools.list_schemas()
+        
+        # Static system prefix first (personality + instructions + behavior
+        # plugins), compiled once and byte-identical across calls so the
+        # server can reuse its prompt cache; then role-tagged history
+        messages = [{
+            "role": "system",
+            "content": client.personality.get_agent_system_prompt(behaviors=client.plugins.behavior_injections),
+        }]
+        for role, content in client.long_memory.get_recent(user_id, limit=AGENT_HISTORY_TURNS):
+            messages.append({"role": "assistant" if role == "assistant" else "user", "content": content})
+        
+        # Get vector memory for better context
+        related_context = ""
+        try:
+            with VECTOR_SEARCH.time():
+                related = client.vector_memory.search(prompt, 3)
+            if related:
+                related_context = "Related topics:\n"
+                for m in related[:2]:  # Limit to 2 related items
+                    related_context += f"- {m[:100]}\n"
+                related_context += "\n"
+        except:
+            pass  # Vector memory optional
+        
+        # Get interaction context
+        server_name = interaction.guild.name if interaction.guild else "DM"
+        channel_name = interaction.channel.name if hasattr(interaction.channel, 'name') else "DM"
+        
+        messages.append({
+            "role": "user",
+            "content": f"[Server: {server_name} | Channel: {channel_name} | User: {interaction.user.name}]\n{related_context}{prompt}",
+        })
+        
+        print(f"[DEBUG] Sending {len(messages)} messages to Ollama: {prompt[:200]}...")
+        print(f"[DEBUG] Model: {client.current_model}")
+        
+        # Cancelled by /stop; stopped by the generation timeout
+        try:
+            async with client.generations.track(
+                [interaction.id], interaction.user.id, interaction.channel.id, client.current_model
+            ):
+                full_text, tool_calls, error_msg = await _stream_agent_reply(client, messages, msg, tools=tool_schemas or None)
+                
+                if tool_calls and not error_msg:
+                    # Run each native tool call and let the model answer with the results
+                    messages.append({"role": "assistant", "content": full_text, "tool_calls": tool_calls})
+                    for call in tool_calls:
+                        fn = call.get("function", {})
+                        tool_name = fn.get("name")
+                        print(f"[DEBUG] Tool call detected: {tool_name}")
+                        result = client.tools.call_tool(tool_name, fn.get("arguments") or {})
+                        messages.append({"role": "tool", "content": str(result)})
+                    full_text, _, error_msg = await _stream_agent_reply(client, messages, msg)
+        except asyncio.CancelledError:
+            await msg.edit(content="⏹️ Stopped.")
+            DISCORD_EDITS.inc()
+            raise
+        except TimeoutError:
+            error_msg = "The model took too long to answer."
+        
+        # Handle Ollama errors
+        if error_msg:
+            await msg.edit(content=f"❌ {error_msg}")
+            DISCORD_EDITS.inc()
+            return None
+        
+        # Ensure we always send a response, even if empty
+        if not full_text.strip():
+            full_text = "(no response from model - check Ollama is running)"
+        else:
+            # Enhance response with personality
+            full_text = client.personality.enhance_response(full_text)
+        await msg.edit(content=full_text[:2000])
+        DISCORD_EDITS.inc()
+        MESSAGES.labels("agent").inc()
+        client.long_memory.save(user_id, "user", prompt)
+        client.long_memory.save(user_id, "assistant", full_text)
+        try:
+            client.vector_memory.add(user_id, prompt)
+            client.vector_memory.add(user_id, full_text)
+        except:
+            pass
+        return full_text
+    except Exception as e:
+        print(f"[ERROR] run_agent failed: {e}")
+        import traceback
+        traceback.print_exc()
+        try:
+            await interaction.followup.send(f"Error: {str(e)}")
+        except:
+            pass
+        return None
+
+
+# ============================
+# DETERMINISTIC RESULT DELIVERY
+# ============================
+# One sender per deterministic.results kind: (client, message, user_id, prompt_text, result)
+
+def _remember(client, user_id: str, prompt_text: str, reply: str) -> None:
+    client.long_memory.save(user_id, "user", prompt_text)
+    client.long_memory.save(user_id, "assistant", reply)
+
+
+async def _send_text(client, message, user_id, prompt_text, result: TextResult) -> None:
+    print(f"[DEBUG] Deterministic handler response: {result.text[:200]}")
+    await message.reply(result.text[:2000])
+    _remember(client, user_id, prompt_text, result.text)
+    MESSAGES.labels("deterministic").inc()
+
+
+async def _send_llm(client, message, user_id, prompt_text, result: LLMContextResult) -> None:
+    # The prompt is fully determined by the deterministic analysis, so
+    # identical requests are answered from the cache
+    full_text = ""
+    async for data in cached_stream_response(
+        client.response_cache, result.route, result.prompt, client.current_model,
+        version=client.personality.version,
+    ):
+        if data.get("circuit_open"):
+            full_text = DEGRADED_REPLY
+        if data.get("done"):
+            client.triage.charge(message.channel.id, _tokens_used(data))
+        chunk = data.get("response", "")
+        if chunk:
+            full_text += chunk
+
+    if full_text.strip():
+        await message.reply(full_text[:2000])
+        _remember(client, user_id, prompt_text, full_text)
+    MESSAGES.labels(result.route).inc()
+
+
+async def _send_embed(client, message, user_id, prompt_text, result: EmbedResult) -> None:
+    embed = discord.Embed(title=result.title[:256], description=result.description[:4096], color=result.color)
+    for name, value in result.fields[:25]:
+        embed.add_field(name=name[:256], value=value[:1024], inline=False)
+    await message.reply(embed=embed)
+    _remember(client, user_id, prompt_text, result.memory_text)
+    MESSAGES.labels("deterministic").inc()
+
+
+async def _send_file(client, message, user_id, prompt_text, result: FileResult) -> None:
+    await message.reply(result.text[:2000], file=discord.File(io.BytesIO(result.data), filename=result.filename))
+    _remember(client, user_id, prompt_text, result.memory_text)
+    MESSAGES.labels("deterministic").inc()
+
+
+RESULT_SENDERS = {
+    "text": _send_text,
+    "llm": _send_llm,
+    "embed": _send_embed,
+    "file": _send_file,
+}
+
+
+def _is_reply_to_bot(client, message) -> bool:
+    reference = getattr(message, "reference", None)
+    resolved = getattr(reference, "resolved", None)
+    return getattr(resolved, "author", None) == client.user
+
+
+def _tokens_used(data: dict) -> int:
+    """LLM tokens a final chunk reports (0 for response cache hits)."""
+    return (data.get("eval_count") or 0) + (data.get("prompt_eval_count") or 0)
+
+
+async def handle_message(client, message):
+    if message.author == client.user:
+        return
+    
+    print(f"[DEBUG] Message received: {message.content[:50]}... from {message.author}")
+    
+    # Ignore slash commands (they're handled separately)
+    if message.content.startswith('/'):
+        return
+    
+    # Handle image attachments
+    if message.attachments:
+        if not llm_available():
+            await message.channel.send(DEGRADED_REPLY)
+            MESSAGES.labels("degraded").inc()
+            return
+        file = message.attachments[0]
+        img_bytes = await file.read()
+        desc = ""
+        async for d in stream_response("Describe this image.", client.current_model):
+            chunk = d.get("response", "")
+            if chunk:
+                desc += chunk
+        if desc.strip():
+            await message.channel.send(desc[:2000])
+        MESSAGES.labels("image").inc()
+        return
+    
+    # Skip if message is too short or just emojis/mentions
+    content_stripped = message.content.strip()
+    if len(content_stripped) < 2:
+        return  # Too short, probably just an emoji or punctuation
+    
+    # Skip slash commands (let Discord handle those)
+    if content_stripped.startswith('/'):
+        return
+    
+    # Skip if message is just mentions of other users (not the bot)
+    if content_stripped.startswith('<@') and client.user not in message.mentions:
+        return
+    
+    # Triage: decide in microseconds whether this message is worth an LLM call
+    decision = client.triage.decide(
+        content_stripped,
+        message.channel.id,
+        dm=isinstance(message.channel, discord.DMChannel),
+        mentioned=client.user in message.mentions,
+        reply_to_bot=_is_reply_to_bot(client, message),
+    )
+    if not (decision.llm or decision.tools):
+        return
+
+    user_id = str(message.author.id)
+    # Clean the message text (remove bot mentions)
+    prompt_text = message.content.replace(f"<@{client.user.id}>", "").replace(f"<@!{client.user.id}>", "").strip()
+    # Skip empty messages
+    if not prompt_text:
+        return
+
+    # ============================
+    # TOOLS ORCHESTRATION LAYER (Phase 11)
+    # ============================
+    # Run deterministic handlers first (CPU-bound ones in the worker pool);
+    # they answer even messages triage keeps away from the LLM
+    tool_result = await try_deterministic_tools_async(prompt_text, client.worker_pool)
+    if tool_result is not None:
+        await RESULT_SENDERS[tool_result.kind](client, message, user_id, prompt_text, tool_result)
+        return
+    # ============================
+    # END TOOLS ORCHESTRATION
+    # ============================
+
+    if not decision.llm:
+        return
+
+    # A quick run of messages from one user in one channel gets one reply;
+    # a newer message cancels a reply that is still being generated
+    await client.debouncer.submit(
+        (message.channel.id, message.author.id), (message, prompt_text), lambda burst: _reply_llm(client, burst)
+    )
+
+
+async def _reply_llm(client, burst):
+    """LLM reply to a burst of (message, prompt_text) from one user in one channel."""
+    message = burst.last[0]
+    user_id = str(message.author.id)
+    prompt_text = "\n".join(text for _, text in burst.items)
+    if len(burst.items) > 1:
+        print(f"[DEBUG] Answering {len(burst.items)} messages together")
+
+    # Show typing indicator
+    async with message.channel.typing():
+        # Deterministic-only mode while the LLM is down: answer now
+        # instead of waiting on a backend that isn't there
+        if not llm_available():
+            burst.commit()
+            await message.reply(DEGRADED_REPLY)
+            MESSAGES.labels("degraded").inc()
+            return
+
+        # Store any facts from the message
+        client.user_facts.store_fact(message.author.id, prompt_text)
+        
+        # Check if this is a greeting or a follow-up
+        greetings = ["hi", "hey", "hello", "yo", "sup", "what's up", "whats up"]
+        is_greeting = prompt_text.lower().strip() in greetings
+        
+        # Continue from the last Ollama context for this user+channel when we
+        # have one for the current model; otherwise fall back to text history
+        ctx_key = client.llm_context.key(user_id, message.channel.id)
+        context = None if is_greeting else client.llm_context.get(ctx_key, client.current_model)
+        
+        system_prompt = None
+        if is_greeting:
+            agent_prompt = f"""Reply to "{prompt_text}" with a short casual greeting. Just say hey or what's up - nothing more."""
+        elif context:
+            # History (and the system prefix) are already in the context tokens
+            agent_prompt = f"""User: {prompt_text}
+Your response:"""
+        else:
+            # Get user's stored facts for context
+            facts = client.user_facts.get_facts(message.author.id)
+            memory_context = ""
+            if facts:
+                memory_context = f"[You remember about this user: {'; '.join(facts[-5:])}]\n"
+            
+            # Get recent conversation history for context (limited to avoid stuck conversations)
+            recent_history = client.long_memory.get_recent(user_id, limit=3)
+            history_context = ""
+            if recent_history:
+                # Use compression for long histories (Phase 11)
+                compressed = compress_history(recent_history)
+                if len(compressed) < 900:
+                    history_context = "Recent conversation:\n" + compressed + "\n\n"
+                else:
+                    history_lines = []
+                    for role, content in recent_history[-3:]:
+                        if role == "user":
+                            history_lines.append(f"User: {content[:80]}")
+                        else:
+                            history_lines.append(f"You: {content[:80]}")
+                    if history_lines:
+                        history_context = "Recent conversation:\n" + "\n".join(history_lines[-2:]) + "\n\n"
+            
+            # Static instructions go in the cached system prefix; per-user
+            # memory and history follow in the prompt
+            system_prompt = client.personality.get_chat_system_prompt()
+            agent_prompt = f"""{memory_context}{history_context}User: {prompt_text}
+Your response:"""
+        
+        full_text = ""
+        generation = None
+        
+        try:
+            # Tracked under every message in the burst: deleting all of them,
+            # /stop or a newer message cancels it (and the Ollama stream)
+            async with client.generations.track(
+                [m.id for m, _ in burst.items], message.author.id, message.channel.id, client.current_model
+            ) as generation:
+                try:
+                    # Greetings don't depend on the conversation, so they can be
+                    # served from the response cache (keyed on the user's text)
+                    async for data in cached_stream_response(
+                        client.response_cache, "greeting" if is_greeting else "freeform",
+                        agent_prompt, client.current_model,
+                        cache_key=prompt_text, version=client.personality.version,
+                        system=system_prompt, context=context,
+                    ):
+                        if "error" in data:
+                            client.llm_context.drop(ctx_key)
+                        if data.get("circuit_open"):
+                            full_text = DEGRADED_REPLY
+                            break
+                        if data.get("done"):
+                            client.triage.charge(message.channel.id, _tokens_used(data))
+                            if not is_greeting:
+                                client.llm_context.put(ctx_key, client.current_model, data.get("context"))
+                        chunk = data.get("response", "")
+                        if chunk:
+                            full_text += chunk
+                        await asyncio.sleep(0)  # Yield control
+                except asyncio.CancelledError:
+                    if burst.superseded:
+                        generation.reason = generation.reason or "superseded"
+                    raise
+        except TimeoutError:
+            print("[DEBUG] Timeout waiting for response")
+            if not full_text.strip():
+                full_text = "Sorry, that took too long. Try again!"
+        except Exception as e:
+            print(f"[ERROR] Ollama streaming failed: {e}")
+            full_text = "Sorry, I had trouble responding. Try again!"
+        
+        if full_text.strip():
+            # Prefixes, identity fixes, assistant boilerplate, transcript lines
+            response = client.personality.postprocessor.process(full_text)
+            if not response:
+                response = "hey"
+            
+            # Debug: Show what actually gets sent to Discord
+            print(f"[DEBUG] Bot Response: {response[:2000]}")
+            
+            # Send response (past this point a newer message no longer cancels it)
+            burst.commit()
+            # Reply to the newest message of the burst that is still there
+            gone = generation.gone if generation is not None else ()
+            message = next((m for m, _ in reversed(burst.items) if m.id not in gone), message)
+            await message.reply(response[:2000])
+            MESSAGES.labels("greeting" if is_greeting else "llm").inc()
+            
+            # Save to memory (simplified)
+            client.long_memory.save(user_id, "user", prompt_text)
+            client.long_memory.save(user_id, "assistant", response)
+
+
+def register_events(client: discord.Client) -> None:
+    @client.event
+    async def on_ready():
+        print(f"Logged in as {client.user}")
+
+    @client.event
+    async def on_message(message):
+        await handle_message(client, message)
+
+    @client.event
+    async def on_raw_message_delete(payload):
+        # Raw so it also fires for messages that fell out of the cache
+        cancel_for_deleted_message(client, payload.message_id)
+
+
+def cancel_for_deleted_message(client, message_id: int) -> None:
+    """Stop answering a message the user deleted, queued or mid-generation."""
+    client.debouncer.discard(lambda item: item[0].id == message_id)
+    client.generations.discard(message_id, "deleted")
@@ -0,0 +1,97 @@
+# godbot/discord/sync.py
+"""
+Slash command sync helpers.
+
+Discord's global command sync is slow and rate limited, so we only sync
+when the serialized command tree actually changed since the last sync.
+The last synced hash is stored per scope ("global" or a guild id).
+"""
+import hashlib
+import json
+import os
+from typing import Any, Dict, List, Optional
+
+import discord
+from discord import app_commands
+
+# Phase 11.1 logging
+from godbot.core.logging import get_logger
+
+log = get_logger(__name__)
+
+SYNC_STATE_FILE = "command_sync.json"
+
+
+def _command_payload(command: Any, tree: app_commands.CommandTree) -> Dict[str, Any]:
+    """Serialize one command the same way discord.py sends it to the API."""
+    try:
+        return command.to_dict(tree)  # discord.py >= 2.4
+    except TypeError:
+        return command.to_dict()  # discord.py 2.3
+
+
+def serialize_tree(tree: app_commands.CommandTree, guild: Optional[discord.abc.Snowflake] = None) -> List[Dict[str, Any]]:
+    """Return the API payload for every command in the tree, sorted by name."""
+    payload = [_command_payload(cmd, tree) for cmd in tree.get_commands(guild=guild)]
+    return sorted(payload, key=lambda c: (c.get("type", 1), c.get("name", "")))
+
+
+def tree_hash(tree: app_commands.CommandTree, guild: Optional[discord.abc.Snowflake] = None) -> str:
+    """Stable sha256 of the serialized command tree."""
+    blob = json.dumps(serialize_tree(tree, guild), sort_keys=True, separators=(",", ":"), default=str)
+    return hashlib.sha256(blob.encode("utf-8")).hexdigest()
+
+
+def scope_key(guild_id: Optional[int] = None) -> str:
+    return f"guild:{guild_id}" if guild_id else "global"
+
+
+def load_sync_state(path: str = SYNC_STATE_FILE) -> Dict[str, str]:
+    """Load {scope: hash} from disk (empty if missing or corrupt)."""
+    if not os.path.exists(path):
+        return {}
+    try:
+        with open(path, "r", encoding="utf-8") as f:
+            data = json.load(f)
+        return data if isinstance(data, dict) else {}
+    except (OSError, ValueError):
+        return {}
+
+
+def save_sync_state(state: Dict[str, str], path: str = SYNC_STATE_FILE) -> None:
+    with open(path, "w", encoding="utf-8") as f:
+        json.dump(state, f, indent=4)
+
+
+async def sync_if_changed(
+    tree: app_commands.CommandTree,
+    guild_id: Optional[int] = None,
+    force: bool = False,
+    state_file: str = SYNC_STATE_FILE,
+) -> bool:
+    """
+    Sync the command tree only if its hash differs from the last synced one.
+
+    - guild_id: sync to a single guild (instant, for development). Global
+      commands are copied into the guild before syncing.
+    - force: sync regardless of the stored hash.
+
+    Returns True if a sync was performed.
+    """
+    guild = discord.Object(id=guild_id) if guild_id else None
+    if guild is not None:
+        tree.copy_global_to(guild=guild)
+
+    key = scope_key(guild_id)
+    current = tree_hash(tree, guild)
+    state = load_sync_state(state_file)
+
+    if not force and state.get(key) == current:
+        log.info(f"Command tree unchanged ({key}), skipping sync")
+        return False
+
+    await tree.sync(guild=guild)
+    state[key] = current
+    save_sync_state(state, state_file)
+    log.info(f"Command tree synced ({key}, hash {current[:12]})")
+    return True
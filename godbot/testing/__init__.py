@@ -0,0 +1,9 @@
+# godbot/testing
+"""
+Stand-ins for running the bot without Discord or a GPU: a fake Ollama
+server, fake Discord messages/interactions, and the `godbot bench` harness.
+"""
+from godbot.testing.fake_discord import FakeDiscord, FakeInteraction, FakeMessage
+from godbot.testing.fake_ollama import FakeOllama
+
+__all__ = ["FakeDiscord", "FakeInteraction", "FakeMessage", "FakeOllama"]
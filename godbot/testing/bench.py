@@ -0,0 +1,208 @@
+# GodBot testing: end-to-end load test
+"""
+Replays a message corpus through the real handlers against a fake (or
+real) Ollama and reports end-to-end latency and throughput per route.
+
+    godbot bench --concurrency 16 --messages 200
+    godbot bench --routes message,ask --corpus my_messages.txt
+    godbot bench --ollama-url http://localhost:11434 --model llama3:8b
+
+Routes: "message" (on_message), "ask" (/ask) and "committee" (/committee).
+The bot is built with create_app() and initialized like startup() does,
+with throwaway databases and without voice, vector memory or the
+dashboard.
+"""
+import asyncio
+import contextlib
+import io
+import logging
+import os
+import statistics
+import tempfile
+import time
+from typing import Any, Dict, List, Optional, Sequence
+
+from godbot.testing.fake_discord import FakeDiscord
+from godbot.testing.fake_ollama import FakeOllama
+
+ROUTES = ("message", "ask", "committee")
+COMMITTEE_AGENTS = ("finance", "fitness", "wild_rift", "general")
+
+DEFAULT_CORPUS = [
+    "hey",
+    "what's up",
+    "what is 2+2",
+    "how do I get better at laning?",
+    "convert 10 km to miles",
+    "any tips for staying focused while studying?",
+    "what should I eat after a workout",
+    "tell me a fun fact about space",
+    "yo",
+    "how much should I save each month?",
+    "explain compound interest like I'm five",
+    "what's a good beginner routine for the gym",
+]
+
+
+def load_corpus(path: Optional[str]) -> List[str]:
+    if not path:
+        return list(DEFAULT_CORPUS)
+    with open(path, encoding="utf-8") as f:
+        return [line.strip() for line in f if line.strip()]
+
+
+def percentile(sorted_values: Sequence[float], pct: float) -> Optional[float]:
+    """Nearest-rank percentile of an already sorted list."""
+    if not sorted_values:
+        return None
+    rank = max(1, round(pct / 100 * len(sorted_values)))
+    return sorted_values[min(rank, len(sorted_values)) - 1]
+
+
+def build_client(ollama_url: str, model: str, data_dir: str):
+    """A fully initialized (but not logged in) bot pointed at ollama_url."""
+    from godbot import app
+    from godbot.config import AppConfig
+    from godbot.core.llm import set_router
+
+    config = AppConfig(
+        model=model,
+        memory_file=os.path.join(data_dir, "memory.json"),
+        long_memory_db=os.path.join(data_dir, "long_memory.db"),
+        reminders_db=os.path.join(data_dir, "reminders.db"),
+        response_cache_db="",
+        ollama_urls=(ollama_url,),
+        triage_mode="all",  # measure every message, not just the ones triage lets through
+        triage_tokens_per_hour=0,
+        triage_file="",
+        debounce_window=0,  # every bench message gets its own reply
+        dashboard_enabled=False,
+        voice_enabled=False,
+        vector_memory_enabled=False,
+    )
+    client = app.create_app(config)
+    app._init_memory(client)
+    app._init_plugins(client)
+    app._init_vector_store(client)
+    app._init_builds(client)
+    set_router(client.llm_router)
+    for name in COMMITTEE_AGENTS:
+        client.agent_manager.create(name, None)
+    return client
+
+
+async def _one(driver: FakeDiscord, route: str, text: str, user_id: int) -> bool:
+    """Run one request; True if the bot produced a reply."""
+    if route == "message":
+        message = await driver.send_message(text, user_id=user_id, channel_id=100 + user_id % 4)
+        return bool(message.replies)
+    if route == "ask":
+        interaction = await driver.slash("ask", user_id=user_id, prompt=text)
+    else:
+        interaction = await driver.slash("committee", user_id=user_id, question=text)
+    return bool(interaction.followups) and not interaction.followups[-1].content.startswith(("❌", "Error"))
+
+
+async def run_route(driver: FakeDiscord, route: str, corpus: List[str], messages: int,
+                    concurrency: int, users: int = 50) -> Dict[str, Any]:
+    queue: asyncio.Queue = asyncio.Queue()
+    for i in range(messages):
+        queue.put_nowait((i, corpus[i % len(corpus)]))
+    latencies: List[float] = []
+    errors = 0
+
+    async def worker():
+        nonlocal errors
+        while True:
+            try:
+                i, text = queue.get_nowait()
+            except asyncio.QueueEmpty:
+                return
+            start = time.perf_counter()
+            try:
+                ok = await _one(driver, route, text, user_id=1000 + i % users)
+            except Exception:
+                ok = False
+            latencies.append(time.perf_counter() - start)
+            errors += not ok
+
+    start = time.perf_counter()
+    await asyncio.gather(*(worker() for _ in range(concurrency)))
+    wall = time.perf_counter() - start
+    latencies.sort()
+    return {
+        "route": route,
+        "messages": len(latencies),
+        "errors": errors,
+        "per_sec": len(latencies) / wall if wall else 0.0,
+        "p50_ms": percentile(latencies, 50) * 1000 if latencies else None,
+        "p95_ms": percentile(latencies, 95) * 1000 if latencies else None,
+        "p99_ms": percentile(latencies, 99) * 1000 if latencies else None,
+        "mean_ms": statistics.fmean(latencies) * 1000 if latencies else None,
+    }
+
+
+async def run_bench(
+    routes: Sequence[str] = ROUTES,
+    corpus: Optional[List[str]] = None,
+    messages: int = 100,
+    concurrency: int = 8,
+    ollama_url: Optional[str] = None,
+    model: str = "fake-model",
+    fake: Optional[FakeOllama] = None,
+    quiet: bool = True,
+) -> Dict[str, Any]:
+    """Run each route in turn; returns {"routes": [...], "ollama": fake server stats}."""
+    import ollama_client
+    from godbot.core.llm import set_router
+
+    for route in routes:
+        if route not in ROUTES:
+            raise ValueError(f"unknown route {route!r} (expected one of {', '.join(ROUTES)})")
+    corpus = corpus or list(DEFAULT_CORPUS)
+    if ollama_url is None:
+        fake = fake or FakeOllama(models=(model,))
+        ollama_url = await fake.start()
+    else:
+        fake = None
+
+    results = []
+    # The handlers print and log every message; keep the report readable
+    silence = contextlib.redirect_stdout(io.StringIO()) if quiet else contextlib.nullcontext()
+    if quiet:
+        logging.disable(logging.INFO)
+    try:
+        with tempfile.TemporaryDirectory(prefix="godbot-bench-") as data_dir, silence:
+            client = build_client(ollama_url, model, data_dir)
+            driver = FakeDiscord(client)
+            for route in routes:
+                results.append(await run_route(driver, route, corpus, messages, concurrency))
+            client.long_memory.conn.close()
+            client.worker_pool.shutdown()
+    finally:
+        if quiet:
+            logging.disable(logging.NOTSET)
+        set_router(None)
+        await ollama_client.close()
+        if fake is not None:
+            await fake.stop()
+    return {"routes": results, "ollama": fake.stats() if fake is not None else None}
+
+
+def format_report(report: Dict[str, Any]) -> str:
+    def ms(value):
+        return f"{value:.0f}" if value is not None else "-"
+
+    lines = [f"{'route':<11}{'msgs':>7}{'errors':>8}{'msg/s':>9}{'p50 ms':>9}{'p95 ms':>9}{'p99 ms':>9}"]
+    for r in report["routes"]:
+        lines.append(
+            f"{r['route']:<11}{r['messages']:>7}{r['errors']:>8}{r['per_sec']:>9.1f}"
+            f"{ms(r['p50_ms']):>9}{ms(r['p95_ms']):>9}{ms(r['p99_ms']):>9}"
+        )
+    if report.get("ollama"):
+        o = report["ollama"]
+        lines.append(
+            f"\nfake ollama: {o['requests']} upstream requests, max {o['max_in_flight']} in flight, "
+            f"{o['tokens_sent']} tokens"
+        )
+    return "\n".join(lines)
@@ -0,0 +1,176 @@
+# GodBot testing: fake Discord
+"""
+Just enough of discord.py's message and interaction objects to drive the
+bot's handlers without a gateway connection.
+
+    driver = FakeDiscord(client)
+    message = await driver.send_message("hey", user_id=42)
+    message.replies[0].content
+
+    interaction = await driver.slash("ask", prompt="what's up?")
+    interaction.followups[-1].content
+
+Replies, sends and edits are recorded on the fake objects.
+"""
+import itertools
+from contextlib import asynccontextmanager
+from types import SimpleNamespace
+from typing import Any, List, Optional
+
+_ids = itertools.count(1_000_000)
+
+
+class FakeUser:
+    def __init__(self, id: int, name: str = "user", bot: bool = False):
+        self.id = id
+        self.name = name
+        self.display_name = name
+        self.bot = bot
+        self.mention = f"<@{id}>"
+
+    def __eq__(self, other):
+        return isinstance(other, FakeUser) and other.id == self.id
+
+    def __hash__(self):
+        return hash(self.id)
+
+    def __str__(self):
+        return self.name
+
+
+class FakeGuild:
+    def __init__(self, id: int = 1, name: str = "bench-guild"):
+        self.id = id
+        self.name = name
+
+
+class FakeMessage:
+    def __init__(self, content: str, author: FakeUser, channel: "FakeChannel",
+                 mentions: Optional[List[FakeUser]] = None):
+        self.id = next(_ids)
+        self.content = content
+        self.author = author
+        self.channel = channel
+        self.guild = channel.guild
+        self.mentions = mentions or []
+        self.attachments: List[Any] = []
+        self.embed: Any = None  # discord.Embed / discord.File sent with the message
+        self.file: Any = None
+        self.replies: List["FakeMessage"] = []
+        self.edits: List[str] = []
+
+    async def reply(self, content: str = "", **kwargs) -> "FakeMessage":
+        message = await self.channel.send(content, **kwargs)
+        self.replies.append(message)
+        return message
+
+    async def edit(self, content: Optional[str] = None, **kwargs) -> "FakeMessage":
+        if content is not None:
+            self.content = content
+            self.edits.append(content)
+        return self
+
+    async def delete(self) -> None:
+        self.channel.deleted.append(self)
+
+
+class FakeChannel:
+    def __init__(self, id: int, name: str = "general", guild: Optional[FakeGuild] = None, bot_user: Optional[FakeUser] = None):
+        self.id = id
+        self.name = name
+        self.guild = guild
+        self.bot_user = bot_user or FakeUser(0, "GodBot", bot=True)
+        self.sent: List[FakeMessage] = []
+        self.deleted: List[FakeMessage] = []
+        self.typing_count = 0
+
+    async def send(self, content: str = "", embed: Any = None, file: Any = None, **kwargs) -> FakeMessage:
+        message = FakeMessage(content, self.bot_user, self)
+        message.embed = embed
+        message.file = file
+        self.sent.append(message)
+        return message
+
+    @asynccontextmanager
+    async def typing(self):
+        self.typing_count += 1
+        yield
+
+
+class FakeResponse:
+    def __init__(self, interaction: "FakeInteraction"):
+        self._interaction = interaction
+        self._done = False
+
+    def is_done(self) -> bool:
+        return self._done
+
+    async def defer(self, **kwargs) -> None:
+        self._done = True
+
+    async def send_message(self, content: str = "", **kwargs) -> None:
+        self._done = True
+        self._interaction.followups.append(await self._interaction.channel.send(content))
+
+
+class FakeFollowup:
+    def __init__(self, interaction: "FakeInteraction"):
+        self._interaction = interaction
+
+    async def send(self, content: str = "", **kwargs) -> FakeMessage:
+        message = await self._interaction.channel.send(content)
+        self._interaction.followups.append(message)
+        return message
+
+
+class FakeInteraction:
+    def __init__(self, user: FakeUser, channel: FakeChannel):
+        self.id = next(_ids)
+        self.user = user
+        self.channel = channel
+        self.guild = channel.guild
+        self.response = FakeResponse(self)
+        self.followup = FakeFollowup(self)
+        self.followups: List[FakeMessage] = []
+
+
+class FakeDiscord:
+    """Feeds fake messages and slash commands to a (not logged in) bot client."""
+
+    def __init__(self, client, bot_user_id: int = 1, guild: Optional[FakeGuild] = None):
+        self.client = client
+        self.bot_user = FakeUser(bot_user_id, "GodBot", bot=True)
+        self.guild = guild or FakeGuild()
+        self._channels = {}
+        # discord.Client.user reads the connection state's user
+        client._connection.user = self.bot_user
+
+    def channel(self, channel_id: int = 100) -> FakeChannel:
+        if channel_id not in self._channels:
+            self._channels[channel_id] = FakeChannel(channel_id, f"channel-{channel_id}", self.guild, self.bot_user)
+        return self._channels[channel_id]
+
+    def message(self, content: str, user_id: int = 42, channel_id: int = 100) -> FakeMessage:
+        return FakeMessage(content, FakeUser(user_id, f"user{user_id}"), self.channel(channel_id))
+
+    async def send_message(self, content: str, user_id: int = 42, channel_id: int = 100) -> FakeMessage:
+        """Deliver a message to on_message; returns it once the handler is done."""
+        message = self.message(content, user_id, channel_id)
+        await self.client.on_message(message)
+        return message
+
+    async def delete_message(self, message: FakeMessage) -> None:
+        """Delete a user's message and deliver on_raw_message_delete."""
+        await message.delete()
+        payload = SimpleNamespace(message_id=message.id, channel_id=message.channel.id,
+                                  guild_id=self.guild.id, cached_message=message)
+        await self.client.on_raw_message_delete(payload)
+
+    async def slash(self, name: str, user_id: int = 42, channel_id: int = 100, **options) -> FakeInteraction:
+        """Invoke a registered slash command's callback; returns the interaction once it's done."""
+        command = self.client.tree.get_command(name)
+        if command is None:
+            raise KeyError(f"no slash command named {name!r}")
+        interaction = FakeInteraction(FakeUser(user_id, f"user{user_id}"), self.channel(channel_id))
+        await command.callback(interaction, **options)
+        return interaction
@@ -0,0 +1,188 @@
+# GodBot testing: fake Ollama
+"""
+Local stand-in for the Ollama HTTP API, for tests and load tests.
+
+    fake = FakeOllama(models=("fake-model",), tokens_per_sec=100, ttft=0.05)
+    url = await fake.start()
+    ...
+    await fake.stop()
+
+Serves /api/tags, /api/ps, /api/generate and /api/chat (streaming and
+non-streaming). Responses are canned text streamed at tokens_per_sec
+after ttft (plus load_time the first time a model is used), so
+throughput can be measured without a GPU.
+"""
+import asyncio
+import json
+import random
+import time
+from typing import Any, Dict, Iterable, Optional
+
+from aiohttp import web
+
+WORDS = (
+    "sure here is a quick answer that should help you get going with this one "
+    "let me know if you want more detail on any part of it"
+).split()
+
+
+class FakeOllama:
+    def __init__(
+        self,
+        models: Iterable[str] = ("fake-model",),
+        tokens_per_sec: float = 100.0,
+        ttft: float = 0.05,
+        tokens: int = 40,
+        jitter: float = 0.0,
+        load_time: float = 0.0,
+        seed: Optional[int] = None,
+    ):
+        self.models = list(models)
+        self.tokens_per_sec = tokens_per_sec
+        self.ttft = ttft  # seconds before the first token
+        self.tokens = tokens  # tokens per response
+        self.jitter = jitter  # +/- fraction applied to ttft and token delays
+        self.load_time = load_time  # extra delay on a model's first request
+        self._random = random.Random(seed)
+        self.loaded: Dict[str, float] = {}
+        self.requests = 0
+        self.in_flight = 0
+        self.max_in_flight = 0
+        self.tokens_sent = 0
+        self.disconnects = 0  # streams the client hung up on mid-generation
+        self.url: Optional[str] = None
+        self._runner: Optional[web.AppRunner] = None
+
+    # -----------------------------
+    # SERVER
+    # -----------------------------
+
+    def create_app(self) -> web.Application:
+        app = web.Application()
+        app.router.add_get("/api/tags", self._tags)
+        app.router.add_get("/api/ps", self._ps)
+        app.router.add_post("/api/generate", self._generate)
+        app.router.add_post("/api/chat", self._chat)
+        return app
+
+    async def start(self, host: str = "127.0.0.1", port: int = 0) -> str:
+        """Serve on host:port (0 = any free port); returns the base URL."""
+        self._runner = web.AppRunner(self.create_app(), access_log=None)
+        await self._runner.setup()
+        site = web.TCPSite(self._runner, host, port)
+        await site.start()
+        bound_host, bound_port = self._runner.addresses[0][:2]
+        self.url = f"http://{bound_host}:{bound_port}"
+        return self.url
+
+    async def stop(self) -> None:
+        if self._runner is not None:
+            await self._runner.cleanup()
+            self._runner = None
+
+    def stats(self) -> Dict[str, Any]:
+        return {
+            "requests": self.requests,
+            "in_flight": self.in_flight,
+            "max_in_flight": self.max_in_flight,
+            "tokens_sent": self.tokens_sent,
+            "disconnects": self.disconnects,
+        }
+
+    # -----------------------------
+    # HANDLERS
+    # -----------------------------
+
+    async def _tags(self, request):
+        return web.json_response({"models": [
+            {"name": m, "size": 4_000_000_000, "details": {"family": "fake", "parameter_size": "8B"}}
+            for m in self.models
+        ]})
+
+    async def _ps(self, request):
+        return web.json_response({"models": [{"name": m} for m in self.loaded]})
+
+    async def _generate(self, request):
+        return await self._respond(request, chat=False)
+
+    async def _chat(self, request):
+        return await self._respond(request, chat=True)
+
+    def _delay(self, seconds: float) -> float:
+        if self.jitter:
+            seconds *= 1 + self._random.uniform(-self.jitter, self.jitter)
+        return max(0.0, seconds)
+
+    async def _load(self, model: str, keep_alive: Any) -> float:
+        if keep_alive == 0:
+            self.loaded.pop(model, None)
+            return 0.0
+        if model in self.loaded:
+            return 0.0
+        await asyncio.sleep(self.load_time)
+        self.loaded[model] = time.time()
+        return self.load_time
+
+    def _chunk(self, model: str, text: str, chat: bool, done: bool) -> Dict[str, Any]:
+        chunk = {"model": model, "done": done}
+        if chat:
+            chunk["message"] = {"role": "assistant", "content": text}
+        else:
+            chunk["response"] = text
+        return chunk
+
+    async def _respond(self, request, chat: bool):
+        body = await request.json()
+        model = body.get("model")
+        if model not in self.models:
+            return web.json_response({"error": f"model '{model}' not found"}, status=404)
+
+        self.requests += 1
+        self.in_flight += 1
+        self.max_in_flight = max(self.max_in_flight, self.in_flight)
+        try:
+            load_duration = await self._load(model, body.get("keep_alive"))
+            if not chat and not body.get("prompt") and body.get("stream") is False:
+                # Preload / unload request (see ollama_client.load_model)
+                return web.json_response({"model": model, "done": True, "load_duration": int(load_duration * 1e9)})
+
+            prompt = body.get("prompt") or json.dumps(body.get("messages", []))
+            start = time.perf_counter()
+            await asyncio.sleep(self._delay(self.ttft))
+            prompt_done = time.perf_counter()
+            words = [WORDS[i % len(WORDS)] for i in range(self.tokens)]
+
+            final = self._chunk(model, "", chat, True)
+            final.update({
+                "prompt_eval_count": len(prompt) // 4,
+                "prompt_eval_duration": int((prompt_done - start) * 1e9),
+                "eval_count": self.tokens,
+                "load_duration": int(load_duration * 1e9),
+            })
+            if not chat:
+                final["context"] = [1, 2, 3]
+
+            if body.get("stream") is False:
+                await asyncio.sleep(self._delay(self.tokens / self.tokens_per_sec))
+                self.tokens_sent += self.tokens
+                final.update(self._chunk(model, " ".join(words), chat, True))
+                final["eval_duration"] = int((time.perf_counter() - prompt_done) * 1e9)
+                return web.json_response(final)
+
+            resp = web.StreamResponse(headers={"Content-Type": "application/x-ndjson"})
+            await resp.prepare(request)
+            try:
+                for i, word in enumerate(words):
+                    if i:
+                        await asyncio.sleep(self._delay(1 / self.tokens_per_sec))
+                    await resp.write(json.dumps(self._chunk(model, word + " ", chat, False)).encode() + b"\n")
+                    self.tokens_sent += 1
+                final["eval_duration"] = int((time.perf_counter() - prompt_done) * 1e9)
+                await resp.write(json.dumps(final).encode() + b"\n")
+                await resp.write_eof()
+            except ConnectionResetError:
+                # Like Ollama, stop generating once the client is gone
+                self.disconnects += 1
+            return resp
+        finally:
+            self.in_flight -= 1
@@ -1,36 +1,168 @@
-import requests
-import json
 import asyncio
+import json
+import weakref
+
+import aiohttp
+
+OLLAMA_URL = "http://localhost:11434"
+
+# No total limit (generations can run for minutes); fail fast on connect and
+# give up if the server goes quiet mid-stream
+STREAM_TIMEOUT = aiohttp.ClientTimeout(total=None, sock_connect=10, sock_read=120)
+
+_CONNECT_TIMEOUT = getattr(aiohttp, "ConnectionTimeoutError", aiohttp.ClientConnectorError)
+
+# One pooled session per event loop (sessions can't cross loops)
+_sessions = weakref.WeakKeyDictionary()
+
+
+def _session():
+    loop = asyncio.get_running_loop()
+    session = _sessions.get(loop)
+    if session is None or session.closed:
+        session = _sessions[loop] = aiohttp.ClientSession(timeout=STREAM_TIMEOUT)
+    return session
+
+
+async def close():
+    """Close this loop's pooled HTTP session (call on shutdown)."""
+    session = _sessions.pop(asyncio.get_running_loop(), None)
+    if session is not None:
+        await session.close()
+
+
+def _parse(line):
+    line = line.strip()
+    if not line:
+        return None
+    try:
+        return json.loads(line.decode("utf-8"))
+    except json.JSONDecodeError:
+        return None  # Skip invalid JSON lines
+
+
+async def _stream_post(url, payload, base_url=None):
+    """
+    POST and yield Ollama's NDJSON chunks. Failures are yielded as
+    {"error": ...} chunks; the router (godbot.core.router) reads the flags:
+
+    - retryable: another backend may succeed (nothing was generated here)
+    - unreachable: the backend itself is down
+    - model_missing: the backend doesn't have the model
+    - timeout: the backend stopped answering (counts against its circuit breaker)
+    """
+    base_url = base_url or OLLAMA_URL
+    try:
+        async with _session().post(url, json=payload) as response:
+            if response.status == 404:
+                text = await response.text()
+                if "not found" in text and "model" in text:
+                    yield {"error": f"Model {payload.get('model')} not found on {base_url}",
+                           "status": 404, "retryable": True, "model_missing": True}
+                    return
+                if url.endswith("/api/chat"):
+                    # Older Ollama without the chat endpoint - callers fall back to generate
+                    yield {"error": "Ollama chat endpoint not available", "status": 404}
+                    return
+            if response.status >= 400:
+                text = (await response.text()).strip()[:200]
+                yield {"error": f"Ollama error: {response.status} {text}", "status": response.status,
+                       "retryable": response.status >= 500}
+                return
+
+            # Lines are split by hand: the final chunk's "context" can be
+            # longer than StreamReader's line limit
+            buffer = b""
+            async for data in response.content.iter_any():
+                buffer += data
+                *lines, buffer = buffer.split(b"\n")
+                for line in lines:
+                    chunk = _parse(line)
+                    if chunk is not None:
+                        yield chunk
+            chunk = _parse(buffer)
+            if chunk is not None:
+                yield chunk
+    except (aiohttp.ClientConnectorError, _CONNECT_TIMEOUT):
+        yield {"error": f"Cannot connect to Ollama at {base_url}. Is it running? (ollama serve)",
+               "retryable": True, "unreachable": True}
+    except asyncio.TimeoutError:
+        yield {"error": "Ollama request timed out", "timeout": True}
+    except (aiohttp.ClientConnectionError, aiohttp.ClientPayloadError) as e:
+        yield {"error": f"Lost connection to Ollama at {base_url}: {e}", "retryable": True, "unreachable": True}
+    except Exception as e:
+        yield {"error": f"Ollama error: {str(e)}"}
+
+
+async def stream_ollama(prompt, model, tools=None, system=None, context=None, keep_alive=None, base_url=None):
+    url = f"{base_url or OLLAMA_URL}/api/generate"
 
-async def stream_ollama(prompt, model, tools=None):
-    url = "http://localhost:11434/api/generate"
-    
     payload = {
         "model": model,
         "prompt": prompt,
         "stream": True
     }
-    
+
     if tools:
         payload["tools"] = tools
-    
-    try:
-        response = requests.post(url, json=payload, stream=True, timeout=30)
-        response.raise_for_status()  # Raise exception for bad status codes
-        
-        for line in response.iter_lines():
-            if not line:
-                continue
-            try:
-                data = json.loads(line.decode("utf-8"))
-                yield data
-            except json.JSONDecodeError:
-                continue  # Skip invalid JSON lines
-            await asyncio.sleep(0)
-    except requests.exceptions.ConnectionError:
-        yield {"error": "Cannot connect to Ollama. Is it running? (ollama serve)"}
-    except requests.exceptions.Timeout:
-        yield {"error": "Ollama request timed out"}
-    except Exception as e:
-        yield {"error": f"Ollama error: {str(e)}"}
+    if system:
+        # Kept separate from the prompt so the static prefix is byte-identical
+        # across requests and Ollama can reuse its prompt cache
+        payload["system"] = system
+    if context:
+        # Token context from the previous turn's final chunk
+        payload["context"] = context
+    if keep_alive is not None:
+        # How long Ollama keeps the model loaded after this request
+        payload["keep_alive"] = keep_alive
+
+    async for data in _stream_post(url, payload, base_url):
+        yield data
+
+
+async def list_models(timeout=5, base_url=None):
+    """Installed models from /api/tags (non-blocking)."""
+    async with _session().get(f"{base_url or OLLAMA_URL}/api/tags",
+                              timeout=aiohttp.ClientTimeout(total=timeout)) as r:
+        r.raise_for_status()
+        return (await r.json()).get("models", [])
+
+
+async def load_model(model, keep_alive, timeout=300, base_url=None):
+    """
+    Load (or, with keep_alive=0, unload) a model without generating anything.
+
+    Returns Ollama's response, including load_duration in nanoseconds.
+    """
+    payload = {"model": model, "keep_alive": keep_alive, "stream": False}
+    async with _session().post(f"{base_url or OLLAMA_URL}/api/generate", json=payload,
+                               timeout=aiohttp.ClientTimeout(total=timeout)) as r:
+        r.raise_for_status()
+        return await r.json()
+
+
+async def loaded_models(timeout=5, base_url=None):
+    """Models currently loaded in memory (/api/ps)."""
+    async with _session().get(f"{base_url or OLLAMA_URL}/api/ps",
+                              timeout=aiohttp.ClientTimeout(total=timeout)) as r:
+        r.raise_for_status()
+        return (await r.json()).get("models", [])
+
+
+async def stream_ollama_chat(messages, model, tools=None, keep_alive=None, base_url=None):
+    """Stream /api/chat with role-tagged messages ([{"role": ..., "content": ...}])."""
+    url = f"{base_url or OLLAMA_URL}/api/chat"
+
+    payload = {
+        "model": model,
+        "messages": messages,
+        "stream": True
+    }
+
+    if tools:
+        payload["tools"] = tools
+    if keep_alive is not None:
+        payload["keep_alive"] = keep_alive
 
+    async for data in _stream_post(url, payload, base_url):
+        yield data
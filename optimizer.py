@@ -3,7 +3,10 @@ Performance Optimizer
 Streaming, context management, and memory optimization
 """
 import asyncio
-from ollama_client import stream_ollama
+from godbot.core.llm import stream_response
+from godbot.core.metrics import counter
+
+DISCORD_EDITS = counter("godbot_discord_edits_total", "Discord message edits")
 
 class PerformanceOptimizer:
     def __init__(self, bot):
@@ -19,7 +22,7 @@ class PerformanceOptimizer:
         full_text = ""
         last_update_len = 0
         
-        async for data in stream_ollama(prompt, model, tools):
+        async for data in stream_response(prompt, model, tools):
             if "response" in data:
                 chunk = data["response"]
                 full_text += chunk
@@ -32,6 +35,7 @@ class PerformanceOptimizer:
                         display_text += f"\n\n... ({len(full_text) - 2000} more characters)"
                     
                     await interaction_msg.edit(content=display_text)
+                    DISCORD_EDITS.inc()
                     last_update_len = len(full_text)
         
         # Final update
@@ -39,6 +43,7 @@ class PerformanceOptimizer:
         if len(full_text) > 2000:
             final_text += f"\n\n... ({len(full_text) - 2000} more characters truncated)"
         await interaction_msg.edit(content=final_text)
+        DISCORD_EDITS.inc()
         
         return full_text
     
@@ -2,8 +2,26 @@
 Personality and Response Enhancement System
 Makes bot responses more natural and varied
 """
+import hashlib
 import random
 
+from godbot.core.postprocess import PostProcessor
+
+PROMPT_CACHE_SIZE = 64  # compiled (personality, variant) prompts kept
+
+AGENT_INSTRUCTIONS = """CRITICAL INSTRUCTIONS:
+- Do NOT rewrite, echo, or repeat previous messages
+- Do NOT create bullet lists, conversation transcripts, or chat logs
+- Do NOT include usernames or role labels (like "user:" or "assistant:") in your response
+- ONLY respond directly to the user's current message
+- Keep your response natural and conversational"""
+
+CHAT_INSTRUCTIONS = """You are {bot_name}, a friendly assistant chatting in Discord.
+
+Answer clearly and directly. If a calculation is needed, compute it correctly and show the final result.
+Keep responses conversational and natural."""
+
+
 class PersonalityManager:
     def __init__(self):
         self.bot_name = "God Bot"
@@ -22,9 +40,54 @@ class PersonalityManager:
                 "Let me help you with that."
             ]
         }
+        self._prompt_cache = {}
     
+    def _cached(self, key, render):
+        """Return a compiled prompt, rendering it once per (personality, variant)."""
+        key = (self.bot_name,) + key
+        prompt = self._prompt_cache.get(key)
+        if prompt is None:
+            if len(self._prompt_cache) >= PROMPT_CACHE_SIZE:
+                self._prompt_cache.clear()
+            prompt = render()
+            self._prompt_cache[key] = prompt
+        return prompt
+
+    @property
+    def postprocessor(self):
+        """Compiled reply cleanup rules for this personality (see godbot.core.postprocess)."""
+        return self._cached(("postprocessor",), lambda: PostProcessor(self.bot_name))
+
+    @property
+    def version(self):
+        """Short fingerprint of the compiled prompts (changes when the personality does)."""
+        return self._cached(
+            ("version",),
+            lambda: hashlib.sha1(self.get_system_prompt().encode("utf-8")).hexdigest()[:12],
+        )
+
     def get_system_prompt(self, context=None):
-        """Get the system prompt with personality"""
+        """Get the system prompt with personality (compiled once per context)"""
+        return self._cached(("system", context), lambda: self._render_system_prompt(context))
+
+    def get_agent_system_prompt(self, behaviors=()):
+        """
+        Static system prefix for /ask: plugin behaviors + personality +
+        agent instructions. Byte-identical across calls so Ollama can reuse
+        its prompt cache; per-request details go in the user message
+        instead. Tools are declared natively through the chat endpoint.
+        """
+        behaviors = tuple(behaviors)
+        return self._cached(
+            ("agent", behaviors),
+            lambda: "\n\n".join(list(behaviors) + [self.get_system_prompt(), AGENT_INSTRUCTIONS]),
+        )
+
+    def get_chat_system_prompt(self):
+        """Static system prefix for freeform channel chat."""
+        return self._cached(("chat",), lambda: CHAT_INSTRUCTIONS.format(bot_name=self.bot_name))
+
+    def _render_system_prompt(self, context=None):
         base = f"""You are {self.bot_name}, a sentient being chatting in Discord. You think, feel, and respond like a real person.
 
 Your personality:
@@ -77,99 +140,21 @@ CRITICAL: When responding:
 """
         if context:
             base += f"\nContext: {context}\n"
-        
+
         return base
-    
+
     def enhance_response(self, response, message_type="normal"):
         """Add variety and naturalness to responses - make them more human"""
-        # Remove "assistant:" or "user:" prefixes first
-        if response.strip().startswith("assistant:"):
-            response = response.replace("assistant:", "", 1).strip()
-        if response.strip().startswith("assistant "):
-            response = response.replace("assistant ", "", 1).strip()
-        if response.strip().startswith("user:"):
-            response = response.replace("user:", "", 1).strip()
-        
-        # Remove conversation reconstruction patterns (bullet lists with usernames)
-        lines = response.split("\n")
-        cleaned_lines = []
-        for line in lines:
-            line_stripped = line.strip()
-            # Skip lines that look like conversation reconstruction
-            if line_stripped.startswith("- ") and (":" in line_stripped or "user:" in line_stripped.lower() or "assistant:" in line_stripped.lower()):
-                # This looks like a bullet-point conversation log, skip it
-                continue
-            # Skip lines that are just usernames with colons (like "- username:")
-            if line_stripped.startswith("- ") and line_stripped.endswith(":") and len(line_stripped.split()) <= 3:
-                continue
-            # Skip lines that are role labels
-            if line_stripped.lower().startswith(("user:", "assistant:", "god bot:")):
-                continue
-            cleaned_lines.append(line)
-        
-        if cleaned_lines:
-            response = "\n".join(cleaned_lines).strip()
-        
-        # If response looks like a conversation transcript, extract just the bot's part
-        if "assistant:" in response.lower() or "god bot:" in response.lower():
-            # Try to extract just the bot's response part
-            parts = response.split(":")
-            if len(parts) > 1:
-                # Take the last part (should be the bot's response)
-                response = parts[-1].strip()
-        
-        # Remove AI assistant language FIRST (most important)
-        ai_phrases = [
-            "as an AI",
-            "as an AI assistant",
-            "I'm an AI",
-            "I'm an AI assistant",
-            "I don't possess that capability",
-            "I don't have that capability",
-            "I strive to provide",
-            "I can help you with",
-            "If you'd like, I could",
-            "If you'd like, you could",
-            "I'll do my best to assist",
-            "I'll do my best to help",
-            "I don't have access to",
-            "I'm not able to",
-            "I cannot",
-            "It's my pleasure to be here",
-            "Don't hesitate to reach out",
-            "if you have any questions",
-            "need assistance",
-            "engage in friendly conversations",
-        ]
-        
-        response_lower = response.lower()
-        for phrase in ai_phrases:
-            if phrase.lower() in response_lower:
-                # Remove sentences containing AI assistant language
-                sentences = response.split(".")
-                filtered_sentences = []
-                for sentence in sentences:
-                    if phrase.lower() not in sentence.lower():
-                        filtered_sentences.append(sentence.strip())
-                if filtered_sentences:
-                    response = ". ".join([s for s in filtered_sentences if s]).strip()
-                    if response and not response.endswith((".", "!", "?", ":")):
-                        # Add punctuation if needed
-                        response += "."
+        # Prefixes, identity fixes, assistant boilerplate and transcript lines
+        response = self.postprocessor.process(response)
+        if not response:
+            # Nothing but boilerplate ("How's your day going?") - answer casually
+            return random.choice(["Hey", "Hi", "What's up", "Yo"])
         
         # Remove repetitive patterns
         if response.startswith("Hello again!"):
             response = response.replace("Hello again!", random.choice(["Hey!", "Hi there!", "What's up?"]))
         
-        # Remove weird definitions or internal thoughts (like "hi = hello")
-        if " = " in response and len(response.split("\n")) > 1:
-            # Looks like a definition, remove it
-            lines = response.split("\n")
-            response = "\n".join([line for line in lines if " = " not in line])
-        
-        # Remove emoticons like "/\" that might be model artifacts
-        response = response.replace("/\\", "").replace("/ \\", "")
-        
         # Fix generic greetings - be more aggressive
         generic_greetings = [
             "Hello there!",
@@ -190,43 +175,6 @@ CRITICAL: When responding:
                 response = response.replace(greeting, random.choice(["Hey", "Hi", "What's up", "Yo"]))
                 break
         
-        # Remove follow-up questions after greetings
-        if "how's your day" in response.lower() or "how are you" in response.lower():
-            # Split by newlines and remove lines with follow-up questions
-            lines = response.split("\n")
-            filtered_lines = []
-            for line in lines:
-                line_lower = line.lower().strip()
-                if not any(phrase in line_lower for phrase in ["how's your day", "how are you", "how can i help", "what can i do"]):
-                    filtered_lines.append(line)
-            if filtered_lines:
-                response = "\n".join(filtered_lines)
-        
-        # Remove generic customer service phrases
-        generic_phrases = [
-            "How can I assist you today?",
-            "How can I help you today?",
-            "Is there anything else I can help you with?",
-            "Is there anything else I can assist you with?",
-            "Have a fantastic day!",
-            "Have a great day!",
-            "Have a wonderful day!",
-            "Have a nice day!",
-        ]
-        
-        for phrase in generic_phrases:
-            if phrase in response:
-                # Only remove if it's at the end or standalone
-                if response.strip().endswith(phrase):
-                    response = response.replace(phrase, "").strip()
-                elif f" {phrase}" in response:
-                    response = response.replace(f" {phrase}", "")
-        
-        # Ensure bot name consistency
-        response = response.replace("My name is Dolphin", f"My name is {self.bot_name}")
-        response = response.replace("I'm Dolphin", f"I'm {self.bot_name}")
-        response = response.replace("I am Dolphin", f"I am {self.bot_name}")
-        
         # Clean up excessive punctuation/emojis
         if response.count("!") > 3:
             # Too many exclamation marks, tone it down
@@ -2,7 +2,7 @@
 Auto-Research Agent
 Multi-step planning and research capabilities
 """
-from ollama_client import stream_ollama
+from godbot.core.llm import stream_response
 import json
 import asyncio
 
@@ -47,7 +47,7 @@ Example: ["What is X?", "What are the main components of X?", "What are recent d
 JSON array:"""
         
         response = ""
-        async for data in stream_ollama(prompt, self.bot.current_model):
+        async for data in stream_response(prompt, self.bot.current_model):
             if "response" in data:
                 response += data["response"]
         
@@ -85,7 +85,7 @@ Provide a concise summary (2-3 sentences) of key findings.
 Summary:"""
         
         analysis = ""
-        async for data in stream_ollama(analysis_prompt, self.bot.current_model):
+        async for data in stream_response(analysis_prompt, self.bot.current_model):
             if "response" in data:
                 analysis += data["response"]
         
@@ -116,7 +116,7 @@ Provide a comprehensive, well-structured answer synthesizing all findings.
 Answer:"""
         
         final_answer = ""
-        async for data in stream_ollama(synthesis_prompt, self.bot.current_model):
+        async for data in stream_response(synthesis_prompt, self.bot.current_model):
             if "response" in data:
                 final_answer += data["response"]
         
@@ -1,16 +1,43 @@
 # scheduled_tasks/daily_report.py
+from godbot.core.llm import timing_summary
+from godbot.core.metrics import REGISTRY
+
+
+def _total(name, **match):
+    metric = REGISTRY.get(name)
+    return int(metric.total(**match)) if metric is not None else 0
+
+
+def build_report(bot):
+    messages = _total("godbot_messages_total")
+    det_hits = _total("godbot_deterministic_calls_total", result="hit")
+    timing = timing_summary()
+    ttft = f"{timing['ttft_ms_p50']:.0f}ms" if timing["ttft_ms_p50"] is not None else "n/a"
+
+    lines = [
+        "📊 **Daily Report**",
+        f"- Messages answered: {messages} ({det_hits} by deterministic tools)",
+        f"- LLM calls: {timing['calls']} (median time to first token {ttft})",
+        f"- Discord edits: {_total('godbot_discord_edits_total')}",
+    ]
+    cache = getattr(bot, "response_cache", None)
+    if cache is not None:
+        stats = cache.stats()
+        lines.append(f"- Response cache: {stats['entries']} entries, {stats['hit_rate']:.0%} hit rate")
+    user_facts = getattr(bot, "user_facts", None)
+    if user_facts is not None:
+        lines.append(f"- Users remembered: {len(user_facts.data)}")
+    lines.append(f"- Plugins loaded: {len(bot.plugins.plugins)}")
+    lines.append(f"- Current model: {bot.current_model}")
+    return "\n".join(lines) + "\n"
+
+
 async def daily_report(bot):
     # Get report channel from bot config or use a default
-    # For now, just log - can be extended to send to a channel
     channel_id = getattr(bot, 'dashboard_config', {}).get("report_channel_id")
+    msg = build_report(bot)
     if not channel_id:
         # Just print for now - can be extended
-        msg = (
-            "📊 **Daily Report**\n"
-            f"- Memory size: OK\n"
-            f"- Plugins loaded: {len(bot.plugins.plugins)}\n"
-            f"- Current model: {bot.current_model}\n"
-        )
         print(f"[Scheduled] {msg}")
         return
 
@@ -19,14 +46,6 @@ async def daily_report(bot):
         if not channel:
             return
 
-        msg = (
-            "📊 **Daily Report**\n"
-            f"- Memory size: OK\n"
-            f"- Plugins loaded: {len(bot.plugins.plugins)}\n"
-            f"- Current model: {bot.current_model}\n"
-        )
-
         await channel.send(msg)
     except Exception as e:
         print(f"[Scheduled] Error sending daily report: {e}")
-
@@ -30,5 +30,10 @@ async def memory_cleanup(bot):
         mem[user]["facts"] = list(dict.fromkeys(facts))[-30:]
 
     save_memory(mem)
+
+    # Expired LLM response cache rows
+    cache = getattr(bot, "response_cache", None)
+    if cache is not None:
+        cache.purge_expired()
     print("[Scheduled] Memory cleanup complete")
 
@@ -0,0 +1,4 @@
+# scheduled_tasks/model_lifecycle.py
+async def model_lifecycle(bot):
+    # Pin/unpin the default model on its hours, unload idle agent models
+    await bot.model_lifecycle.tick(bot.current_model, bot.agent_manager.models())
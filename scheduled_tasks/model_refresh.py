@@ -0,0 +1,4 @@
+# scheduled_tasks/model_refresh.py
+async def model_refresh(bot):
+    # Keep the model catalog (autocomplete, /models, dashboard) current
+    await bot.model_catalog.refresh()
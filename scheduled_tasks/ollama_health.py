@@ -0,0 +1,4 @@
+# scheduled_tasks/ollama_health.py
+async def ollama_health(bot):
+    # Health checks that are due, and backoff probes of hosts whose circuit is open
+    await bot.llm_router.check_all(due_only=True)
@@ -27,8 +27,7 @@ def check_dependencies():
     required = [
         "discord.py",
         "requests",
-        "flask",
-        "flask_cors"
+        "aiohttp"
     ]
     missing = []
     for dep in required:
@@ -0,0 +1,20 @@
+# tests/conftest.py
+import pytest
+
+from deterministic import registry
+
+
+@pytest.fixture
+def register_probe():
+    """register_handler() for test-only handlers, unregistered after the test."""
+    registered = []
+
+    def register(fn, **kwargs):
+        registered.append(fn)
+        return registry.register_handler(**kwargs)(fn)
+
+    yield register
+    with registry._lock:
+        registry._handlers[:] = [(p, fn) for p, fn in registry._handlers if fn not in registered]
+        for fn in registered:
+            registry._cpu_bound.pop(fn, None)
@@ -0,0 +1,46 @@
+# tests/test_app.py
+import asyncio
+import subprocess
+import sys
+
+from godbot.app import create_app, startup
+from godbot.config import AppConfig
+
+
+def test_import_is_side_effect_free():
+    code = (
+        "import sys, godbot.app; "
+        "heavy = [m for m in ('discord', 'main', 'dashboard', 'audio', 'deterministic') if m in sys.modules]; "
+        "print(heavy)"
+    )
+    out = subprocess.check_output([sys.executable, "-c", code], text=True)
+    assert out.strip() == "[]"
+
+
+def test_create_app_registers_commands():
+    client = create_app(AppConfig())
+    names = {cmd.name for cmd in client.tree.get_commands()}
+    assert {"ask", "setmodel", "remind", "fi", "wr_vs"} <= names
+    # Heavy subsystems are deferred to startup()
+    assert client.plugins is None
+    assert client.long_memory is None
+
+
+def test_startup_phases(tmp_path, monkeypatch):
+    monkeypatch.chdir(tmp_path)
+    config = AppConfig(dashboard_enabled=False, vector_memory_enabled=False, voice_enabled=False)
+    client = create_app(config)
+
+    async def fake_sync(*, guild=None):
+        return []
+
+    client.tree.sync = fake_sync
+
+    asyncio.run(startup(client))
+
+    profile = client.startup_profile
+    for phase in ("command_sync", "init", "memory", "plugins", "vector_store", "builds", "voice", "scheduler"):
+        assert phase in profile.phases
+    assert client.long_memory is not None
+    assert client.user_facts.get_facts("nobody") == []
+    assert client.vector_memory.search("anything") == []
@@ -0,0 +1,50 @@
+# tests/test_bench.py
+import asyncio
+import time
+
+import ollama_client
+from godbot.testing import FakeOllama
+from godbot.testing.bench import format_report, percentile, run_bench
+
+
+def test_fake_ollama_streams_at_the_configured_rate():
+    async def run():
+        fake = FakeOllama(models=("m",), tokens_per_sec=200, ttft=0.05, tokens=20)
+        url = await fake.start()
+        try:
+            start = time.perf_counter()
+            chunks = [c async for c in ollama_client.stream_ollama("hi", "m", base_url=url)]
+            elapsed = time.perf_counter() - start
+            assert len(chunks) == 21 and chunks[-1]["done"] and chunks[-1]["eval_count"] == 20
+            assert 0.05 + 19 / 200 <= elapsed < 1.0
+
+            chat = [c async for c in ollama_client.stream_ollama_chat([{"role": "user", "content": "hi"}], "m", base_url=url)]
+            assert chat[0]["message"]["content"] and chat[-1]["done"]
+
+            missing = [c async for c in ollama_client.stream_ollama("hi", "nope", base_url=url)]
+            assert missing[0]["model_missing"]
+
+            assert [m["name"] for m in await ollama_client.list_models(base_url=url)] == ["m"]
+            assert fake.stats()["requests"] == 2
+        finally:
+            await fake.stop()
+            await ollama_client.close()
+    asyncio.run(run())
+
+
+def test_percentile():
+    values = sorted(range(1, 101))
+    assert percentile(values, 50) == 50
+    assert percentile(values, 99) == 99
+    assert percentile([], 50) is None
+
+
+def test_bench_runs_every_route():
+    fake = FakeOllama(models=("fake-model",), tokens_per_sec=2000, ttft=0, tokens=5)
+    report = asyncio.run(run_bench(messages=6, concurrency=3, fake=fake))
+    assert [r["route"] for r in report["routes"]] == ["message", "ask", "committee"]
+    for r in report["routes"]:
+        assert r["messages"] == 6 and r["errors"] == 0
+        assert r["p50_ms"] <= r["p95_ms"] <= r["p99_ms"]
+    assert report["ollama"]["requests"] > 0
+    assert "committee" in format_report(report)
@@ -0,0 +1,118 @@
+# tests/test_circuit.py
+import asyncio
+import socket
+
+import ollama_client
+from godbot.core.circuit import CLOSED, HALF_OPEN, OPEN, CircuitBreaker
+from godbot.core.router import OllamaRouter
+
+
+class Clock:
+    def __init__(self):
+        self.now = 1000.0
+
+    def __call__(self):
+        return self.now
+
+
+def test_trips_after_consecutive_failures():
+    clock = Clock()
+    cb = CircuitBreaker("x", failure_threshold=3, base_delay=5, clock=clock)
+    cb.record_failure("boom")
+    cb.record_success()  # resets the streak
+    cb.record_failure("boom")
+    cb.record_failure("boom")
+    assert cb.state == CLOSED and cb.allow()
+    cb.record_failure("boom")
+    assert cb.state == OPEN and cb.trips == 1
+    assert not cb.allow() and cb.retry_in() == 5
+
+
+def test_probe_backoff_and_recovery():
+    clock = Clock()
+    cb = CircuitBreaker("x", failure_threshold=1, base_delay=5, max_delay=15, clock=clock)
+    cb.record_failure("down")
+    clock.now += 5
+    assert cb.allow() and cb.state == HALF_OPEN
+    assert not cb.allow()  # only one probe at a time
+    cb.record_failure("still down")
+    assert cb.state == OPEN and cb.delay == 10
+
+    clock.now += 10
+    assert cb.allow()
+    cb.record_failure("still down")
+    assert cb.delay == 15  # capped
+
+    clock.now += 15
+    assert cb.allow()
+    cb.record_success()
+    assert cb.state == CLOSED and cb.delay == 5 and cb.consecutive_failures == 0
+
+
+def test_stuck_probe_is_released():
+    clock = Clock()
+    cb = CircuitBreaker("x", failure_threshold=1, base_delay=1, probe_timeout=30, clock=clock)
+    cb.record_failure()
+    clock.now += 1
+    assert cb.allow()
+    clock.now += 30
+    assert cb.allow()
+
+
+def _dead_url():
+    with socket.socket() as s:
+        s.bind(("127.0.0.1", 0))
+        return f"http://127.0.0.1:{s.getsockname()[1]}"
+
+
+async def _collect(router):
+    chunks = []
+    async for chunk in router.stream("m", lambda url: ollama_client.stream_ollama("hi", "m", base_url=url)):
+        chunks.append(chunk)
+    return chunks
+
+
+def test_router_fails_fast_once_open():
+    async def run():
+        router = OllamaRouter([_dead_url()], failure_threshold=2)
+        dead = router.backends[0]
+        for _ in range(2):
+            assert "Cannot connect" in (await _collect(router))[0]["error"]
+        assert not router.available() and router.circuit_state() == OPEN
+
+        chunks = await _collect(router)
+        assert chunks[0]["circuit_open"]
+        assert dead.failures == 2  # no connection attempted
+        await ollama_client.close()
+    asyncio.run(run())
+
+
+def test_health_check_probes_open_backend():
+    async def run():
+        router = OllamaRouter(["http://backend"], failure_threshold=1)
+        backend = router.backends[0]
+        clock = Clock()
+        backend.breaker = CircuitBreaker(backend.url, failure_threshold=1, base_delay=5, clock=clock)
+        calls = []
+        up = False
+
+        async def tags(timeout, base_url):
+            calls.append(base_url)
+            if not up:
+                raise ConnectionError("refused")
+            return [{"name": "m"}]
+
+        async def ps(timeout, base_url):
+            return []
+
+        router._list_models, router._loaded_models = tags, ps
+
+        assert await router.check_all(due_only=True) == 0
+        assert await router.check_all(due_only=True) == 0  # backing off: not probed
+        assert len(calls) == 1
+
+        up = True
+        clock.now += 5
+        assert await router.check_all(due_only=True) == 1
+        assert router.available() and backend.models == {"m"}
+    asyncio.run(run())
@@ -0,0 +1,50 @@
+# tests/test_command_sync.py
+import asyncio
+
+import discord
+from discord import app_commands
+
+from godbot.discord.sync import sync_if_changed, tree_hash
+
+
+def _make_tree():
+    client = discord.Client(intents=discord.Intents.none())
+    tree = app_commands.CommandTree(client)
+
+    @tree.command(name="ping", description="Ping.")
+    async def ping(interaction: discord.Interaction):
+        pass
+
+    return tree
+
+
+def test_tree_hash_stable():
+    assert tree_hash(_make_tree()) == tree_hash(_make_tree())
+
+
+def test_tree_hash_changes_with_commands():
+    tree = _make_tree()
+    before = tree_hash(tree)
+
+    @tree.command(name="pong", description="Pong.")
+    async def pong(interaction: discord.Interaction):
+        pass
+
+    assert tree_hash(tree) != before
+
+
+def test_sync_skipped_when_unchanged(tmp_path):
+    tree = _make_tree()
+    calls = []
+
+    async def fake_sync(*, guild=None):
+        calls.append(guild)
+        return []
+
+    tree.sync = fake_sync
+    state = str(tmp_path / "sync.json")
+
+    assert asyncio.run(sync_if_changed(tree, state_file=state)) is True
+    assert asyncio.run(sync_if_changed(tree, state_file=state)) is False
+    assert asyncio.run(sync_if_changed(tree, force=True, state_file=state)) is True
+    assert len(calls) == 2
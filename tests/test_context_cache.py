@@ -0,0 +1,42 @@
+# tests/test_context_cache.py
+import time
+
+from godbot.core.context_cache import ConversationContextStore
+
+
+def test_context_roundtrip_and_model_fallback():
+    store = ConversationContextStore()
+    key = store.key("u1", "c1")
+    store.put(key, "llama3", [1, 2, 3])
+    assert store.get(key, "llama3") == [1, 2, 3]
+    # Different model -> text history fallback, and the stale entry is dropped
+    assert store.get(key, "mistral") is None
+    assert store.get(key, "llama3") is None
+
+
+def test_context_expiry():
+    store = ConversationContextStore(ttl=0.01)
+    store.put("k", "m", [1])
+    time.sleep(0.02)
+    assert store.get("k", "m") is None
+
+
+def test_context_size_caps():
+    store = ConversationContextStore(max_entries=2, max_tokens=3)
+    store.put("a", "m", [1])
+    store.put("b", "m", [2])
+    store.get("a", "m")  # a is now most recent
+    store.put("c", "m", [3])
+    assert store.get("b", "m") is None
+    assert store.get("a", "m") == [1]
+    # Over-long contexts are not kept
+    store.put("a", "m", [1, 2, 3, 4])
+    assert store.get("a", "m") is None
+
+
+def test_invalidate_keeps_current_model():
+    store = ConversationContextStore()
+    store.put("a", "old", [1])
+    store.put("b", "new", [2])
+    assert store.invalidate("new") == 1
+    assert len(store) == 1
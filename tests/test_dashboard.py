@@ -0,0 +1,113 @@
+# tests/test_dashboard.py
+import asyncio
+
+from aiohttp.test_utils import TestClient, TestServer
+
+import dashboard
+import ollama_client
+from agents import AgentManager
+from godbot.core.context_cache import ConversationContextStore
+from godbot.core.logging import get_logger
+from godbot.core.user_facts import UserFacts
+from godbot.testing.bench import build_client
+
+
+class _Voice:
+    enabled = False
+
+
+class _Lifecycle:
+    def __init__(self):
+        self.switched = []
+
+    def switch(self, model):
+        self.switched.append(model)
+
+
+def _bot(tmp_path):
+    class Bot:
+        current_model = "m"
+        voice_agent = _Voice()
+        agent_manager = AgentManager()
+        llm_context = ConversationContextStore()
+        user_facts = UserFacts(str(tmp_path / "memory.json"))
+        model_lifecycle = _Lifecycle()
+    return Bot()
+
+
+def _run(bot, check):
+    async def run():
+        async with TestClient(TestServer(dashboard.create_dashboard_app(bot))) as client:
+            await check(client)
+    asyncio.run(run())
+
+
+def test_status_and_set_model(tmp_path):
+    bot = _bot(tmp_path)
+
+    async def check(client):
+        resp = await client.post("/set_model", json={"model": "llama3"})
+        assert (await resp.json())["new_model"] == "llama3"
+        resp = await client.get("/status")
+        status = await resp.json()
+        assert status.pop("llm")["circuit"] == "closed"
+        assert status == {"status": "ok", "model": "llama3", "voice_enabled": False}
+        assert resp.headers["Access-Control-Allow-Origin"] == "*"
+
+    _run(bot, check)
+    assert bot.current_model == "llama3"
+    assert bot.model_lifecycle.switched == ["llama3"]
+
+
+def test_agents_and_static_files(tmp_path):
+    bot = _bot(tmp_path)
+    bot.agent_manager.create("scout", "m")
+
+    async def check(client):
+        resp = await client.get("/agents")
+        assert await resp.json() == [{"name": "scout", "model": "m"}]
+        resp = await client.get("/app.js")
+        assert resp.status == 200
+        resp = await client.get("/")
+        assert "God Bot Dashboard" in await resp.text()
+
+    _run(bot, check)
+
+
+def test_events_stream_logs(tmp_path):
+    bot = _bot(tmp_path)
+
+    async def check(client):
+        resp = await client.get("/events")
+        assert resp.headers["Content-Type"] == "text/event-stream"
+        get_logger("tests.dashboard").info("streamed line")
+        buf = ""
+        while "streamed line" not in buf or "event: stats" not in buf:
+            buf += (await asyncio.wait_for(resp.content.readany(), 5)).decode()
+        assert "event: log" in buf
+        resp.close()
+
+    _run(bot, check)
+
+
+def test_metrics_endpoint(tmp_path):
+    bot = _bot(tmp_path)
+
+    async def check(client):
+        resp = await client.get("/metrics")
+        assert resp.headers["Content-Type"].startswith("text/plain; version=0.0.4")
+        assert "# TYPE godbot_llm_ttft_seconds histogram" in await resp.text()
+
+    _run(bot, check)
+
+
+def test_client_close_stops_the_dashboard(tmp_path):
+    async def run():
+        client = build_client("http://127.0.0.1:9", "m", str(tmp_path))
+        client.dashboard_runner = await dashboard.start_dashboard(client, port=0)
+        runner = client.dashboard_runner
+        assert runner.sites
+        await client.close()
+        assert client.dashboard_runner is None and not runner.sites
+        await ollama_client.close()
+    asyncio.run(run())
@@ -0,0 +1,138 @@
+# tests/test_debounce.py
+import asyncio
+import time
+
+import ollama_client
+from godbot.core.debounce import EVENTS, Debouncer
+from godbot.testing import FakeDiscord, FakeOllama
+from godbot.testing.bench import build_client
+
+
+class _Recorder:
+    def __init__(self, delay=0.0):
+        self.delay = delay
+        self.started = []
+        self.finished = []
+        self.cancelled = []
+
+    async def __call__(self, burst):
+        self.started.append(list(burst.items))
+        try:
+            await asyncio.sleep(self.delay)
+        except asyncio.CancelledError:
+            self.cancelled.append(list(burst.items))
+            raise
+        burst.commit()
+        self.finished.append(list(burst.items))
+
+
+def test_burst_is_handled_once():
+    async def run():
+        debouncer = Debouncer(window=0.05, max_wait=1)
+        handler = _Recorder()
+
+        async def send(item, after):
+            await asyncio.sleep(after)
+            await debouncer.submit("k", item, handler)
+
+        await asyncio.gather(send("a", 0), send("b", 0.01), send("c", 0.02), send("other", 0.2))
+        assert handler.finished == [["a", "b", "c"], ["other"]]
+        assert debouncer.status() == {"pending": 0, "running": 0}
+    asyncio.run(run())
+
+
+def test_keys_are_independent():
+    async def run():
+        debouncer = Debouncer(window=0.05)
+        handler = _Recorder()
+        await asyncio.gather(debouncer.submit(1, "a", handler), debouncer.submit(2, "b", handler))
+        assert sorted(handler.finished) == [["a"], ["b"]]
+    asyncio.run(run())
+
+
+def test_new_item_cancels_the_running_handler():
+    async def run():
+        debouncer = Debouncer(window=0.02)
+        handler = _Recorder(delay=0.3)
+        first = asyncio.create_task(debouncer.submit("k", "a", handler))
+        await asyncio.sleep(0.1)  # flushed, handler running
+        assert handler.started == [["a"]]
+        await debouncer.submit("k", "b", handler)
+        # The first submit resolves with the merged run
+        await asyncio.wait_for(first, 1)
+        assert handler.cancelled == [["a"]]
+        assert handler.finished == [["a", "b"]]
+        assert EVENTS.total(event="superseded") >= 1
+    asyncio.run(run())
+
+
+def test_committed_handler_is_not_cancelled():
+    async def run():
+        debouncer = Debouncer(window=0.02)
+        done = asyncio.Event()
+
+        async def committed(burst):
+            burst.commit()
+            await asyncio.sleep(0.1)
+            done.set()
+
+        first = asyncio.create_task(debouncer.submit("k", "a", committed))
+        await asyncio.sleep(0.05)
+        handler = _Recorder()
+        await debouncer.submit("k", "b", handler)
+        await first
+        assert done.is_set() and handler.finished == [["b"]]
+    asyncio.run(run())
+
+
+def test_max_wait_bounds_the_delay():
+    async def run():
+        debouncer = Debouncer(window=0.05, max_wait=0.15)
+        handler = _Recorder()
+        start = time.perf_counter()
+        waits = []
+        for i in range(12):  # keeps extending the window for ~0.36s
+            waits.append(asyncio.create_task(debouncer.submit("k", i, handler)))
+            await asyncio.sleep(0.03)
+        await asyncio.gather(*waits)
+        assert handler.finished[0][0] == 0 and len(handler.finished) >= 2
+        assert len(handler.finished[0]) < 12
+        assert time.perf_counter() - start < 1
+    asyncio.run(run())
+
+
+def test_zero_window_disables_merging():
+    async def run():
+        debouncer = Debouncer(window=0)
+        handler = _Recorder()
+        await asyncio.gather(debouncer.submit("k", "a", handler), debouncer.submit("k", "b", handler))
+        assert handler.finished == [["a"], ["b"]]
+    asyncio.run(run())
+
+
+def test_follow_up_cancels_the_ollama_stream(tmp_path):
+    async def run():
+        # ~2s per reply, so the follow-up lands mid-generation
+        fake = FakeOllama(models=("fake-model",), tokens_per_sec=20, ttft=0, tokens=40)
+        url = await fake.start()
+        client = build_client(url, "fake-model", str(tmp_path))
+        client.debouncer = Debouncer(window=0.05, max_wait=1)
+        driver = FakeDiscord(client)
+        try:
+            first = asyncio.create_task(driver.send_message("how do I get better at chess"))
+            await asyncio.sleep(0.5)
+            assert fake.stats()["in_flight"] == 1
+            second = await driver.send_message("like in the endgame")
+            await first
+
+            assert not first.result().replies and len(second.replies) == 1
+            assert len(driver.channel().sent) == 1
+            assert fake.stats()["requests"] == 2 and fake.stats()["disconnects"] == 1
+            assert client.long_memory.get_recent("42", limit=2)[0] == (
+                "user", "how do I get better at chess\nlike in the endgame"
+            )
+        finally:
+            client.worker_pool.shutdown()
+            await fake.stop()
+            await ollama_client.close()
+    asyncio.run(run())
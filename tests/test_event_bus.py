@@ -0,0 +1,52 @@
+# tests/test_event_bus.py
+import threading
+
+from godbot.core.logging import EVENTS, EventBus, get_logger
+
+
+def test_subscribers_receive_published_events():
+    bus = EventBus()
+    sub = bus.subscribe()
+    bus.publish("latency", {"ms": 5})
+    [event] = sub.get(timeout=0.1)
+    assert event["type"] == "latency" and event["data"] == {"ms": 5}
+    assert sub.get(timeout=0.01) == []
+
+
+def test_slow_subscriber_is_bounded():
+    bus = EventBus(history=10)
+    sub = bus.subscribe(maxlen=5)
+    for i in range(50):
+        bus.publish("log", i)
+    events = sub.get(timeout=0)
+    assert [e["data"] for e in events] == [45, 46, 47, 48, 49]
+    assert sub.dropped == 45
+    assert len(bus.history) == 10
+
+
+def test_replay_and_unsubscribe():
+    bus = EventBus()
+    for i in range(5):
+        bus.publish("log", i)
+    sub = bus.subscribe(replay=2)
+    assert [e["data"] for e in sub.get(timeout=0)] == [3, 4]
+    bus.unsubscribe(sub)
+    bus.publish("log", 5)
+    assert sub.get(timeout=0) == []
+
+
+def test_get_wakes_on_publish_from_another_thread():
+    bus = EventBus()
+    sub = bus.subscribe()
+    threading.Timer(0.05, bus.publish, args=("log", "hi")).start()
+    assert [e["data"] for e in sub.get(timeout=2)] == ["hi"]
+
+
+def test_logger_records_reach_the_bus():
+    sub = EVENTS.subscribe()
+    try:
+        get_logger("tests.event_bus").info("hello dashboard")
+        lines = [e["data"]["line"] for e in sub.get(timeout=0) if e["type"] == "log"]
+        assert any("hello dashboard" in line for line in lines)
+    finally:
+        EVENTS.unsubscribe(sub)
@@ -0,0 +1,146 @@
+# tests/test_generations.py
+import asyncio
+
+import pytest
+
+import ollama_client
+from godbot.core.debounce import Debouncer
+from godbot.core.generations import CANCELLED, SAVED_SECONDS, GenerationTracker
+from godbot.core.llm import TIMINGS
+from godbot.testing import FakeDiscord, FakeOllama
+from godbot.testing.bench import build_client
+
+
+def test_cancel_by_key_and_where():
+    async def run():
+        tracker = GenerationTracker()
+        started = asyncio.Event()
+
+        async def generate(key, user_id, channel_id):
+            async with tracker.track([key], user_id, channel_id, "tracked-model"):
+                started.set()
+                await asyncio.sleep(10)
+
+        TIMINGS.append({"model": "tracked-model", "ttft_ms": 500, "total_ms": 20000, "prompt_eval_count": 10,
+                        "prompt_eval_ms": 50, "eval_count": 400, "eval_ms": 19000})
+        first = asyncio.create_task(generate(1, 42, 100))
+        second = asyncio.create_task(generate(2, 42, 100))
+        other = asyncio.create_task(generate(3, 7, 100))
+        await started.wait()
+        assert tracker.active() == 3
+
+        assert tracker.discard(1) and not tracker.discard(1)
+        assert tracker.cancel_where(user_id=42, channel_id=100) == 1
+        for task in (first, second):
+            with pytest.raises(asyncio.CancelledError):
+                await task
+        assert tracker.active() == 1 and not other.done()
+        other.cancel()
+
+        assert CANCELLED.total(reason="deleted") >= 1 and CANCELLED.total(reason="stop") >= 1
+        assert SAVED_SECONDS.total(reason="deleted") >= 19  # 20s expected, cancelled right away
+    asyncio.run(run())
+
+
+def test_timeout_raises_inside_the_block():
+    async def run():
+        tracker = GenerationTracker(timeout=0.05)
+        with pytest.raises(TimeoutError):
+            async with tracker.track([1], 42, 100):
+                await asyncio.sleep(10)
+        assert tracker.active() == 0
+        assert CANCELLED.total(reason="timeout") >= 1
+    asyncio.run(run())
+
+
+class _Bot:
+    """A bot on a slow FakeOllama (~2s per reply)."""
+
+    def __init__(self, tmp_path, window=0):
+        self.tmp_path = tmp_path
+        self.window = window
+
+    async def __aenter__(self):
+        self.fake = FakeOllama(models=("fake-model",), tokens_per_sec=20, ttft=0, tokens=40)
+        url = await self.fake.start()
+        self.client = build_client(url, "fake-model", str(self.tmp_path))
+        self.client.debouncer = Debouncer(self.window)
+        self.driver = FakeDiscord(self.client)
+        return self
+
+    async def __aexit__(self, *exc):
+        self.client.worker_pool.shutdown()
+        await self.fake.stop()
+        await ollama_client.close()
+
+
+def test_deleting_the_message_stops_the_reply(tmp_path):
+    async def run():
+        async with _Bot(tmp_path) as bot:
+            message = bot.driver.message("how do I get better at chess")
+            reply = asyncio.create_task(bot.client.on_message(message))
+            await asyncio.sleep(0.3)
+            assert bot.client.generations.get(message.id) is not None
+
+            await bot.driver.delete_message(message)
+            with pytest.raises(asyncio.CancelledError):
+                await reply
+            assert not message.replies and bot.client.generations.active() == 0
+            await asyncio.sleep(0.1)
+            assert bot.fake.stats()["disconnects"] == 1
+    asyncio.run(run())
+
+
+def test_deleting_one_message_of_a_burst_keeps_the_reply(tmp_path):
+    async def run():
+        async with _Bot(tmp_path, window=0.1) as bot:
+            first = bot.driver.message("how do I get better at chess")
+            second = bot.driver.message("and at go?")
+            replies = [asyncio.create_task(bot.client.on_message(m)) for m in (first, second)]
+            await asyncio.sleep(0.4)
+            assert bot.client.generations.get(second.id) is bot.client.generations.get(first.id) is not None
+
+            await bot.driver.delete_message(second)
+            assert bot.client.generations.active() == 1
+            await asyncio.gather(*replies)
+            assert len(first.replies) == 1 and not second.replies
+
+            third = bot.driver.message("what about checkers")
+            fourth = bot.driver.message("or backgammon")
+            replies = [asyncio.create_task(bot.client.on_message(m)) for m in (third, fourth)]
+            await asyncio.sleep(0.4)
+            await bot.driver.delete_message(third)
+            await bot.driver.delete_message(fourth)
+            await asyncio.gather(*replies, return_exceptions=True)
+            assert not third.replies and not fourth.replies and bot.client.generations.active() == 0
+    asyncio.run(run())
+
+
+def test_deleting_a_queued_message_drops_it(tmp_path):
+    async def run():
+        async with _Bot(tmp_path, window=0.3) as bot:
+            message = bot.driver.message("how do I get better at chess")
+            reply = asyncio.create_task(bot.client.on_message(message))
+            await asyncio.sleep(0.05)
+            await bot.driver.delete_message(message)
+            await reply
+            assert not message.replies and bot.fake.stats()["requests"] == 0
+    asyncio.run(run())
+
+
+def test_stop_command_stops_ask(tmp_path):
+    async def run():
+        async with _Bot(tmp_path) as bot:
+            ask = asyncio.create_task(bot.driver.slash("ask", prompt="write me a long story"))
+            await asyncio.sleep(0.3)
+            stop = await bot.driver.slash("stop")
+            assert stop.followups[0].content == "⏹️ Stopped 1 reply."
+            with pytest.raises(asyncio.CancelledError):
+                await ask
+            thinking = bot.driver.channel().sent[0]
+            assert thinking.edits[-1] == "⏹️ Stopped."
+            await asyncio.sleep(0.1)
+            assert bot.fake.stats()["disconnects"] == 1
+
+            assert (await bot.driver.slash("stop")).followups[0].content == "Nothing to stop."
+    asyncio.run(run())
@@ -0,0 +1,78 @@
+# tests/test_handler_results.py
+import asyncio
+
+import pytest
+
+import deterministic.wildrift_tools  # noqa: F401  (registers the matchup handler)
+from deterministic.registry import try_deterministic_tools, try_deterministic_tools_async
+from deterministic.results import EmbedResult, FileResult, LLMContextResult, TextResult, as_result
+from godbot.discord.handlers import RESULT_SENDERS
+from godbot.testing.fake_discord import FakeChannel, FakeGuild, FakeMessage, FakeUser
+
+
+async def results_probe(text):
+    if not text.startswith("results-probe"):
+        return None
+    await asyncio.sleep(0)  # stands in for a cache or DB lookup
+    if text.endswith("embed"):
+        return EmbedResult("Probe", "an embed", fields=[("a", "1")])
+    return "probe text"
+
+
+class _Memory:
+    def __init__(self):
+        self.saved = []
+
+    def save(self, user_id, role, text):
+        self.saved.append((role, text))
+
+
+class _Client:
+    def __init__(self):
+        self.long_memory = _Memory()
+
+
+def test_as_result():
+    assert as_result(None) is None and as_result("") is None
+    assert as_result("hi") == TextResult("hi")
+    embed = EmbedResult("t")
+    assert as_result(embed) is embed
+    with pytest.raises(TypeError):
+        as_result({"matchup_context": "old style"})
+
+
+def test_async_handlers_are_awaited(register_probe):
+    register_probe(results_probe, priority=2)
+    assert asyncio.run(try_deterministic_tools_async("results-probe")) == TextResult("probe text")
+    result = asyncio.run(try_deterministic_tools_async("results-probe embed"))
+    assert result.kind == "embed" and result.fields == [("a", "1")]
+    # The sync entry point can't await, so it skips async handlers
+    assert try_deterministic_tools("results-probe") is None
+
+
+def test_matchup_handler_returns_llm_context():
+    result = asyncio.run(try_deterministic_tools_async("vi vs garen"))
+    assert isinstance(result, LLMContextResult)
+    assert result.route == "matchup" and "WILD RIFT MATCHUP" in result.prompt
+    assert result.data["primary_champion"] == "Vi"
+
+
+@pytest.mark.parametrize("result", [
+    TextResult("plain"),
+    EmbedResult("Title", "body", fields=[("Protein", "150g")], color=0x00FF00),
+    FileResult("plan.csv", b"day,kcal\n1,2500\n", text="Here's your plan"),
+])
+def test_senders_reply_by_kind(result):
+    client = _Client()
+    channel = FakeChannel(100, guild=FakeGuild())
+    message = FakeMessage("question", FakeUser(42), channel)
+    asyncio.run(RESULT_SENDERS[result.kind](client, message, "42", "question", result))
+
+    reply = message.replies[0]
+    if result.kind == "text":
+        assert reply.content == "plain"
+    elif result.kind == "embed":
+        assert reply.embed.title == "Title" and reply.embed.fields[0].value == "150g"
+    else:
+        assert reply.content == "Here's your plan" and reply.file.filename == "plan.csv"
+    assert client.long_memory.saved == [("user", "question"), ("assistant", result.memory_text)]
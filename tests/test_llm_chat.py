@@ -0,0 +1,48 @@
+# tests/test_llm_chat.py
+import asyncio
+
+import godbot.core.llm as llm
+
+
+def _collect(agen):
+    async def run():
+        return [chunk async for chunk in agen]
+    return asyncio.run(run())
+
+
+def test_stream_chat_normalizes_chunks(monkeypatch):
+    async def fake_chat(messages, model, tools=None, keep_alive=None, base_url=None):
+        yield {"message": {"role": "assistant", "content": "hel"}, "done": False}
+        yield {"message": {"role": "assistant", "content": "lo"}, "done": False}
+        yield {
+            "message": {"role": "assistant", "content": "", "tool_calls": [{"function": {"name": "calc", "arguments": {"x": 1}}}]},
+            "done": True,
+        }
+
+    monkeypatch.setattr(llm, "stream_ollama_chat", fake_chat)
+    chunks = _collect(llm.stream_chat([{"role": "user", "content": "hi"}], "m"))
+    assert "".join(c["response"] for c in chunks) == "hello"
+    assert chunks[-1]["tool_calls"][0]["function"]["name"] == "calc"
+
+
+def test_stream_chat_falls_back_to_generate(monkeypatch):
+    seen = {}
+
+    async def no_chat(messages, model, tools=None, keep_alive=None, base_url=None):
+        yield {"error": "Ollama chat endpoint not available", "status": 404}
+
+    async def fake_generate(prompt, model, tools=None, system=None, context=None, keep_alive=None, base_url=None):
+        seen["prompt"], seen["system"] = prompt, system
+        yield {"response": "ok", "done": True}
+
+    monkeypatch.setattr(llm, "_chat_supported", True)
+    monkeypatch.setattr(llm, "stream_ollama_chat", no_chat)
+    monkeypatch.setattr(llm, "stream_ollama", fake_generate)
+    messages = [{"role": "system", "content": "be brief"}, {"role": "user", "content": "hi"}]
+
+    chunks = _collect(llm.stream_chat(messages, "m"))
+    assert [c["response"] for c in chunks] == ["ok"]
+    assert seen["system"] == "be brief"
+    assert seen["prompt"].startswith("User: hi")
+    # Later calls skip the chat endpoint entirely
+    assert llm._chat_supported is False
@@ -0,0 +1,110 @@
+# tests/test_llm_singleflight.py
+import asyncio
+
+import godbot.core.llm as llm
+
+
+def _fake_generate(calls):
+    async def fake(prompt, model, tools=None, system=None, context=None, keep_alive=None, base_url=None):
+        calls.append(prompt)
+        for part in ("a", "b", "c"):
+            await asyncio.sleep(0.01)
+            yield {"response": part, "done": False}
+        yield {"response": "", "done": True}
+    return fake
+
+
+async def _collect(agen):
+    return [chunk async for chunk in agen]
+
+
+def test_identical_requests_share_one_upstream(monkeypatch):
+    calls = []
+    monkeypatch.setattr(llm, "stream_ollama", _fake_generate(calls))
+
+    async def run():
+        return await asyncio.gather(*(_collect(llm.stream_response("same", "m")) for _ in range(5)))
+
+    results = asyncio.run(run())
+    assert calls == ["same"]
+    for chunks in results:
+        assert "".join(c["response"] for c in chunks) == "abc"
+        assert chunks[-1]["done"]
+    assert llm._IN_FLIGHT == {}
+
+
+def test_late_joiner_replays_earlier_chunks(monkeypatch):
+    calls = []
+    monkeypatch.setattr(llm, "stream_ollama", _fake_generate(calls))
+
+    async def late():
+        await asyncio.sleep(0.015)
+        return await _collect(llm.stream_response("same", "m"))
+
+    async def run():
+        return await asyncio.gather(_collect(llm.stream_response("same", "m")), late())
+
+    first, second = asyncio.run(run())
+    assert len(calls) == 1
+    assert first == second
+
+
+def test_different_requests_are_not_shared(monkeypatch):
+    calls = []
+    monkeypatch.setattr(llm, "stream_ollama", _fake_generate(calls))
+
+    async def run():
+        await asyncio.gather(
+            _collect(llm.stream_response("one", "m")),
+            _collect(llm.stream_response("two", "m")),
+            _collect(llm.stream_response("one", "other-model")),
+        )
+
+    asyncio.run(run())
+    assert sorted(calls) == ["one", "one", "two"]
+
+
+def test_upstream_cancelled_when_all_subscribers_leave(monkeypatch):
+    finished = []
+
+    async def slow(prompt, model, tools=None, system=None, context=None, keep_alive=None, base_url=None):
+        for _ in range(100):
+            await asyncio.sleep(0.01)
+            yield {"response": "x", "done": False}
+        finished.append(True)
+
+    monkeypatch.setattr(llm, "stream_ollama", slow)
+
+    async def run():
+        agen = llm.stream_response("long", "m")
+        await agen.__anext__()
+        await agen.aclose()
+        await asyncio.sleep(0.05)
+
+    asyncio.run(run())
+    assert finished == []
+    assert llm._IN_FLIGHT == {}
+
+
+def test_request_right_after_cancel_starts_a_new_upstream(monkeypatch):
+    calls = []
+    monkeypatch.setattr(llm, "stream_ollama", _fake_generate(calls))
+
+    async def stopped_then_asked_again():
+        try:
+            await _collect(llm.stream_response("same", "m"))
+        except asyncio.CancelledError:
+            pass
+        # Same loop step as the cancel: the upstream's own cleanup hasn't run yet
+        return await _collect(llm.stream_response("same", "m"))
+
+    async def run():
+        task = asyncio.create_task(stopped_then_asked_again())
+        await asyncio.sleep(0.015)
+        task.cancel()  # like /stop
+        return await task
+
+    chunks = asyncio.run(run())
+    assert calls == ["same", "same"]
+    assert "".join(c["response"] for c in chunks) == "abc" and chunks[-1]["done"]
+    assert llm._IN_FLIGHT == {}
@@ -1,5 +1,17 @@
 # tests/test_math_tools.py
-from deterministic.math_tools import handle_percentage, handle_tip
+import time
+
+import pytest
+
+from deterministic.math_tools import (
+    MathError,
+    MathLimitError,
+    compile_expression,
+    eval_math_expression,
+    handle_percentage,
+    handle_simple_math,
+    handle_tip,
+)
 
 def test_percentage():
     r = handle_percentage("what is 20% of 80")
@@ -11,3 +23,48 @@ def test_tip():
     assert r is not None
     assert "14.40" in r.lower() or "14.4" in r.lower()
 
+
+
+def test_simple_math():
+    assert handle_simple_math("what is 2+2") == "2+2 = **4**"
+    assert "1000" in handle_simple_math("calculate 2^10 - 24")
+    assert "19" in handle_simple_math("what's 2x^2 + 1 where x = 3?")
+    assert handle_simple_math("what's 5-3-1 program") is None
+
+
+def test_eval_functions_variables_and_implicit_multiplication():
+    assert eval_math_expression("sqrt(16) + log(8, 2)") == 7
+    assert abs(eval_math_expression("2pi") - 6.283185307179586) < 1e-12
+    assert eval_math_expression("(1+2)(3+4)") == 21
+    assert eval_math_expression("3x y", {"x": 2, "y": 5}) == 30
+    assert abs(eval_math_expression("sin(pi/2)") - 1) < 1e-12
+
+
+def test_eval_rejects_unsafe_input():
+    for expr in ["__import__('os')", "(1).real", "x", "sqrt", "1/0", "2 if 1 else 3"]:
+        with pytest.raises(MathError):
+            eval_math_expression(expr)
+
+
+def test_eval_limits():
+    start = time.perf_counter()
+    for expr in ["9^9^9", "10^101", "exp(1000)", "9" * 120, "1+" * 100 + "1", "round(1, -1e99)", "round(1, 16)"]:
+        with pytest.raises(MathLimitError):
+            eval_math_expression(expr)
+    assert time.perf_counter() - start < 0.5
+    assert "too big" in handle_simple_math("what is 9^9^9")
+    assert eval_math_expression("round(3.14159, 2)") == 3.14
+    assert eval_math_expression("round(1234, -2)") == 1200
+    with pytest.raises(MathError):
+        eval_math_expression("round(1, 1.5)")
+
+    compiled = compile_expression("1+2+3+4")
+    with pytest.raises(MathLimitError):
+        compiled.evaluate(max_ops=2)
+    with pytest.raises(MathLimitError):
+        compiled.evaluate(timeout=-1)
+
+
+def test_compiled_expressions_are_cached():
+    assert compile_expression("2x + 1") is compile_expression("2x + 1")
+    assert compile_expression("2x + 1").names == frozenset({"x"})
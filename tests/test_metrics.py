@@ -0,0 +1,68 @@
+# tests/test_metrics.py
+import pytest
+
+from godbot.core.metrics import Registry
+
+
+def test_counter_and_gauge_render():
+    reg = Registry()
+    c = reg.counter("demo_total", "Demo counter", labels=("route",))
+    c.labels("llm").inc()
+    c.labels("llm").inc(2)
+    c.labels('we"ird').inc()
+    g = reg.gauge("demo_depth", "Demo gauge")
+    g.set_function(lambda: 7)
+
+    text = reg.render()
+    assert "# TYPE demo_total counter" in text
+    assert 'demo_total{route="llm"} 3' in text
+    assert 'demo_total{route="we\\"ird"} 1' in text
+    assert "demo_depth 7" in text
+    assert c.total() == 4 and c.total(route="llm") == 3
+
+
+def test_histogram_buckets_are_cumulative():
+    reg = Registry()
+    h = reg.histogram("demo_seconds", "Demo", buckets=(0.1, 1.0))
+    for v in (0.05, 0.1, 0.5, 3.0):
+        h.observe(v)
+    text = reg.render()
+    assert 'demo_seconds_bucket{le="0.1"} 2' in text
+    assert 'demo_seconds_bucket{le="1.0"} 3' in text
+    assert 'demo_seconds_bucket{le="+Inf"} 4' in text
+    assert "demo_seconds_count 4" in text
+    assert "demo_seconds_sum 3.65" in text
+
+
+def test_get_or_create_and_conflicts():
+    reg = Registry()
+    a = reg.counter("shared_total", labels=("x",))
+    assert reg.counter("shared_total", labels=("x",)) is a
+    with pytest.raises(ValueError):
+        reg.histogram("shared_total")
+    with pytest.raises(ValueError):
+        a.labels("1", "2")
+
+
+def test_hot_paths_are_instrumented(register_probe):
+    import godbot.core.llm  # noqa: F401  (registers the LLM metrics)
+    from deterministic.registry import CALLS, try_deterministic_tools
+    from godbot.core.metrics import REGISTRY
+
+    def metrics_probe(text):
+        return "pong" if text == "metrics-probe" else None
+
+    register_probe(metrics_probe, priority=1)
+    try_deterministic_tools("metrics-probe")
+    try_deterministic_tools("something else")
+    assert CALLS.total(handler="metrics_probe", result="hit") == 1
+    assert CALLS.total(handler="metrics_probe", result="miss") == 1
+    text = REGISTRY.render()
+    for name in ("godbot_llm_ttft_seconds", "godbot_llm_queue_wait_seconds", "godbot_deterministic_calls_total"):
+        assert f"# TYPE {name}" in text
+
+
+def test_probe_handlers_are_unregistered():
+    from deterministic.registry import _handlers
+
+    assert not any(fn.__name__ == "metrics_probe" for _, fn in _handlers)
@@ -0,0 +1,67 @@
+# tests/test_model_catalog.py
+import asyncio
+
+from godbot.core.model_catalog import ModelCatalog
+
+TAGS = [
+    {"name": "llama3:8b", "size": 4_700_000_000, "details": {"family": "llama", "parameter_size": "8B", "quantization_level": "Q4_0"}},
+    {"name": "dolphin-llama3:latest", "size": 4_700_000_000, "details": {"family": "llama"}},
+    {"name": "mistral:7b-instruct", "size": 4_100_000_000, "details": {}},
+    {"name": "qwen2:1.5b", "size": 900_000_000},
+]
+
+
+def _catalog(calls=None, entries=TAGS):
+    async def fetch():
+        if calls is not None:
+            calls.append(1)
+        await asyncio.sleep(0.01)
+        return entries
+    return ModelCatalog(fetch=fetch)
+
+
+def test_search_orders_prefix_before_token_before_substring():
+    catalog = _catalog()
+    asyncio.run(catalog.refresh())
+    assert catalog.search("llama")[:1] == ["llama3:8b"]
+    # "llama3" is also a token of dolphin-llama3
+    assert catalog.search("llama3") == ["llama3:8b", "dolphin-llama3:latest"]
+    assert catalog.search("instr") == ["mistral:7b-instruct"]  # token prefix
+    assert catalog.search("stral") == ["mistral:7b-instruct"]  # substring
+    assert catalog.search("LLAMA3:8") == ["llama3:8b"]
+    assert len(catalog.search("")) == 4
+    assert catalog.search("zzz") == []
+
+
+def test_metadata_is_cached():
+    catalog = _catalog()
+    asyncio.run(catalog.refresh())
+    info = catalog.get("llama3:8b")
+    assert (info.family, info.parameter_size, info.quantization) == ("llama", "8B", "Q4_0")
+    assert info.describe() == "8B Q4_0 llama, 4.4 GB"
+    assert catalog.get("qwen2:1.5b").describe() == "0.8 GB"
+
+
+def test_concurrent_refreshes_share_one_request():
+    calls = []
+    catalog = _catalog(calls)
+
+    async def run():
+        await asyncio.gather(*(catalog.refresh() for _ in range(5)))
+
+    asyncio.run(run())
+    assert calls == [1]
+    assert not catalog.stale
+
+
+def test_failed_refresh_keeps_previous_models():
+    catalog = _catalog()
+    asyncio.run(catalog.refresh())
+
+    async def broken():
+        raise ConnectionError("ollama down")
+
+    catalog.fetch = broken
+    assert asyncio.run(catalog.refresh()) is False
+    assert catalog.last_error == "ollama down"
+    assert len(catalog) == 4
@@ -0,0 +1,79 @@
+# tests/test_model_lifecycle.py
+import asyncio
+import time
+from datetime import datetime
+
+from godbot.core import model_lifecycle
+
+
+class FakeOllama:
+    def __init__(self, resident=()):
+        self.calls = []
+        self.resident = set(resident)
+
+    async def load(self, model, keep_alive):
+        self.calls.append((model, keep_alive))
+        await asyncio.sleep(0.01)
+        if keep_alive == 0:
+            self.resident.discard(model)
+            return {}
+        self.resident.add(model)
+        return {"load_duration": 2_500_000_000}
+
+    async def loaded(self):
+        return [{"name": m} for m in self.resident]
+
+
+def _lifecycle(fake, hour=12, **kwargs):
+    return model_lifecycle.ModelLifecycle(load=fake.load, loaded=fake.loaded, clock=lambda: datetime(2024, 1, 1, hour), **kwargs)
+
+
+def test_parsers():
+    assert model_lifecycle.parse_hours("8-23") == (8, 23)
+    assert model_lifecycle.parse_hours(None) is None
+    assert model_lifecycle.parse_keep_alive_overrides("a:1=1h, b=10m") == {"a:1": "1h", "b": "10m"}
+
+
+def test_keep_alive_policy():
+    fake = FakeOllama()
+    lc = _lifecycle(fake, default_keep_alive="30m", overrides={"big": "5m"},
+                    pinned_model="main", pinned_hours=(8, 23))
+    assert lc.keep_alive_for("main") == -1
+    assert lc.keep_alive_for("big") == "5m"
+    assert lc.keep_alive_for("other") == "30m"
+    night = _lifecycle(fake, hour=2, pinned_model="main", pinned_hours=(8, 23))
+    assert night.keep_alive_for("main") == "30m"
+    wraps = _lifecycle(fake, hour=2, pinned_model="main", pinned_hours=(22, 6))
+    assert wraps.keep_alive_for("main") == -1
+
+
+def test_preload_records_load_time_and_shares_requests():
+    fake = FakeOllama()
+    lc = _lifecycle(fake)
+
+    async def run():
+        return await asyncio.gather(lc.preload("m", reason="switch"), lc.preload("m"))
+
+    assert asyncio.run(run()) == [2.5, 2.5]
+    assert fake.calls == [("m", "30m")]
+    assert lc.events[-1]["action"] == "loaded" and lc.events[-1]["reason"] == "switch"
+
+
+def test_tick_unloads_idle_agent_models_only():
+    fake = FakeOllama(resident={"main", "agent-old", "agent-busy", "unrelated"})
+    lc = _lifecycle(fake, pinned_model="main", agent_idle=60)
+    lc.last_used["agent-old"] = time.time() - 120
+    lc.last_used["agent-busy"] = time.time()
+
+    asyncio.run(lc.tick("main", {"agent-old", "agent-busy", "main"}))
+    assert fake.resident == {"main", "agent-busy", "unrelated"}
+    assert ("agent-old", 0) in fake.calls
+
+
+def test_tick_pins_when_hours_start():
+    fake = FakeOllama()
+    lc = _lifecycle(fake, pinned_model="main", pinned_hours=(8, 23))
+    asyncio.run(lc.tick("main"))
+    assert fake.calls == [("main", -1)]
+    asyncio.run(lc.tick("main"))  # already pinned, nothing to do
+    assert len(fake.calls) == 1
@@ -0,0 +1,25 @@
+# tests/test_personality.py
+from personality import PersonalityManager
+
+
+def test_system_prompt_compiled_once():
+    pm = PersonalityManager()
+    assert pm.get_system_prompt() is pm.get_system_prompt()
+    assert "Context: raid night" in pm.get_system_prompt("raid night")
+
+
+def test_agent_prefix_is_byte_identical():
+    pm = PersonalityManager()
+    a = pm.get_agent_system_prompt(behaviors=["Be nice."])
+    b = pm.get_agent_system_prompt(behaviors=["Be nice."])
+    assert a is b
+    assert a.startswith("Be nice.")
+    assert "CRITICAL INSTRUCTIONS" in a
+
+
+def test_version_changes_with_personality():
+    pm = PersonalityManager()
+    before = pm.version
+    pm.bot_name = "Other Bot"
+    assert pm.version != before
+    assert "Other Bot" in pm.get_chat_system_prompt()
@@ -0,0 +1,80 @@
+# tests/test_postprocess.py
+import random
+
+import pytest
+
+from godbot.core.postprocess import PostProcessor
+from personality import PersonalityManager
+
+CLEANER = PostProcessor("God Bot")
+
+
+@pytest.mark.parametrize("raw, expected", [
+    ("Reply: hey what's up", "hey what's up"),
+    ("God Bot: Assistant: sure", "sure"),
+    ('"just a quoted reply"', "just a quoted reply"),
+    ("'Response: wrapped'", "wrapped"),
+    ('"Hi," she said', '"Hi," she said'),
+    ("As a Dolphin, I love the ocean.", "I love the ocean."),
+    ("My name is Dolphin and I'm Dolphin.", "My name is God Bot and I'm God Bot."),
+    ("Sure thing. As an AI, I can't taste food. Pizza rocks!", "Sure thing. Pizza rocks!"),
+    ("Bench more. Have a great day!", "Bench more."),
+    ("Here you go:\n- user: hi\n* God Bot: hello\nassistant: yo\nhi = hello\nDone.", "Here you go:\nDone."),
+    ("**Step 1:** preheat the oven.\n* Garen: tanky\n- Note: it's hot", "**Step 1:** preheat the oven.\n* Garen: tanky\n- Note: it's hot"),
+    ("one\n\n\n\ntwo", "one\n\ntwo"),
+    ("a  lot   of\tspace", "a lot of space"),
+    ("/\\ ok", "ok"),
+    ("Code:\n```py\n  x = 1\n  # As a Dolphin,\n```\nAs an AI, bye.", "Code:\n```py\n  x = 1\n  # As a Dolphin,\n```"),
+])
+def test_process(raw, expected):
+    assert CLEANER.process(raw) == expected
+
+
+def test_boilerplate_only_reply_is_empty():
+    assert CLEANER.process("Assistant: How can I help you today?") == ""
+
+
+def test_bot_name_is_configurable():
+    assert PostProcessor("Zeus").process("I am Dolphin") == "I am Zeus"
+    assert PostProcessor("Zeus").process("ok\n- Zeus: hi\nbye") == "ok\nbye"
+
+
+def _streamed(text, size):
+    stream = CLEANER.stream()
+    shown = "".join(stream.feed(text[i:i + size]) for i in range(0, len(text), size))
+    return (shown + stream.finish()).strip()
+
+
+_PIECES = [
+    "Reply: ", "God Bot: ", '"', "'", "hey there. ", "As a Dolphin, I rock! ", "I'm Dolphin. ",
+    "as an AI I cannot. ", "Have a great day! ", "How can I help you today? ", "\n", "\n\n\n",
+    "- user: hi\n", "  assistant: yo\n", "* Garen: tanky\n", "**Step 1:** ", "hi = hello\n", "```py\n  x = 1\n```\n", "sure thing ", "ok",
+    "  ", "\t", "/\\ ", "What? ", "I'm an AI, sorry.\n", "a" * 40 + ". ",
+]
+
+
+def test_stream_matches_process():
+    rng = random.Random(5)
+    for _ in range(2000):
+        text = "".join(rng.choice(_PIECES) for _ in range(rng.randint(1, 8)))
+        expected = CLEANER.process(text)
+        for size in (1, 3, 8):
+            assert _streamed(text, size) == expected, (text, size)
+
+
+def test_stream_releases_text_early():
+    stream = CLEANER.stream()
+    assert stream.feed("Reply: ") == ""
+    shown = stream.feed("Push ups work your chest. Squats work your legs. As an AI, I ")
+    assert shown == "Push ups work your chest. Squats work your legs."
+    shown += stream.feed("can't lift. Rest is")
+    assert shown == "Push ups work your chest. Squats work your legs."
+    shown += stream.finish(" key.")
+    assert shown == "Push ups work your chest. Squats work your legs. Rest is key."
+
+
+def test_enhance_response_uses_the_pipeline():
+    personality = PersonalityManager()
+    assert personality.postprocessor is personality.postprocessor
+    assert personality.enhance_response("Assistant: I'm Dolphin. As an AI, I sleep.") == "I'm God Bot."
+    assert personality.enhance_response("Have a nice day!") in ("Hey", "Hi", "What's up", "Yo")
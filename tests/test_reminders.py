@@ -0,0 +1,135 @@
+# tests/test_reminders.py
+import asyncio
+import time
+
+from godbot.core.reminders import ReminderService, ReminderStore
+
+
+def _service(tmp_path, sent):
+    async def send(reminder):
+        sent.append((reminder.id, reminder.message))
+
+    return ReminderService(ReminderStore(str(tmp_path / "reminders.db")), send)
+
+
+async def _run_for(service, seconds):
+    loop = asyncio.create_task(service.run())
+    await asyncio.sleep(seconds)
+    service.stop()
+    await loop
+
+
+def test_reminders_fire_in_due_order(tmp_path):
+    sent = []
+    service = _service(tmp_path, sent)
+
+    async def run():
+        loop = asyncio.create_task(service.run())
+        service.add(1, 10, "second", 0.1)
+        service.add(1, 10, "first", 0.05)
+        service.add(1, 10, "later", 60)
+        await asyncio.sleep(0.2)
+        service.stop()
+        await loop
+
+    asyncio.run(run())
+    assert [m for _, m in sent] == ["first", "second"]
+    # Fired one-shots are removed, the future one is still stored
+    assert [r.message for r in service.store.pending()] == ["later"]
+
+
+def test_pending_reminders_reload_after_restart(tmp_path):
+    store = ReminderStore(str(tmp_path / "reminders.db"))
+    store.add(1, 10, "overdue", time.time() - 5)
+    store.add(1, 10, "future", time.time() + 60)
+
+    sent = []
+    service = _service(tmp_path, sent)
+    asyncio.run(_run_for(service, 0.05))
+    assert [m for _, m in sent] == ["overdue"]
+
+
+def test_cancel_only_own_reminders(tmp_path):
+    sent = []
+    service = _service(tmp_path, sent)
+
+    async def run():
+        loop = asyncio.create_task(service.run())
+        mine = service.add(1, 10, "mine", 0.05)
+        assert not service.cancel(mine.id, user_id=2)
+        assert service.cancel(mine.id, user_id=1)
+        await asyncio.sleep(0.1)
+        service.stop()
+        await loop
+
+    asyncio.run(run())
+    assert sent == []
+    assert service.list_for(1) == []
+
+
+def test_recurring_reminder_is_rescheduled(tmp_path):
+    sent = []
+    service = _service(tmp_path, sent)
+
+    async def run():
+        # Added before run() loads the store: still one heap entry
+        service.add(1, 10, "tick", 0.02, repeat=0.1)
+        loop = asyncio.create_task(service.run())
+        await asyncio.sleep(0.27)  # due at 0.02, 0.12 and 0.22
+        service.stop()
+        await loop
+
+    asyncio.run(run())
+    assert len(sent) == 3
+    assert len(service) == 1 and len(service._heap) == 1
+    [stored] = service.list_for(1)
+    assert stored.repeat == 0.1 and stored.due > time.time() - 0.1
+
+
+def test_slow_send_does_not_hold_up_other_reminders(tmp_path):
+    sent = []
+
+    async def run():
+        async def send(reminder):
+            if reminder.message == "slow":
+                await asyncio.sleep(10)
+            sent.append(reminder.message)
+
+        service = ReminderService(ReminderStore(str(tmp_path / "reminders.db")), send, send_timeout=0.2)
+        loop = asyncio.create_task(service.run())
+        service.add(1, 10, "slow", 0.01)
+        service.add(1, 10, "fast", 0.02)
+        await asyncio.sleep(0.1)
+        assert sent == ["fast"]
+        await asyncio.sleep(0.2)  # the slow one timed out and was removed
+        service.stop()
+        await loop
+        assert service.store.pending() == []
+
+    asyncio.run(run())
+
+
+def test_cancel_while_sending_keeps_the_count_right(tmp_path):
+    async def run():
+        started, release = asyncio.Event(), asyncio.Event()
+
+        async def send(reminder):
+            started.set()
+            await release.wait()
+
+        service = ReminderService(ReminderStore(str(tmp_path / "reminders.db")), send)
+        loop = asyncio.create_task(service.run())
+        once = service.add(1, 10, "once", 0.01)
+        tick = service.add(1, 10, "tick", 0.01, repeat=0.05)
+        service.add(1, 10, "later", 60)
+        await started.wait()
+        # Both came due; the first is being sent, the other is still queued
+        assert service.cancel(once.id) and service.cancel(tick.id)
+        release.set()
+        await asyncio.sleep(0.1)
+        service.stop()
+        await loop
+        assert len(service) == 1 and not service._cancelled
+        assert [r.message for r in service.store.pending()] == ["later"]
+
+    asyncio.run(run())
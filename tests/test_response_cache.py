@@ -0,0 +1,56 @@
+# tests/test_response_cache.py
+import asyncio
+import time
+
+import godbot.core.llm as llm
+from godbot.core.response_cache import ResponseCache, normalize_prompt
+
+
+def test_normalize_prompt():
+    assert normalize_prompt("  What's   UP?! ") == "<greeting>"
+    assert normalize_prompt("Hey") == normalize_prompt("hello")
+    assert normalize_prompt("Garen vs Darius?") == "garen vs darius"
+
+
+def test_lru_and_ttl():
+    cache = ResponseCache(max_entries=2, ttl=0.05)
+    cache.put("a", "A")
+    cache.put("b", "B")
+    cache.get("a")
+    cache.put("c", "C")
+    assert cache.get("b") is None
+    assert cache.get("a") == "A"
+    time.sleep(0.06)
+    assert cache.get("a") is None
+
+
+def test_sqlite_backing_survives_restart(tmp_path):
+    db = str(tmp_path / "cache.db")
+    key = ResponseCache.make_key("greeting", "hi", "m", "v1")
+    ResponseCache(db_path=db).put(key, "hey")
+    assert ResponseCache(db_path=db).get(key) == "hey"
+    # Model and personality version are part of the key
+    assert key != ResponseCache.make_key("greeting", "hi", "m", "v2")
+
+
+def test_cached_stream_response(monkeypatch):
+    calls = []
+
+    async def fake_stream(prompt, model, tools=None, system=None, context=None, keep_alive=None, base_url=None):
+        calls.append(prompt)
+        yield {"response": "yo", "done": True}
+
+    monkeypatch.setattr(llm, "stream_ollama", fake_stream)
+    cache = ResponseCache(routes=["greeting"])
+
+    async def ask(text, route="greeting"):
+        return [c async for c in llm.cached_stream_response(cache, route, f"Reply to {text}", "m", cache_key=text)]
+
+    first = asyncio.run(ask("hi"))
+    second = asyncio.run(ask("Hey!"))
+    assert first[-1]["response"] == second[-1]["response"] == "yo"
+    assert second[-1]["cached"] is True
+    assert len(calls) == 1
+    # Routes that are not opted in always go to the model
+    asyncio.run(ask("hi", route="freeform"))
+    assert len(calls) == 2
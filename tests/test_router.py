@@ -0,0 +1,207 @@
+# tests/test_router.py
+import asyncio
+import json
+import socket
+
+from aiohttp import web
+from aiohttp.test_utils import TestServer
+
+import ollama_client
+from godbot.core import llm
+from godbot.core.router import BACKEND_REQUESTS, OllamaRouter
+
+
+class StandIn:
+    """Minimal local Ollama: /api/tags, /api/ps and streaming /api/generate."""
+
+    def __init__(self, name, models):
+        self.name = name
+        self.models = models
+        self.requests = []
+        self.hold = None  # asyncio.Event: generations wait for it before finishing
+        self.drop = False  # cut the connection instead of finishing
+        self.reject = None  # HTTP status to answer generations with
+        app = web.Application()
+        app.router.add_get("/api/tags", self.tags)
+        app.router.add_get("/api/ps", self.ps)
+        app.router.add_post("/api/generate", self.generate)
+        self.server = TestServer(app)
+
+    @property
+    def url(self):
+        return str(self.server.make_url("")).rstrip("/")
+
+    async def tags(self, request):
+        return web.json_response({"models": [{"name": m} for m in self.models]})
+
+    async def ps(self, request):
+        return web.json_response({"models": []})
+
+    async def generate(self, request):
+        body = await request.json()
+        self.requests.append(body["prompt"])
+        if body["model"] not in self.models:
+            return web.json_response({"error": f"model '{body['model']}' not found"}, status=404)
+        if self.reject:
+            return web.json_response({"error": "bad request"}, status=self.reject)
+        resp = web.StreamResponse()
+        await resp.prepare(request)
+        await resp.write(json.dumps({"response": f"{self.name}:", "done": False}).encode() + b"\n")
+        if self.hold is not None:
+            await self.hold.wait()
+        if self.drop:
+            request.transport.close()
+            return resp
+        await resp.write(json.dumps({"response": body["prompt"], "done": True}).encode() + b"\n")
+        return resp
+
+
+def _dead_url():
+    with socket.socket() as s:
+        s.bind(("127.0.0.1", 0))
+        return f"http://127.0.0.1:{s.getsockname()[1]}"
+
+
+async def _collect(router, prompt, model="m"):
+    text = ""
+    async for chunk in router.stream(model, lambda url: ollama_client.stream_ollama(prompt, model, base_url=url)):
+        text += chunk.get("response", "") or chunk.get("error", "")
+    return text
+
+
+def _run(servers, check):
+    async def run():
+        for s in servers:
+            await s.server.start_server()
+        try:
+            await check()
+        finally:
+            for s in servers:
+                await s.server.close()
+            await ollama_client.close()
+    asyncio.run(run())
+
+
+def test_least_outstanding_spreads_concurrent_requests():
+    a, b = StandIn("a", ["m"]), StandIn("b", ["m"])
+
+    async def check():
+        router = OllamaRouter([a.url, b.url])
+        a.hold = b.hold = asyncio.Event()
+        tasks = [asyncio.create_task(_collect(router, f"p{i}")) for i in range(4)]
+        await asyncio.sleep(0.2)
+        assert [x.outstanding for x in router.backends] == [2, 2]
+        a.hold.set()
+        results = await asyncio.gather(*tasks)
+        assert sorted(r.split(":")[0] for r in results) == ["a", "a", "b", "b"]
+
+    _run([a, b], check)
+
+
+def test_routes_only_to_backends_with_the_model():
+    a, b = StandIn("a", ["small"]), StandIn("b", ["big"])
+
+    async def check():
+        router = OllamaRouter([a.url, b.url])
+        assert await router.check_all() == 2
+        assert await _collect(router, "x", model="big") == "b:x"
+        assert await _collect(router, "y", model="small") == "a:y"
+        assert "No Ollama backend" in await _collect(router, "z", model="missing")
+        assert sorted(m["name"] for m in await router.list_models()) == ["big", "small"]
+
+    _run([a, b], check)
+
+
+def test_unknown_model_fails_over_to_a_backend_that_has_it():
+    a, b = StandIn("a", []), StandIn("b", ["m"])
+
+    async def check():
+        router = OllamaRouter([a.url, b.url])  # not health-checked yet
+        assert await _collect(router, "x") == "b:x"
+        assert router.backends[0].healthy
+
+    _run([a, b], check)
+
+
+def test_passed_through_error_is_not_counted_ok():
+    a = StandIn("a", ["m"])
+
+    async def check():
+        router = OllamaRouter([a.url])
+        a.reject = 400
+        assert "400" in await _collect(router, "x")
+        assert BACKEND_REQUESTS.total(backend=a.url, result="error") == 1
+        assert BACKEND_REQUESTS.total(backend=a.url, result="ok") == 0
+        assert not router.backends[0].is_loaded("m")
+
+    _run([a], check)
+
+
+def test_backend_whose_breaker_refuses_is_skipped():
+    a, b = StandIn("a", ["m"]), StandIn("b", ["m"])
+
+    async def check():
+        router = OllamaRouter([a.url, b.url])
+        # a is picked first, but its half-open probe slot was just taken
+        router.backends[0].breaker.allow = lambda: False
+        assert await _collect(router, "x") == "b:x"
+        assert a.requests == []
+
+    _run([a, b], check)
+
+
+def test_fails_over_from_an_unreachable_host():
+    b = StandIn("b", ["m"])
+
+    async def check():
+        router = OllamaRouter([_dead_url(), b.url], failure_threshold=1)
+        assert await _collect(router, "x") == "b:x"
+        dead = router.backends[0]
+        assert not dead.healthy and dead.failures == 1
+        # Marked down: the next request goes straight to b
+        assert await _collect(router, "y") == "b:y"
+        assert dead.failures == 1
+        assert await router.check_all() == 1
+
+    _run([b], check)
+
+
+def test_queued_request_moves_when_its_backend_goes_down():
+    a, b = StandIn("a", ["m"]), StandIn("b", ["m"])
+
+    async def check():
+        router = OllamaRouter([a.url, b.url], max_concurrency=1, failure_threshold=1)
+        a.hold, b.hold = asyncio.Event(), asyncio.Event()
+        first = asyncio.create_task(_collect(router, "1"))  # a
+        second = asyncio.create_task(_collect(router, "2"))  # b
+        await asyncio.sleep(0.2)
+        third = asyncio.create_task(_collect(router, "3"))  # queued behind first on a
+        await asyncio.sleep(0.1)
+        assert router.backends[0].outstanding == 2
+
+        a.drop = True
+        a.hold.set()  # first loses its connection mid-stream
+        assert "Lost connection" in await first
+        assert not router.backends[0].healthy
+        b.hold.set()
+        assert await second == "b:2"
+        assert await third == "b:3"
+        assert a.requests == ["1"]
+
+    _run([a, b], check)
+
+
+def test_llm_stream_response_goes_through_the_router():
+    a = StandIn("a", ["m"])
+
+    async def check():
+        llm.set_router(OllamaRouter([_dead_url(), a.url]))
+        try:
+            text = ""
+            async for chunk in llm.stream_response("routed", "m"):
+                text += chunk.get("response", "")
+            assert text == "a:routed"
+        finally:
+            llm.set_router(None)
+
+    _run([a], check)
@@ -0,0 +1,96 @@
+# tests/test_scheduler.py
+import asyncio
+from datetime import datetime
+
+import pytest
+
+from godbot.core.cron import CronError, CronExpr
+from godbot.core.scheduler import Scheduler
+
+
+def _ts(*args):
+    return datetime(*args).timestamp()
+
+
+def test_cron_next_after():
+    assert CronExpr("*/15 * * * *").next_after(_ts(2024, 1, 1, 10, 7)) == _ts(2024, 1, 1, 10, 15)
+    assert CronExpr("0 9 * * *").next_after(_ts(2024, 1, 1, 9, 0)) == _ts(2024, 1, 2, 9, 0)
+    # 2024-01-06 is a Saturday; next weekday 08:30 is Monday
+    assert CronExpr("30 8 * * 1-5").next_after(_ts(2024, 1, 6, 12, 0)) == _ts(2024, 1, 8, 8, 30)
+    assert CronExpr("@monthly").next_after(_ts(2024, 1, 15)) == _ts(2024, 2, 1)
+
+
+def test_cron_rejects_bad_expressions():
+    for expr in ("* * *", "61 * * * *", "*/0 * * * *", "a b c d e"):
+        with pytest.raises(CronError):
+            CronExpr(expr)
+
+
+async def _run_for(scheduler, seconds):
+    loop = asyncio.create_task(scheduler.start())
+    await asyncio.sleep(seconds)
+    scheduler.stop()
+    await loop
+
+
+def _slow_task(calls, duration):
+    async def task(bot):
+        calls.append(1)
+        await asyncio.sleep(duration)
+    return task
+
+
+def test_overlap_skip():
+    calls = []
+    sched = Scheduler(bot=None)
+    task = sched.add("slow", 0.05, _slow_task(calls, 0.3))
+    asyncio.run(_run_for(sched, 0.28))
+    assert len(calls) == 1
+    assert task.skipped >= 3
+
+
+def test_overlap_allow():
+    calls = []
+    sched = Scheduler(bot=None)
+    sched.add("slow", 0.05, _slow_task(calls, 0.3), overlap="allow")
+    asyncio.run(_run_for(sched, 0.28))
+    assert len(calls) >= 4
+
+
+def test_overlap_queue_runs_once_after_current():
+    calls = []
+    sched = Scheduler(bot=None)
+
+    async def run():
+        sched.add("slow", 0.05, _slow_task(calls, 0.15), overlap="queue")
+        await _run_for(sched, 0.12)
+        await asyncio.sleep(0.2)
+
+    asyncio.run(run())
+    assert len(calls) == 2
+
+
+def test_stats_and_disable():
+    sched = Scheduler(bot=None)
+
+    async def boom(bot):
+        raise RuntimeError("nope")
+
+    task = sched.add("boom", 0.05, boom)
+
+    async def run():
+        loop = asyncio.create_task(sched.start())
+        await asyncio.sleep(0.12)
+        sched.disable("boom")
+        runs = task.runs
+        await asyncio.sleep(0.12)
+        sched.stop()
+        await loop
+        return runs
+
+    runs = asyncio.run(run())
+    assert runs >= 2
+    assert task.runs == runs
+    assert task.failures == task.runs
+    assert task.last_error == "RuntimeError: nope"
+    assert "last error" in task.describe()
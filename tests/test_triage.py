@@ -0,0 +1,132 @@
+# tests/test_triage.py
+import asyncio
+import json
+
+import pytest
+
+import ollama_client
+from godbot.core.triage import DECISIONS, Triage, score
+from godbot.testing import FakeDiscord, FakeOllama
+from godbot.testing.bench import build_client
+
+
+class _Clock:
+    def __init__(self):
+        self.now = 1000.0
+
+    def __call__(self):
+        return self.now
+
+
+@pytest.mark.parametrize("text", [
+    "lol", "haha same", "gg", "ok", "nice", "brb getting food", "https://example.com/cat.png",
+    "<@123> you coming tonight",
+])
+def test_chatter_scores_low(text):
+    assert score(text) < 0.5
+
+
+@pytest.mark.parametrize("text", [
+    "how do I center a div?",
+    "what's a good high protein breakfast",
+    "explain compound interest like I'm five",
+    "godbot who wins vi vs garen",
+    "anyone know a good budget keyboard?",
+    "can you convert 5 miles to km",
+])
+def test_questions_score_high(text):
+    assert score(text) >= 0.5
+
+
+def test_addressed_messages_always_get_the_llm():
+    triage = Triage("mention")
+    assert triage.decide("lol", 1, dm=True).reason == "dm"
+    assert triage.decide("lol", 1, mentioned=True).llm
+    assert triage.decide("ok", 1, reply_to_bot=True).reason == "reply"
+    # ...everything else is ignored in mention mode, tools included
+    decision = triage.decide("what is 2+2", 1)
+    assert not decision.llm and not decision.tools
+
+
+def test_smart_mode_leaves_chatter_to_the_tools():
+    triage = Triage("smart")
+    chatter = triage.decide("haha same", 1)
+    assert not chatter.llm and chatter.tools and chatter.reason == "classifier"
+    question = triage.decide("how do I get better at last hitting?", 1)
+    assert question.llm and question.reason == "question"
+    assert triage.avoided_ratio() == 0.5
+    assert DECISIONS.total(decision="tools", reason="classifier") >= 1
+
+
+def test_all_mode_answers_everything():
+    triage = Triage("all")
+    decision = triage.decide("lol", 1)
+    assert decision.llm and decision.reason == "freeform" and decision.score is None
+
+
+def test_token_budget_runs_out_and_refills():
+    clock = _Clock()
+    triage = Triage("all", tokens_per_hour=3600, clock=clock)
+    triage.charge(1, 4000)
+    assert triage.budget_left(1) == -400
+    decision = triage.decide("so what do we think", 1)
+    assert not decision.llm and decision.tools and decision.reason == "budget"
+    # Budgets are per channel, and mentions bypass them
+    assert triage.decide("so what do we think", 2).llm
+    assert triage.decide("so what do we think", 1, mentioned=True).llm
+
+    clock.now += 600  # refills at 1 token/s
+    assert triage.budget_left(1) == 200
+    assert triage.decide("so what do we think", 1).llm
+    clock.now += 36000
+    assert triage.budget_left(1) == 3600  # capped at one hour's worth
+
+
+def test_zero_budget_means_unlimited():
+    triage = Triage("all", tokens_per_hour=0)
+    triage.charge(1, 10 ** 9)
+    assert triage.budget_left(1) is None
+    assert triage.decide("hmm", 1).llm
+
+
+def test_modes_persist(tmp_path):
+    path = str(tmp_path / "triage.json")
+    triage = Triage("smart", path=path)
+    triage.set_mode(5, "mention")
+    triage.set_mode(6, "all")
+    triage.set_mode(6, None)
+    with pytest.raises(ValueError):
+        triage.set_mode(7, "loud")
+
+    assert json.load(open(path)) == {"5": "mention"}
+    reloaded = Triage("smart", path=path)
+    assert reloaded.mode(5) == "mention" and reloaded.mode(6) == "smart"
+
+
+def test_on_message_triage(tmp_path):
+    async def run():
+        fake = FakeOllama(models=("fake-model",), tokens_per_sec=2000, ttft=0, tokens=5)
+        url = await fake.start()
+        client = build_client(url, "fake-model", str(tmp_path))
+        client.triage = Triage("smart", tokens_per_hour=1000)
+        driver = FakeDiscord(client)
+        try:
+            chatter = await driver.send_message("haha same")
+            assert not chatter.replies and driver.channel().typing_count == 0
+            # Tools answer before the LLM is asked
+            math = await driver.send_message("calculate 12*(3+4)")
+            assert math.replies and "84" in math.replies[0].content
+            assert fake.stats()["requests"] == 0
+
+            question = await driver.send_message("how do I get better at chess?")
+            assert question.replies and fake.stats()["requests"] == 1
+            assert client.triage.budget_left(100) < 1000
+
+            await driver.send_message("ok", channel_id=200)
+            stats = client.triage.stats()
+            assert (stats["llm"], stats["tools"]) == (2, 2)
+        finally:
+            client.worker_pool.shutdown()
+            await fake.stop()
+            await ollama_client.close()
+    asyncio.run(run())
@@ -0,0 +1,125 @@
+# tests/test_worker_pool.py
+import asyncio
+import os
+import time
+
+import pytest
+
+from deterministic.registry import TIMEOUT_REPLY, try_deterministic_tools, try_deterministic_tools_async
+from deterministic.results import TextResult
+from godbot.core.worker_pool import JOBS, JobTimeout, PoolFull, WorkerPool
+
+
+def _pid_plus(x):
+    return os.getpid(), x + 1
+
+
+def _sleep(seconds):
+    time.sleep(seconds)
+    return seconds
+
+
+def _touch(path):
+    open(path, "w").close()
+
+
+def _fail():
+    raise ValueError("boom")
+
+
+def pool_probe(text):
+    if "pool-probe" not in text:
+        return None
+    if "slow" in text:
+        time.sleep(10)
+    return f"pid {os.getpid()}"
+
+
+def test_runs_in_another_process():
+    async def run():
+        pool = WorkerPool("test-basic", max_workers=1)
+        try:
+            pid, value = await pool.run(_pid_plus, 41)
+            assert value == 42 and pid != os.getpid()
+            with pytest.raises(ValueError):
+                await pool.run(_fail)
+            assert JOBS.total(pool="test-basic", result="ok") == 1
+            assert JOBS.total(pool="test-basic", result="error") == 1
+        finally:
+            pool.shutdown()
+    asyncio.run(run())
+
+
+def test_timeout_restarts_the_workers():
+    async def run():
+        pool = WorkerPool("test-timeout", max_workers=1, timeout=0.5)
+        try:
+            start = time.perf_counter()
+            with pytest.raises(JobTimeout):
+                await pool.run(_sleep, 30)
+            assert time.perf_counter() - start < 5
+            assert pool.restarts == 1
+            assert (await pool.run(_pid_plus, 1))[1] == 2
+        finally:
+            pool.shutdown()
+    asyncio.run(run())
+
+
+def test_bounded_queue_and_cancellation(tmp_path):
+    async def run():
+        pool = WorkerPool("test-bounded", max_workers=1, max_queue=1, timeout=10)
+        try:
+            await pool.run(_pid_plus, 0)  # start the worker
+            busy = asyncio.create_task(pool.run(_sleep, 0.5))
+            marker = tmp_path / "ran"
+            queued = asyncio.create_task(pool.run(_touch, str(marker)))
+            await asyncio.sleep(0.1)
+            assert pool.status()["queued"] == 1
+            with pytest.raises(PoolFull):
+                await pool.run(_pid_plus, 0)
+
+            queued.cancel()
+            with pytest.raises(asyncio.CancelledError):
+                await queued
+            assert await busy == 0.5
+            await pool.run(_pid_plus, 0)
+            assert not marker.exists()
+            assert JOBS.total(pool="test-bounded", result="cancelled") == 1
+        finally:
+            pool.shutdown()
+    asyncio.run(run())
+
+
+def test_cancelling_a_running_job_raises_cancelled():
+    async def run():
+        pool = WorkerPool("test-cancel-running", max_workers=1, timeout=10)
+        try:
+            await pool.run(_pid_plus, 0)  # start the worker
+            running = asyncio.create_task(pool.run(_sleep, 0.3))
+            await asyncio.sleep(0.1)
+            running.cancel()
+            with pytest.raises(asyncio.CancelledError):
+                await running
+            assert pool.restarts == 0
+            assert JOBS.total(pool="test-cancel-running", result="cancelled") == 1
+        finally:
+            pool.shutdown()
+    asyncio.run(run())
+
+
+def test_cpu_bound_handlers_run_in_the_pool(register_probe):
+    register_probe(pool_probe, priority=1, cpu_bound=True, trigger=("pool-probe",))
+    async def run():
+        pool = WorkerPool("test-registry", max_workers=1, timeout=1)
+        try:
+            assert await try_deterministic_tools_async("pool-probe", pool) != TextResult(f"pid {os.getpid()}")
+            assert await try_deterministic_tools_async("pool-probe slow", pool) == TextResult(TIMEOUT_REPLY)
+            # Messages without a trigger keyword never reach the pool
+            assert await try_deterministic_tools_async("hello there", pool) is None
+            assert JOBS.total(pool="test-registry") == 2
+            # Without a pool everything runs inline
+            assert await try_deterministic_tools_async("pool-probe", None) == TextResult(f"pid {os.getpid()}")
+        finally:
+            pool.shutdown()
+    asyncio.run(run())
+    assert try_deterministic_tools("pool-probe") == f"pid {os.getpid()}"